@@ -0,0 +1,61 @@
+"""The configuration of the benchmark run.
+
+The benchmarks never call Earth Engine: every object is built with ``gee=False`` from synthetic data generated locally so that the suite runs offline and the results only depend on the lib.
+"""
+
+from pathlib import Path
+
+import geopandas as gpd
+import pytest
+from shapely import geometry as sg
+
+# -- synthetic data ------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def vector_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a vector file with a grid of 2500 squares.
+
+    Returns:
+        the path to the geopackage
+    """
+    squares = [sg.box(x, y, x + 0.1, y + 0.1) for x in range(50) for y in range(50)]
+    gdf = gpd.GeoDataFrame(
+        {"id": range(len(squares)), "group": [i % 10 for i in range(len(squares))]},
+        geometry=squares,
+        crs="EPSG:4326",
+    )
+    file = tmp_path_factory.mktemp("vector") / "grid.gpkg"
+    gdf.to_file(file, engine="pyogrio")
+
+    return file
+
+
+@pytest.fixture(scope="session")
+def points_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a csv file with 100 000 points.
+
+    Returns:
+        the path to the csv file
+    """
+    lines = ["id,lat,lng"] + [f"{i},{(i % 180) - 90},{(i % 360) - 180}" for i in range(100_000)]
+    file = tmp_path_factory.mktemp("points") / "points.csv"
+    file.write_text("\n".join(lines))
+
+    return file
+
+
+@pytest.fixture(scope="session")
+def large_folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a folder with 10 000 empty files and 100 sub folders.
+
+    Returns:
+        the path to the folder
+    """
+    folder = tmp_path_factory.mktemp("files")
+    for i in range(100):
+        (folder / f"folder_{i}").mkdir()
+    for i in range(10_000):
+        (folder / f"file_{i}.{'tif' if i % 2 else 'csv'}").touch()
+
+    return folder
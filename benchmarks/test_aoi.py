@@ -0,0 +1,63 @@
+"""Benchmark the creation of AOIs from local files."""
+
+from pathlib import Path
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pysepal import aoi
+
+
+def test_from_vector(benchmark: BenchmarkFixture, vector_file: Path) -> None:
+    """Read a complete vector file.
+
+    Args:
+        benchmark: the benchmark fixture
+        vector_file: the path to the synthetic vector file
+    """
+    model = aoi.AoiModel(gee=False)
+    vector = {"pathname": vector_file, "column": "ALL", "value": None}
+    benchmark(model._from_vector, vector)
+
+    return
+
+
+def test_from_vector_filtered(benchmark: BenchmarkFixture, vector_file: Path) -> None:
+    """Read the features of a vector file matching a value.
+
+    Args:
+        benchmark: the benchmark fixture
+        vector_file: the path to the synthetic vector file
+    """
+    model = aoi.AoiModel(gee=False)
+    vector = {"pathname": vector_file, "column": "group", "value": 3}
+    benchmark(model._from_vector, vector)
+
+    return
+
+
+def test_from_points(benchmark: BenchmarkFixture, points_file: Path) -> None:
+    """Read a csv file of points.
+
+    Args:
+        benchmark: the benchmark fixture
+        points_file: the path to the synthetic csv file
+    """
+    model = aoi.AoiModel(gee=False)
+    points = {"pathname": points_file, "id_column": "id", "lat_column": "lat", "lng_column": "lng"}
+    benchmark(model._from_points, points)
+
+    return
+
+
+def test_get_ipygeojson(benchmark: BenchmarkFixture, vector_file: Path) -> None:
+    """Convert a vector AOI into a map layer.
+
+    Args:
+        benchmark: the benchmark fixture
+        vector_file: the path to the synthetic vector file
+    """
+    model = aoi.AoiModel(gee=False)
+    model._from_vector({"pathname": vector_file, "column": "ALL", "value": None})
+    benchmark(model.get_ipygeojson)
+
+    return
@@ -0,0 +1,22 @@
+"""Benchmark the listing of the local files."""
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pysepal.sepalwidgets.file_input import get_local_files
+
+
+@pytest.mark.parametrize("extensions", [[], [".tif"]])
+def test_get_local_files(benchmark: BenchmarkFixture, large_folder: Path, extensions: list) -> None:
+    """List a folder containing thousands of files.
+
+    Args:
+        benchmark: the benchmark fixture
+        large_folder: the path to the synthetic folder
+        extensions: the extensions used to filter the files
+    """
+    benchmark(get_local_files, str(large_folder), extensions)
+
+    return
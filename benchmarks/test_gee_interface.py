@@ -0,0 +1,41 @@
+"""Benchmark the concurrency of the GEEInterface against a fake Earth Engine session."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
+
+
+@pytest.mark.parametrize("max_concurrent", [None, 5])
+def test_get_info_batch(benchmark: BenchmarkFixture, max_concurrent: int) -> None:
+    """Send 20 requests of 50ms at once.
+
+    Args:
+        benchmark: the benchmark fixture
+        max_concurrent: the concurrent request quota of the fake session
+    """
+    session = FakeEESession(latency=0.05, max_concurrent=max_concurrent)
+    gee_interface = GEEInterface(session=session)
+
+    benchmark.pedantic(gee_interface.get_info_batch, args=(list(range(20)),), rounds=5)
+    assert session.call_count("get_info") == 20 * 5
+
+    return
+
+
+def test_sequential(benchmark: BenchmarkFixture) -> None:
+    """Send 20 requests of 50ms one after the other.
+
+    Args:
+        benchmark: the benchmark fixture
+    """
+    session = FakeEESession(latency=0.05)
+    gee_interface = GEEInterface(session=session)
+
+    def requests():
+        return [gee_interface.get_info(i) for i in range(20)]
+
+    benchmark.pedantic(requests, rounds=5)
+
+    return
@@ -0,0 +1,26 @@
+"""Benchmark the import time of the lib and of its sub-packages."""
+
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["pysepal", "pysepal.message", "pysepal.sepalwidgets", "pysepal.mapping", "pysepal.aoi"],
+)
+def test_import(benchmark: BenchmarkFixture, module: str) -> None:
+    """Import a module in a fresh interpreter.
+
+    The measure includes the start of the interpreter, compare the modules between them rather than in absolute.
+
+    Args:
+        benchmark: the benchmark fixture
+        module: the name of the module to import
+    """
+    cmd = [sys.executable, "-c", f"import {module}"]
+    benchmark.pedantic(subprocess.run, args=(cmd,), kwargs={"check": True}, rounds=5)
+
+    return
@@ -0,0 +1,36 @@
+"""Benchmark the creation and the update of the maps."""
+
+import ipyleaflet as ipl
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pysepal import mapping as sm
+
+
+def test_init(benchmark: BenchmarkFixture) -> None:
+    """Create a map with all its default controls.
+
+    Args:
+        benchmark: the benchmark fixture
+    """
+    benchmark(sm.SepalMap, gee=False)
+
+    return
+
+
+@pytest.mark.parametrize("n_layers", [10, 50, 200])
+def test_update_table(benchmark: BenchmarkFixture, n_layers: int) -> None:
+    """Update the layer control of a map displaying many layers.
+
+    Args:
+        benchmark: the benchmark fixture
+        n_layers: the number of layers displayed on the map
+    """
+    m = sm.SepalMap(gee=False)
+    for i in range(n_layers):
+        m.add_layer(ipl.TileLayer(url=f"https://tile.{i}/{{z}}/{{x}}/{{y}}.png", name=f"layer_{i}"))
+
+    control = next(c for c in m.controls if isinstance(c, sm.LayersControl))
+    benchmark(control.update_table, {})
+
+    return
@@ -0,0 +1,33 @@
+"""Benchmark the construction of the Translator."""
+
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pysepal.message import ms
+from pysepal.translator import Translator
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_init(benchmark: BenchmarkFixture, lazy: bool) -> None:
+    """Build the lib translator from its compiled bundle.
+
+    Args:
+        benchmark: the benchmark fixture
+        lazy: whether to box the namespaces on first access
+    """
+    benchmark(Translator, Path(ms._folder), "fr", lazy=lazy)
+
+    return
+
+
+def test_compile(benchmark: BenchmarkFixture) -> None:
+    """Merge and validate the lib dictionaries as done when no bundle can be reused.
+
+    Args:
+        benchmark: the benchmark fixture
+    """
+    benchmark(ms._compile, Path(ms._folder), "en", "fr")
+
+    return
@@ -33,6 +33,24 @@ def test(session):
     session.run("pytest", "--color=yes", "--cov", "--cov-report=xml", *test_files)
 
 
+@nox.session(reuse_venv=True)
+def benchmark(session):
+    """Run the benchmarks and compare them with the last saved run.
+
+    The results are saved in .benchmarks/ to compare the next runs with. Use "--benchmark-compare-fail=mean:10%" to fail on regressions.
+    """
+    session.install(".[test]", "pytest-benchmark")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "--color=yes",
+        "--benchmark-autosave",
+        "--benchmark-compare",
+        "--benchmark-columns=min,mean,stddev,rounds",
+        *session.posargs,
+    )
+
+
 @nox.session(name="dead-fixtures", reuse_venv=True)
 def dead_fixtures(session):
     """Check for dead fixtures items."""
@@ -3,14 +3,36 @@
 ``pysepal`` is a lib designed to create elegant python based dashboard in the SEPAL environment. It is designed on top of the amazing ``ipyvuetify`` library and will help developer to easily create interface for their workflows. By using this libraries, you'll ensure a robust and unified interface for your scripts and a easy and complete integration into the SEPAL dashboard of application.
 """
 
+from typing import Any
+
 from pysepal.conf import config as config
 from pysepal.conf import config_file as config_file
-from pysepal.frontend.styles import SepalColor
-from pysepal.frontend.styles import get_theme as get_theme
 
 __author__ = """Pierrick Rambaud"""
 __email__ = "pierrick.rambaud49@gmail.com"
 __version__ = "3.3.0"
 
-color = SepalColor()
-'color: the colors of sepal. members are in the following list: "main, darker, bg, primary, accent, secondary, success, info, warning, error, menu". They will render according to the selected theme.'
+# color: the colors of sepal. members are in the following list: "main, darker, bg, primary, accent, secondary, success, info, warning, error, menu". They will render according to the selected theme.
+# it is created on first access as importing the styles displays the css and js in the notebook
+
+
+def __getattr__(name: str) -> Any:
+    """Import the styles only when the colors or the theme are used (PEP 562).
+
+    Args:
+        name: the name of the requested attribute
+
+    Returns:
+        the attribute from :py:mod:`pysepal.frontend.styles`
+    """
+    if name in ["SepalColor", "get_theme"]:
+        from pysepal.frontend import styles
+
+        return getattr(styles, name)
+
+    if name == "color":
+        from pysepal.frontend.styles import SepalColor
+
+        return globals().setdefault("color", SepalColor())
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
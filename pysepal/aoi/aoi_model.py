@@ -1,28 +1,32 @@
 """Model object dedicated to AOI selection."""
 
-import json
+import hashlib
+import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import ee
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-import pygadm
-import pygaul
+import shapely
 import traitlets as t
 from eeclient.client import EESession
 from ipyleaflet import GeoJSON
 from typing_extensions import Self
 
-from pysepal import color
-from pysepal.frontend import styles as ss
+from pysepal.mapping.geojson_utils import default_aoi_style, gdf_to_geojson
 from pysepal.message import ms
 from pysepal.model import Model
+from pysepal.scripts import gaul
 from pysepal.scripts import utils as su
 from pysepal.scripts.gee_interface import GEEInterface
 
 __all__ = ["AoiModel"]
 
+log = logging.getLogger("sepalui.aoi.aoi_model")
+
 
 class AoiModel(Model):
 
@@ -36,6 +40,21 @@ class AoiModel(Model):
     ASSET_SUFFIX: str = "aoi_"
     "The suffix to identify the asset in GEE"
 
+    HASH_LENGTH: int = 10
+    "The number of characters of the geometry hash appended to the exported asset names"
+
+    MAX_PAYLOAD: int = 1_000_000
+    "The maximum size (in bytes) of a GeoJSON embedded in the EE requests, above it the exported asset is used instead"
+
+    COORDINATE_BYTES: int = 40
+    "The approximate size (in bytes) of a coordinate pair in a GeoJSON, used to estimate the payloads"
+
+    DEGREE: float = 111_320.0
+    "The approximate length of a degree at the equator in meters"
+
+    ZOOM_0_RESOLUTION: float = 156_543.03
+    "The size in meters of a map pixel at zoom level 0 on the equator"
+
     # ###########################################################################
     # ###                             const methods                           ###
     # ###########################################################################
@@ -107,6 +126,9 @@ class AoiModel(Model):
     default_asset: Optional[str] = None
     "The default asset name, need to point to a readable FeatureCollection"
 
+    scale: Optional[float] = None
+    "The analysis scale in meters, used to simplify the geometries sent to GEE. None to keep the full resolution"
+
     # ###########################################################################
     # ###                           model outputs                             ###
     # ###########################################################################
@@ -126,6 +148,12 @@ class AoiModel(Model):
     ipygeojson: Optional[GeoJSON] = None
     "The representation of the AOI as a ipyleaflet layer"
 
+    _display_gdfs: Dict[int, gpd.GeoDataFrame] = {}
+    "The simplified geodataframes downloaded from GEE indexed by map zoom level"
+
+    _bounds: Optional[List[float]] = None
+    "The precomputed bounds of the AOI (only for the AOIs created in batch)"
+
     def __init__(
         self,
         gee: bool = True,
@@ -135,6 +163,7 @@ class AoiModel(Model):
         folder: Union[str, Path] = "",
         gee_session: Optional[EESession] = None,
         gee_interface: Optional[GEEInterface] = None,
+        scale: Optional[float] = None,
     ) -> None:
         """An Model object dedicated to the sorage and the manipulation of aoi.
 
@@ -151,6 +180,7 @@ class AoiModel(Model):
             folder: the init GEE asset folder where the asset selector should start looking (debugging purpose)
             gee_session: the Earth Engine session to use for the GEE binding (deprecated in favor of gee_interface)
             gee_interface: a shared GEEInterface instance. If provided, takes precedence over gee_session
+            scale: the analysis scale in meters. If set, geometries uploaded to GEE from vector files or drawings are simplified to half of this resolution. Default to no simplification.
 
         Raises:
             ValueError: if both gee_session and gee_interface are provided
@@ -170,7 +200,9 @@ class AoiModel(Model):
             )
 
         # the ee retated information
+        self._display_gdfs = {}
         self.gee = gee
+        self.scale = scale
         if gee:
             su.init_ee()
             if gee_interface:
@@ -293,13 +325,21 @@ class AoiModel(Model):
         if not len(values) == len(set(values)):
             raise Exception(ms.aoi_sel.exception.duplicate_key)
 
-        # create the gdf
-        df = pd.read_csv(point_file, sep=None, engine="python")
-        self.gdf = gpd.GeoDataFrame(
-            df,
-            crs="EPSG:4326",
-            geometry=gpd.points_from_xy(df[point_json["lng_column"]], df[point_json["lat_column"]]),
-        )
+        # create the gdf by chunks, only reading the relevant columns
+        # each chunk is filtered and converted as soon as it's read so that the raw
+        # chunks are released and the rows without coordinates are never kept
+        lat, lng = point_json["lat_column"], point_json["lng_column"]
+        gdfs = []
+        for df in su.read_csv_chunks(point_file, usecols=[point_json["id_column"], lat, lng]):
+            df = df.dropna(subset=[lat, lng])
+            if len(df) > 0:
+                geometry = gpd.points_from_xy(df[lng], df[lat])
+                gdfs.append(gpd.GeoDataFrame(df, crs="EPSG:4326", geometry=geometry))
+
+        if len(gdfs) == 0:
+            raise Exception(ms.aoi_sel.exception.no_points)
+
+        self.gdf = pd.concat(gdfs, ignore_index=True) if len(gdfs) > 1 else gdfs[0]
 
         # set the name
         self.name = point_file.stem
@@ -317,7 +357,7 @@ class AoiModel(Model):
         """Set the object output from a vector json.
 
         Args:
-            vector_json: the dict describing the vector file, and column filter
+            vector_json: the dict describing the vector file, and column filter. It can also include the optional "columns" (list of columns to read) and "bbox" (minx, miny, maxx, maxy in EPSG:4326) keys.
         """
         if not (vector_json["pathname"]):
             raise Exception(ms.aoi_sel.exception.no_file)
@@ -329,26 +369,47 @@ class AoiModel(Model):
         # cast the pathname to pathlib Path
         vector_file = Path(vector_json["pathname"])
 
+        # push the filters down to the reader so that only the selected features are read
+        # and reprojected. bbox is optional and set in EPSG:4326
+        kwargs = {"engine": "pyogrio"}
+        if vector_json["value"] is not None:
+            kwargs["where"] = self._where_clause(vector_json["column"], vector_json["value"])
+        if vector_json.get("columns") is not None:
+            kwargs["columns"] = vector_json["columns"]
+        if vector_json.get("bbox") is not None:
+            kwargs["bbox"] = gpd.GeoSeries([shapely.box(*vector_json["bbox"])], crs="EPSG:4326")
+
         # create the gdf
-        self.gdf = gpd.read_file(vector_file).to_crs("EPSG:4326")
+        self.gdf = gpd.read_file(vector_file, **kwargs).to_crs("EPSG:4326")
 
         # set the name using the file stem
         self.name = vector_file.stem
-
-        # filter it if necessary
         if vector_json["value"] is not None:
-            self.gdf = self.gdf[self.gdf[vector_json["column"]] == vector_json["value"]]
             self.name = f"{self.name}_{vector_json['column']}_{vector_json['value']}"
 
         if self.gee:
-            # transform the gdf to ee.FeatureCollection
-            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
-
-            # export as a GEE asset
-            self.export_to_asset()
+            # transform the gdf to ee.FeatureCollection and export it as a GEE asset
+            self._gdf_to_ee()
 
         return self
 
+    @staticmethod
+    def _where_clause(column: str, value: Union[str, int, float]) -> str:
+        """Build an OGR SQL attribute filter selecting the features equal to a value.
+
+        Args:
+            column: the name of the column to filter
+            value: the value to select
+
+        Returns:
+            the SQL WHERE clause
+        """
+        column = column.replace('"', '""')
+        if isinstance(value, str):
+            value = "'" + value.replace("'", "''") + "'"
+
+        return f'"{column}" = {value}'
+
     def _from_geo_json(self, geo_json: dict) -> Self:
         """Set the gdf output from a geo_json.
 
@@ -370,11 +431,8 @@ class AoiModel(Model):
         self.name = su.normalize_str(self.name)
 
         if self.gee:
-            # transform the gdf to ee.FeatureCollection
-            self.feature_collection = su.geojson_to_ee(self.gdf.__geo_interface__)
-
-            # export as a GEE asset
-            self.export_to_asset()
+            # transform the gdf to ee.FeatureCollection and export it as a GEE asset
+            self._gdf_to_ee()
         else:
             # save the geojson in downloads
             path = Path("~", "downloads", "aoi").expanduser()
@@ -385,6 +443,50 @@ class AoiModel(Model):
 
         return self
 
+    def _simplify(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Simplify the geometries of a gdf according to the analysis scale.
+
+        The geometries are simplified (preserving their topology) with a tolerance of half a pixel of the analysis scale and their coordinates are snapped on a grid 10 times finer. Geometries that would collapse are kept untouched.
+
+        Args:
+            gdf: the gdf to simplify in EPSG:4326
+
+        Returns:
+            a copy of the gdf with lighter geometries
+        """
+        if not self.scale:
+            return gdf
+
+        tolerance = self.scale / 2 / self.DEGREE
+        geoms = gdf.geometry.values
+        simplified = shapely.simplify(geoms, tolerance, preserve_topology=True)
+        simplified = shapely.set_precision(simplified, grid_size=tolerance / 10)
+        simplified = np.where(shapely.is_empty(simplified), geoms, simplified)
+
+        return gdf.set_geometry(gpd.GeoSeries(simplified, index=gdf.index, crs=gdf.crs))
+
+    def _gdf_to_ee(self) -> Self:
+        """Set the feature collection from the gdf and export it as an asset.
+
+        The geometries are simplified before being embedded in the EE requests. If the payload is still bigger than ``MAX_PAYLOAD``, the feature collection points to the exported asset when it's available.
+        """
+        gdf = self._simplify(self.gdf)
+        vertices = shapely.get_num_coordinates(gdf.geometry.values).sum()
+        payload = int(vertices) * self.COORDINATE_BYTES
+
+        self.feature_collection = su.geojson_to_ee(gdf.__geo_interface__)
+        self.export_to_asset()
+
+        if payload > self.MAX_PAYLOAD:
+            if self.gee_interface.get_asset(self.dst_asset_id, not_exists_ok=True):
+                self.feature_collection = ee.FeatureCollection(self.dst_asset_id)
+            else:
+                log.warning(
+                    f"The AOI geometry weights about {payload} bytes and will be embedded in every EE request until {self.dst_asset_id} is exported"
+                )
+
+        return self
+
     def _from_admin(self, admin: str) -> Self:
         """Set the object according to the given an administrative code in the GADM/GAUL codes.
 
@@ -395,44 +497,203 @@ class AoiModel(Model):
             raise Exception(ms.aoi_sel.exception.no_admlyr)
 
         # get the data from either the pygaul or the pygadm libs
+        # they are only imported when an admin area is requested
         if self.gee:
+            import pygaul
+
             self.feature_collection = pygaul.Items(admin=admin)
 
-            # get the iso3_code directly from GAUL 2024 dataset
-            feature = self.feature_collection.first()
-            properties = self.gee_interface.get_info(feature.toDictionary(feature.propertyNames()))
+            # the name is resolved from the local GAUL table, no need to query EE
+            self.name = gaul.get_admin_name(admin)
 
-            # GAUL 2024 includes iso3_code directly, fallback to mapping for disputed areas
-            iso = properties.get("iso3_code", "")
-            if not iso or (
-                isinstance(iso, str) and iso.startswith("x")
-            ):  # 'x' prefix means disputed/unknown
-                gaul0_code = str(properties.get("gaul0_code", ""))
-                iso = json.loads(self.MAPPING.read_text()).get(gaul0_code, "UNK")
+        else:
+            import pygadm
 
-            # GAUL 2024 uses lowercase column names: gaul0_name, gaul1_name, gaul2_name
-            names = [value for prop, value in properties.items() if "_name" in prop]
+            self.gdf = pygadm.Items(admin=admin)
 
             # generate the name from the columns
-            names = [su.normalize_str(name) for name in names]
-            names[0] = iso
+            self.name = self._gadm_name(self.gdf.iloc[0])
+        return self
 
-            self.name = "_".join(names)
+    @staticmethod
+    def _gadm_name(r: pd.Series) -> str:
+        """Build the name of a GADM area from its attributes.
 
-        else:
-            self.gdf = pygadm.Items(admin=admin)
+        Args:
+            r: the attributes of the area
 
-            # generate the name from the columns
-            r = self.gdf.iloc[0]
-            names = [su.normalize_str(r[c]) for c in self.gdf.columns if "NAME" in c]
-            names[0] = r.GID_0[:3]
-            self.name = "_".join(names)
-        return self
+        Returns:
+            the ISO code of the country followed by the normalized names of the area
+        """
+        names = [su.normalize_str(r[c]) for c in r.index if "NAME" in c]
+        names[0] = r.GID_0[:3]
+
+        return "_".join(names)
+
+    @staticmethod
+    def _unique_names(names: List[str]) -> List[str]:
+        """Number the names that are used by several AOIs of a batch.
+
+        Args:
+            names: the names of the AOIs
+
+        Returns:
+            the names, the duplicated ones suffixed with their occurrence number
+        """
+        counts, seen = Counter(names), Counter()
+        unique = []
+        for name in names:
+            if counts[name] > 1:
+                seen[name] += 1
+                name = f"{name}_{seen[name]}"
+            unique.append(name)
+
+        return unique
+
+    @staticmethod
+    def _gaul_code(code: Union[int, float, str]) -> str:
+        """Normalize a GAUL code read from EE (int or float) or from the local table (str).
+
+        Args:
+            code: the administrative code
+
+        Returns:
+            the code as an integer string
+        """
+        try:
+            return str(int(float(code)))
+        except (TypeError, ValueError):
+            return str(code)
+
+    def batch(
+        self,
+        vector: Optional[Union[str, Path]] = None,
+        admin: Optional[str] = None,
+        column: Optional[str] = None,
+        level: int = -1,
+    ) -> Iterator["AoiModel"]:
+        """Split a vector file or an administrative area into one AOI per feature.
+
+        The AOIs are yielded lazily as independent models sharing the settings and the GEE interface of this one. Their bounds are computed for all the features at once (locally or in a single EE request) so that ``total_bounds`` doesn't need any extra request. In GEE mode, a vector file is uploaded only once and each AOI is a filter of the shared FeatureCollection.
+
+        Args:
+            vector: the path to a vector file, each feature will be an AOI
+            admin: the administrative code of the parent area (GAUL if gee, GADM otherwise), each sub area will be an AOI
+            column: the column used to name the AOIs of a vector file. Default to the feature index
+            level: the administrative level of the sub areas. Default to the level below the parent
+
+        Returns:
+            the AOI models, one per feature
+        """
+        if (vector is None) == (admin is None):
+            raise ValueError('Exactly one of "vector" and "admin" must be set.')
+
+        if vector is not None:
+            return self._batch_vector(Path(vector), column)
+
+        return self._batch_admin(str(admin), level)
+
+    def _batch_child(
+        self,
+        method: str,
+        name: str,
+        bounds: List[float],
+        gdf: Optional[gpd.GeoDataFrame] = None,
+        feature_collection: Optional[ee.FeatureCollection] = None,
+    ) -> "AoiModel":
+        """Create a model for one AOI of a batch without any request to EE."""
+        kwargs = {"gee": self.gee, "scale": self.scale}
+        if self.gee:
+            kwargs.update(folder=self.folder, gee_interface=self.gee_interface)
+
+        aoi = type(self)(**kwargs)
+        aoi.method = method
+        aoi.name = name
+        aoi.gdf = gdf
+        aoi.feature_collection = feature_collection
+        aoi._bounds = [round(bound, 4) for bound in bounds]
+
+        return aoi
+
+    def _batch_vector(self, vector: Path, column: Optional[str]) -> Iterator["AoiModel"]:
+        """Yield one AOI per feature of a vector file, see :py:meth:`batch`."""
+        gdf = gpd.read_file(vector, engine="pyogrio").to_crs("EPSG:4326")
+        gdf = gdf.reset_index(drop=True).assign(aoi_batch_id=np.arange(len(gdf)))
+        values = gdf.index.astype(str) if column is None else gdf[column].astype(str)
+        names = (vector.stem + "_" + ("" if column is None else f"{column}_") + values).tolist()
+        names = self._unique_names(names)
+        bounds = gdf.bounds.to_numpy().tolist()
+
+        # upload all the features at once
+        feature_collection = None
+        if self.gee:
+            parent = self._batch_child("SHAPE", vector.stem, gdf.total_bounds.tolist(), gdf)
+            feature_collection = parent._gdf_to_ee().feature_collection
+
+        for i in range(len(gdf)):
+            fc = feature_collection and feature_collection.filter(ee.Filter.eq("aoi_batch_id", i))
+            row = gdf.iloc[[i]].drop(columns="aoi_batch_id")
+            yield self._batch_child("SHAPE", names[i], bounds[i], row, fc)
+
+    def _batch_admin(self, admin: str, level: int) -> Iterator["AoiModel"]:
+        """Yield one AOI per sub area of an administrative area, see :py:meth:`batch`."""
+        if not self.gee:
+            import pygadm
+
+            level = admin.count(".") + 1 if level == -1 else level
+            gdf = pygadm.Items(admin=admin, content_level=level)
+            bounds = gdf.bounds.to_numpy().tolist()
+            names = self._unique_names([self._gadm_name(r) for _, r in gdf.iterrows()])
+            for i in range(len(gdf)):
+                yield self._batch_child(f"ADMIN{level}", names[i], bounds[i], gdf.iloc[[i]])
+            return
+
+        # names and codes are read from the local GAUL table
+        level = gaul.get_admin(admin)[0] + 1 if level == -1 else level
+        items = gaul.get_items(level, admin)
+        code_column = f"gaul{level}_code"
+
+        # the bounds of all the sub areas are computed in a single request
+        import pygaul
+
+        feature_collection = pygaul.Items(admin=admin, content_level=level)
+        bounds_collection = feature_collection.map(
+            lambda f: ee.Feature(
+                None,
+                {
+                    "code": f.get(code_column),
+                    "coords": f.geometry().bounds().coordinates().get(0),
+                },
+            )
+        )
+        features = self.gee_interface.get_info(bounds_collection)["features"]
+        coords = {
+            self._gaul_code(f["properties"]["code"]): f["properties"]["coords"] for f in features
+        }
+
+        # the local table and the EE dataset can be out of sync
+        codes = [self._gaul_code(item["value"]) for item in items]
+        missing = [code for code in codes if code not in coords]
+        if missing:
+            log.warning(f"GAUL codes missing from the EE dataset, skipped: {missing}")
+        codes = [code for code in codes if code in coords]
+        names = self._unique_names([gaul.get_admin_name(code, level) for code in codes])
+
+        for code, name in zip(codes, names):
+            c = coords[code]
+            yield self._batch_child(
+                f"ADMIN{level}",
+                name,
+                [c[0][0], c[0][1], c[2][0], c[2][1]],
+                feature_collection=feature_collection.filter(ee.Filter.eq(code_column, int(code))),
+            )
 
     def clear_output(self) -> Self:
         """Clear the output of the aoi selector without changing the traits and/or the parameters."""
         # reset the outputs
         self.gdf = None
+        self._display_gdfs = {}
+        self._bounds = None
         self.feature_collection = None
         self.ipygeojson = None
         self.selected_feature = None
@@ -531,6 +792,10 @@ class AoiModel(Model):
         if self._gdf is None and not self.feature_collection:
             raise ValueError(ms.aoi_sel.exception.no_gdf)
 
+        # the bounds of the AOIs created in batch are already known
+        if self._bounds is not None:
+            return self._bounds
+
         if self.gee:
             coords = self.gee_interface.get_info(
                 self.feature_collection.geometry().bounds().coordinates().get(0)
@@ -541,87 +806,157 @@ class AoiModel(Model):
 
         return [round(bound, 4) for bound in bounds]
 
-    def export_to_asset(self) -> Self:
-        """Export the feature_collection as an asset (only for ee model)."""
-        asset_name = self.ASSET_SUFFIX + self.name
-        asset_id = str(Path(self.folder, asset_name))
+    async def total_bounds_async(self) -> Tuple[float, float, float, float]:
+        """Asynchronously reproduce the behaviour of the total_bounds method from geopandas.
 
-        self.dst_asset_id = asset_id
+        Returns:
+            minxx, miny, maxx, maxy
+        """
+        if not self.gee or self._bounds is not None:
+            return self.total_bounds()
 
-        # check if the table already exist
-        if self.gee_interface.get_asset(asset_id, not_exists_ok=True):
-            return self
+        if not self.feature_collection:
+            raise ValueError(ms.aoi_sel.exception.no_gdf)
 
-        # check if the task is running
-        if self.gee_interface.is_running(asset_name):
-            return self
+        coords = await self.gee_interface.get_info_async(
+            self.feature_collection.geometry().bounds().coordinates().get(0)
+        )
+        bounds = [coords[0][0], coords[0][1], coords[2][0], coords[2][1]]
 
-        # run the task
-        task_config = {
-            "collection": self.feature_collection,
-            "description": asset_name,
-            "asset_id": asset_id,
-        }
+        return [round(bound, 4) for bound in bounds]
 
-        self.gee_interface.export_table_to_asset(**task_config)
+    def geometry_hash(self) -> str:
+        """Compute a content hash of the AOI geometry.
 
-        return self
+        The geometries are normalized and rounded to 1e-7 degrees so that the hash does not depend on the feature order, the vertex order or the float noise. The CRS and the simplification scale are part of the hash as they change the exported geometry.
+
+        Returns:
+            the hexadecimal sha256 digest of the geometry
+        """
+        hash_ = hashlib.sha256(f"scale={self.scale}".encode())
+
+        # fallback to the EE graph if the geometry is not available locally
+        if self._gdf is None:
+            hash_.update(self.feature_collection.serialize().encode())
+            return hash_.hexdigest()
+
+        hash_.update(self._gdf.crs.to_string().encode())
+        geoms = shapely.normalize(self._gdf.geometry.values)
+        [hash_.update(wkt.encode()) for wkt in sorted(shapely.to_wkt(geoms, rounding_precision=7))]
+
+        return hash_.hexdigest()
+
+    def _is_reusable(self, asset: Optional[dict], aoi_hash: str) -> bool:
+        """Check if an existing asset can be used instead of exporting the AOI.
+
+        Args:
+            asset: the asset description as returned by ``GEEInterface.get_asset``, None if it doesn't exist
+            aoi_hash: the hash of the AOI geometry
+
+        Returns:
+            True if the asset stores the same hash, the assets without hash are never reused
+        """
+        if not asset:
+            return False
+
+        return asset.get("properties", {}).get("aoi_hash") == aoi_hash
+
+    async def _find_asset_async(self, aoi_hash: str) -> Optional[str]:
+        """Find an asset of the folder that already holds the AOI geometry.
+
+        The exported assets are named after their hash so any of them is found from the asset list, whatever the name of the AOI that created it. The ``aoi_<name>`` asset is checked on its ``aoi_hash`` property.
+
+        Args:
+            aoi_hash: the hash of the AOI geometry
+
+        Returns:
+            the id of the asset, None if the geometry was never exported
+        """
+        suffix = f"_{aoi_hash[: self.HASH_LENGTH]}"
+        legacy_name = f"{self.ASSET_SUFFIX}{self.name}"
+
+        legacy_id = None
+        for asset in await self.gee_interface.get_assets_async(self.folder):
+            name = Path(asset["id"]).name
+            if asset["type"] != "TABLE" or not name.startswith(self.ASSET_SUFFIX):
+                continue
+            if name.endswith(suffix):
+                return asset["id"]
+            if name == legacy_name:
+                legacy_id = asset["id"]
+
+        if legacy_id is None:
+            return None
+
+        asset = await self.gee_interface.get_asset_async(legacy_id, not_exists_ok=True)
+        return legacy_id if self._is_reusable(asset, aoi_hash) else None
+
+    def export_to_asset(self) -> Self:
+        """Export the feature_collection as an asset (only for ee model).
+
+        See :py:meth:`export_to_asset_async` for the reuse of the existing assets.
+        """
+        return self.gee_interface.run(self.export_to_asset_async())
 
     async def export_to_asset_async(self) -> Self:
-        """Export the feature_collection as an asset (only for ee model)."""
-        asset_name = self.ASSET_SUFFIX + self.name
-        asset_id = str(Path(self.folder, asset_name))
+        """Export the feature_collection as an asset (only for ee model).
 
-        self.dst_asset_id = asset_id
+        The AOI is exported to ``aoi_<name>_<hash>`` and the full geometry hash is stored in the ``aoi_hash`` property of the asset. Any asset of the folder holding the same geometry is reused instead, even if it was exported under another name.
+        """
+        aoi_hash = self.geometry_hash()
 
-        # check if the table already exist
-        if self.gee_interface.get_asset(asset_id, not_exists_ok=True):
+        # check if the geometry was already exported
+        asset_id = await self._find_asset_async(aoi_hash)
+        if asset_id is not None:
+            self.dst_asset_id = asset_id
             return self
 
+        asset_name = f"{self.ASSET_SUFFIX}{self.name}_{aoi_hash[: self.HASH_LENGTH]}"
+        self.dst_asset_id = str(Path(self.folder, asset_name))
+
         # check if the task is running
-        if self.gee_interface.is_running(asset_name):
+        if await self.gee_interface.is_running_async(asset_name):
             return self
 
         # run the task
         task_config = {
-            "collection": self.feature_collection,
+            "collection": self.feature_collection.set("aoi_hash", aoi_hash),
             "description": asset_name,
-            "asset_id": asset_id,
+            "asset_id": self.dst_asset_id,
         }
 
         await self.gee_interface.export_table_to_asset_async(**task_config)
 
-    def get_ipygeojson(self, style: Optional[dict] = None) -> GeoJSON:
+        return self
+
+    def get_ipygeojson(
+        self,
+        style: Optional[dict] = None,
+        zoom: Optional[int] = None,
+        precision: Optional[int] = None,
+    ) -> GeoJSON:
         """Converts current geopandas object into ipyleaflet GeoJSON.
 
         Args:
             style: the predefined style of the aoi. It's by default using a "success" ``sepal_ui.color`` with 0.5 transparent fill color. It can be completely replace by a fully qualified `style dictionary <https://ipyleaflet.readthedocs.io/en/latest/layers/geo_json.html>`__. Use the ``sepal_ui.color`` object to define any color to remain compatible with light and dark theme.
+            zoom: the zoom level of the map displaying the layer. If set, the geometries are simplified to the resolution of this zoom level (see :py:meth:`get_gdf`). Default to full resolution.
+            precision: the number of decimals kept in the coordinates to reduce the size of the data sent to the browser. Default to full precision.
 
         Returns:
             The geojson layer of the aoi gdf, ready to use in a Map
         """
         # This function aims to work in the same way in both gee and non-gee mode
         # It's why we use the gdf property to evaluate the condition
-        if self.gdf is None:
+        gdf = self.get_gdf(zoom)
+        if gdf is None:
             raise Exception(ms.aoi_sel.exception.no_gdf)
 
-        # read the data from geojson and add the name as a property of the shape
+        # add the name as a property of the shape
         # useful when handler are added from ipyleaflet
-        # Convert to regular GeoDataFrame to avoid issues with pygadm subclasses
-        # This is necessary because pygadm 0.5.3 has a bug with pandas 2.3+ where
-        # the __init__ method contains a DataFrame comparison that fails during
-        # geopandas' internal to_json() process. Converting to plain GeoDataFrame
-        # first avoids triggering the buggy pygadm constructor.
-        # See: https://github.com/12rambau/pygadm/issues/81
-        gdf = gpd.GeoDataFrame(self.gdf)
-        data = json.loads(gdf.to_json())
-        for f in data["features"]:
-            f["properties"]["name"] = self.name
+        data = gdf_to_geojson(gdf, self.name, precision)
 
         # adapt the style to the theme
-        if style is None:
-            style = json.loads((ss.JSON_DIR / "aoi.json").read_text())
-            style.update(color=color.primary, fillColor=color.primary)
+        style = default_aoi_style() if style is None else style
 
         # create a GeoJSON object
         # attribution="SEPAL(c)" is not recognized yet
@@ -650,15 +985,55 @@ class AoiModel(Model):
         """Set the gdf value. Used mainly to reset the gdf value."""
         self._gdf = value
 
-    def _load_gdf(self):
-        """Return a geodataframe from a feature collection."""
-        features = self.gee_interface.get_info(self.feature_collection)["features"]
-        self._gdf = gpd.GeoDataFrame.from_features(features).set_crs(epsg=4326)
+    def get_gdf(self, zoom: Optional[int] = None) -> Optional[gpd.GeoDataFrame]:
+        """Get the geodataframe of the AOI at the resolution needed for display.
+
+        In GEE mode the geometries are simplified server side with a maximum error of half a map pixel at the requested zoom level so that only the vertices visible on the map are downloaded. Each resolution is requested once and cached in the model. The full resolution geometries are only fetched when no zoom is set.
+
+        Args:
+            zoom: the zoom level of the map displaying the AOI. Default to None (full resolution)
+
+        Returns:
+            The geodataframe corresponding to the selected AOI
+        """
+        # local data are already fully loaded, no need to download anything
+        if zoom is None or not self.gee or self._gdf is not None:
+            return self.gdf
+
+        if not self.feature_collection:
+            return None
+
+        if zoom not in self._display_gdfs:
+            max_error = self.ZOOM_0_RESOLUTION / 2**zoom / 2
+            fc = self.feature_collection.map(lambda f: ee.Feature(f).simplify(maxError=max_error))
+            log.debug(f"downloading the aoi simplified to {max_error:.1f}m (zoom {zoom})")
+            features = self.gee_interface.get_info(fc)["features"]
+            self._display_gdfs[zoom] = self._features_to_gdf(features)
+
+        return self._display_gdfs[zoom]
+
+    def _features_to_gdf(self, features: List[dict]) -> gpd.GeoDataFrame:
+        """Build a geodataframe from the features of a downloaded feature collection.
+
+        Args:
+            features: the "features" member of the feature collection info
+
+        Returns:
+            the geodataframe in EPSG:4326 including the ISO column for administrative areas
+        """
+        gdf = gpd.GeoDataFrame.from_features(features).set_crs(epsg=4326)
 
         if self.method in ["ADMIN0", "ADMIN1", "ADMIN2"]:
             # GAUL 2024 includes iso3_code directly, fallback to mapping for disputed areas
-            iso = self._gdf.iso3_code.unique()[0] if "iso3_code" in self._gdf.columns else None
+            iso = gdf.iso3_code.unique()[0] if "iso3_code" in gdf.columns else None
             if not iso or (isinstance(iso, str) and iso.startswith("x")):
-                gaul_country = str(self._gdf.gaul0_code.unique()[0])
-                iso = json.loads(self.MAPPING.read_text()).get(gaul_country, "UNK")
-            self._gdf["ISO"] = iso
+                gaul_country = str(gdf.gaul0_code.unique()[0])
+                iso = gaul.iso_mapping().get(gaul_country, "UNK")
+            gdf["ISO"] = iso
+
+        return gdf
+
+    def _load_gdf(self):
+        """Return a geodataframe from a feature collection."""
+        features = self.gee_interface.get_info(self.feature_collection)["features"]
+        self._gdf = self._features_to_gdf(features)
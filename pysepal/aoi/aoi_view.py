@@ -1,12 +1,12 @@
 """``Card`` object dedicated to AOI selection. It does not include maps."""
 
+import asyncio
+import threading
 from datetime import datetime as dt
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import ipyvuetify as v
-import pygadm
-import pygaul
 import traitlets as t
 from deprecated.sphinx import versionadded
 from eeclient.client import EESession
@@ -17,7 +17,9 @@ from pysepal import mapping as sm
 from pysepal.aoi.aoi_model import AoiModel
 from pysepal.message import ms
 from pysepal.scripts import decorator as sd
+from pysepal.scripts import gadm, gaul
 from pysepal.scripts import utils as su
+from pysepal.scripts.gee_task import GEETask, TaskState
 
 if TYPE_CHECKING:
     from pysepal.scripts.gee_interface import GEEInterface
@@ -138,17 +140,9 @@ class AdminField(sw.Select):
         Args:
             filter\_: The code of the parent v_model to filter the current results
         """
-        AdmNames = pygaul.Names if self.gee else pygadm.Names
-        df = AdmNames(admin=filter_, content_level=self.level)
-        df = df.sort_values(by=[df.columns[0]])
-
-        # formatted as a item list for a select component
-        # first column will be the name, second the code
-        items = []
-        for _, r in df.iterrows():
-            text = su.normalize_str(r.iloc[0], folder=False)
-            items.append({"text": text, "value": str(r.iloc[1])})
-        self.items = items
+        # the lists are cached per (level, parent) and shared by all the fields
+        get_items = gaul.get_items if self.gee else gadm.get_items
+        self.items = get_items(self.level, filter_)
 
         return self
 
@@ -184,6 +178,12 @@ class AoiView(sw.Card):
     map_style: Optional[dict] = None
     "The predefined style of the aoi on the map"
 
+    _task: Optional[GEETask] = None
+    "The background task of the last AOI update (only for GEE views)"
+
+    _model_lock: Optional[threading.Lock] = None
+    "The lock making the model updates of the background tasks run one at a time"
+
     # ##########################################################################
     # ###                           the embedded widgets                     ###
     # ##########################################################################
@@ -281,6 +281,7 @@ class AoiView(sw.Card):
         self.model = model or AoiModel(
             gee=gee, folder=folder, gee_session=gee_session, gee_interface=gee_interface, **kwargs
         )
+        self._model_lock = threading.Lock()
 
         # get the map if filled
         self.map_ = map_
@@ -359,11 +360,96 @@ class AoiView(sw.Card):
 
         # js events
         self.w_method.observe(self._activate, "v_model")  # activate widgets
-        self.btn.on_event("click", self._update_aoi)  # load the information
+        self.btn.on_event("click", self._on_click)  # load the information
 
         # reset the aoi_model
         self.model.clear_attributes()
 
+    def _on_click(self, *args) -> None:
+        """Load the object in the model, in the GEE event loop if the view is bound to GEE.
+
+        Each click starts a new task so that a cancelled update can't interfere with the next one.
+        """
+        if not self.gee:
+            self._update_aoi(*args)
+            return
+
+        # restart from scratch if the user clicks again
+        if self._task is not None:
+            self._task.cancel()
+
+        self.alert.reset()
+        self.btn.loading, self.btn.disabled = True, True
+
+        # read the drawn shapes from the widget thread, the model is set in the task
+        geo_json = self.aoi_dc.to_json() if self.map_ else None
+
+        task = self.model.gee_interface.create_task(
+            func=self._update_aoi_async,
+            key="update_aoi",
+            on_error=lambda e: self.alert.add_msg(str(e), "error"),
+            on_finally=lambda: self._on_update_finally(task),
+        )
+        self._task = task
+        task.start(geo_json)
+
+        return
+
+    async def _update_aoi_async(self, geo_json: Optional[dict] = None) -> Self:
+        """Load the object in the model & update the map (if possible) without blocking the kernel.
+
+        The bounds of the AOI and the tiles of its layer are requested concurrently. The task is cancelled if the user changes the method, in that case the map is left untouched but the model can still be set if it was already being computed.
+
+        The widgets and the map are updated from the GEE loop like in the callbacks of any ``GEETask``: ipywidgets sends the new states through the kernel comms from any thread, and the updates of the view are only written by the last task as the previous ones are cancelled before it starts.
+
+        Args:
+            geo_json: the shapes drawn on the map, None if the view has no map
+        """
+        # the model methods are blocking, run them outside of the loop
+        await asyncio.to_thread(self._set_object, geo_json)
+        self.alert.add_msg(ms.aoi_sel.complete, "success")
+
+        # update the map
+        if self.map_:
+            self.map_.remove_layer("aoi", none_ok=True)
+            bounds, _ = await asyncio.gather(
+                self.model.total_bounds_async(),
+                self.map_.add_ee_layer_async(self.model.feature_collection, {}, "aoi"),
+            )
+            self.map_.zoom_bounds(bounds)
+            self.aoi_dc.hide()
+
+        # tell the rest of the apps that the aoi have been updated
+        self.updated += 1
+
+        return self
+
+    def _set_object(self, geo_json: Optional[dict]) -> None:
+        """Set the model from a worker thread, one update at a time.
+
+        Cancelling a task doesn't stop its worker thread so the next update waits for it to end instead of writing the model at the same time.
+
+        Args:
+            geo_json: the shapes drawn on the map, None if the view has no map
+        """
+        with self._model_lock:
+            if geo_json is not None:
+                self.model.geo_json = geo_json
+            self.model.set_object()
+
+        return
+
+    def _on_update_finally(self, task: GEETask) -> None:
+        """Release the button at the end of the last update, unless it was cancelled.
+
+        Args:
+            task: the task that just ended
+        """
+        if task is self._task and task.state != TaskState.CANCELLED:
+            self.btn.loading, self.btn.disabled = False, False
+
+        return
+
     @sd.loading_button()
     def _update_aoi(self, *args) -> Self:
         """Load the object in the model & update the map (if possible)."""
@@ -406,6 +492,11 @@ class AoiView(sw.Card):
     @sd.switch("loading", on_widgets=["w_method"])
     def _activate(self, change: dict) -> None:
         """Activate the adapted widgets."""
+        # stop the running update, it's not relevant anymore
+        if self._task is not None and self._task.is_running:
+            self._task.cancel()
+            self.btn.loading, self.btn.disabled = False, False
+
         # clear and hide the alert
         self.alert.reset()
 
@@ -27,5 +27,7 @@ from .legend_control import *
 from .map_btn import *
 from .marker_cluster import *
 from .menu_control import *
+from .raster_registry import *
 from .sepal_map import *
+from .tile_client_pool import *
 from .zoom_control import *
@@ -1,21 +1,81 @@
 """Utility functions for creating GeoJSON layers."""
 
 import json
+from functools import lru_cache
 from typing import Optional
 
 import geopandas as gpd
+import numpy as np
+import shapely
 from ipyleaflet import GeoJSON
 
 from pysepal import color
 from pysepal.frontend import styles as ss
 
-__all__ = ["get_ipygeojson"]
+__all__ = ["default_aoi_style", "gdf_to_geojson", "get_ipygeojson"]
+
+
+@lru_cache(maxsize=1)
+def _read_aoi_style() -> dict:
+    """Read the default AOI style from the disk only once."""
+    return json.loads((ss.JSON_DIR / "aoi.json").read_text())
+
+
+def default_aoi_style() -> dict:
+    """Get a copy of the default AOI style adapted to the current theme colors.
+
+    Returns:
+        the style dictionary of an ipyleaflet GeoJSON layer
+    """
+    return {**_read_aoi_style(), "color": color.primary, "fillColor": color.primary}
+
+
+def gdf_to_geojson(
+    gdf: gpd.GeoDataFrame,
+    name: Optional[str] = None,
+    precision: Optional[int] = None,
+) -> dict:
+    """Convert a GeoDataFrame into a GeoJSON FeatureCollection dictionary.
+
+    The dictionary is built directly from the geometries and the attribute table without serializing it to a JSON string first.
+
+    Args:
+        gdf: The GeoDataFrame to convert.
+        name: If set, added as a "name" property to every feature.
+        precision: If set, the number of decimals kept in the coordinates. 6 decimals is roughly 10cm in EPSG:4326 and is enough for display.
+
+    Returns:
+        The GeoJSON FeatureCollection as a dictionary.
+    """
+    # Convert to regular GeoDataFrame to avoid issues with pygadm subclasses
+    # This is necessary because pygadm 0.5.3 has a bug with pandas 2.3+ where
+    # the __init__ method contains a DataFrame comparison that fails during
+    # geopandas' internal conversion process.
+    gdf = gpd.GeoDataFrame(gdf)
+
+    if name is not None:
+        gdf = gdf.assign(name=name)
+
+    if precision is not None:
+        geoms = shapely.transform(gdf.geometry.values, lambda c: np.round(c, precision))
+        gdf = gdf.set_geometry(geoms)
+
+    # dates are not JSON serializable, use the same ISO format as GeoDataFrame.to_json
+    # assign works on a copy so the caller's dataframe is never modified
+    dates = gdf.select_dtypes(include=["datetime", "datetimetz"]).columns
+    if len(dates) > 0:
+        gdf = gdf.assign(**{c: gdf[c].dt.strftime("%Y-%m-%dT%H:%M:%S") for c in dates})
+
+    features = list(gdf.iterfeatures(na="null"))
+
+    return {"type": "FeatureCollection", "features": features}
 
 
 def get_ipygeojson(
     gdf: gpd.GeoDataFrame,
     name: str = "aoi",
     style: Optional[dict] = None,
+    precision: Optional[int] = None,
 ) -> GeoJSON:
     """Convert a GeoDataFrame into an ipyleaflet GeoJSON layer.
 
@@ -28,6 +88,8 @@ def get_ipygeojson(
         style: Optional style dictionary for the GeoJSON layer. If None, uses
             the default AOI style with primary color. See ipyleaflet GeoJSON
             documentation for style options.
+        precision: Optional number of decimals kept in the coordinates to
+            reduce the size of the data sent to the browser.
 
     Returns:
         An ipyleaflet GeoJSON layer ready to be added to a Map.
@@ -54,21 +116,11 @@ def get_ipygeojson(
     if gdf is None or gdf.empty:
         raise ValueError("GeoDataFrame cannot be None or empty")
 
-    # Convert to regular GeoDataFrame to avoid issues with pygadm subclasses
-    # This is necessary because pygadm 0.5.3 has a bug with pandas 2.3+ where
-    # the __init__ method contains a DataFrame comparison that fails during
-    # geopandas' internal to_json() process.
-    gdf_plain = gpd.GeoDataFrame(gdf)
-    data = json.loads(gdf_plain.to_json())
-
     # Add name as a property to each feature
-    for f in data["features"]:
-        f["properties"]["name"] = name
+    data = gdf_to_geojson(gdf, name, precision)
 
     # Apply default style if not provided
-    if style is None:
-        style = json.loads((ss.JSON_DIR / "aoi.json").read_text())
-        style.update(color=color.primary, fillColor=color.primary)
+    style = default_aoi_style() if style is None else style
 
     # Create and return the GeoJSON layer
     return GeoJSON(data=data, style=style, name=name)
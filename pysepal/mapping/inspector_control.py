@@ -1,16 +1,15 @@
 """Customized ``Control`` to display the value of all available layers on a specific pixel."""
 
+import math
 from pathlib import Path
 from typing import Optional, Sequence, Union
 
 import ee
 import geopandas as gpd
 import ipyvuetify as v
-import rasterio as rio
-import rioxarray
+import numpy as np
 from deprecated.sphinx import deprecated
-from ipyleaflet import GeoJSON, Map, Marker
-from rasterio.crs import CRS
+from ipyleaflet import GeoJSON, Layer, Map, Marker
 from shapely import geometry as sg
 from traitlets import Bool
 
@@ -42,6 +41,9 @@ class InspectorControl(MenuControl):
     marker: Optional[Marker] = None
     "The marker of the last visited point"
 
+    _geojson_cache: dict = {}
+    "The GeoJSON layers of the map and their indexed GeoDataFrames, indexed by layer model_id"
+
     def __init__(self, m: Map, open_tree: bool = True, **kwargs) -> None:
         """Widget control displaying a btn on the map.
 
@@ -53,6 +55,9 @@ class InspectorControl(MenuControl):
         # set traits
         self.open_tree = open_tree
 
+        # init the cache of the vector layers
+        self._geojson_cache = {}
+
         # set some default parameters
         kwargs.setdefault("position", "topleft")
         kwargs["m"] = m
@@ -132,12 +137,13 @@ class InspectorControl(MenuControl):
 
         # write the layers data
         items, layers = [], [lyr for lyr in self.m.layers if not lyr.base]
+        self._prune_geojson_cache(layers)
         for i, lyr in enumerate(layers):
 
             if isinstance(lyr, EELayer):
                 data = self._from_eelayer(lyr.ee_object, coords)
             elif isinstance(lyr, GeoJSON):
-                data = self._from_geojson(lyr.data, coords)
+                data = self._from_geojson(lyr, coords)
             elif type(lyr).__name__ == "BoundTileLayer":
                 data = self._from_raster(lyr.raster, coords)
             elif isinstance(lyr, Marker):
@@ -219,11 +225,14 @@ class InspectorControl(MenuControl):
 
         return pixel_values
 
-    def _from_geojson(self, data: dict, coords: Sequence[float]) -> dict:
+    def _from_geojson(self, data: Union[dict, GeoJSON], coords: Sequence[float]) -> dict:
         """Extract the values of the data for the considered point.
 
+        If a GeoJSON layer is provided, its GeoDataFrame and spatial index are built once and
+        reused for every click until the ``data`` of the layer changes.
+
         Args:
-            data: the shape to reduce to a single point
+            data: the shape to reduce to a single point or the GeoJSON layer embedding it
             coords: the coordinates of the point (lng, lat).
 
         Returns:
@@ -232,9 +241,10 @@ class InspectorControl(MenuControl):
         # extract the coordinates as a poin
         point = sg.Point(*coords)
 
-        # filter the data to 1 point
-        gdf = gpd.GeoDataFrame.from_features(data)
-        gdf_filtered = gdf[gdf.contains(point)]
+        # filter the data to 1 point using the spatial index of the dataframe
+        gdf = self._get_geojson_gdf(data)
+        idx = gdf.sindex.query(point, predicate="within")
+        gdf_filtered = gdf.iloc[sorted(idx)]
         skip_cols = ["geometry", "style"]
 
         # only display the columns name if empty
@@ -246,6 +256,49 @@ class InspectorControl(MenuControl):
         else:
             return gdf_filtered.iloc[0, ~gdf.columns.isin(skip_cols)].to_dict()
 
+    def _get_geojson_gdf(self, data: Union[dict, GeoJSON]) -> gpd.GeoDataFrame:
+        """Get the GeoDataFrame of a GeoJSON layer from the cache or build it.
+
+        Args:
+            data: the geo_interface of the shape or the GeoJSON layer embedding it
+
+        Returns:
+            the GeoDataFrame of the features
+        """
+        # raw dicts cannot be tracked, build them on the fly
+        if not isinstance(data, GeoJSON):
+            return gpd.GeoDataFrame.from_features(data)
+
+        layer = data
+        if layer.model_id not in self._geojson_cache:
+            gdf = gpd.GeoDataFrame.from_features(layer.data)
+            gdf.sindex  # build the STRtree once, it is lazily created by geopandas
+            self._geojson_cache[layer.model_id] = (layer, gdf)
+            layer.observe(self._clear_geojson_cache, "data")
+
+        return self._geojson_cache[layer.model_id][1]
+
+    def _clear_geojson_cache(self, change: dict) -> None:
+        """Drop the cached GeoDataFrame of a layer when its data changes."""
+        layer = change["owner"]
+        layer.unobserve(self._clear_geojson_cache, "data")
+        self._geojson_cache.pop(layer.model_id, None)
+
+        return
+
+    def _prune_geojson_cache(self, layers: Sequence[Layer]) -> None:
+        """Drop the cached GeoDataFrames of the layers that are not on the map anymore.
+
+        Args:
+            layers: the layers currently displayed on the map
+        """
+        model_ids = [lyr.model_id for lyr in layers if isinstance(lyr, GeoJSON)]
+        for model_id in [k for k in self._geojson_cache if k not in model_ids]:
+            layer, _ = self._geojson_cache.pop(model_id)
+            layer.unobserve(self._clear_geojson_cache, "data")
+
+        return
+
     def _from_raster(self, raster: Union[str, Path], coords: Sequence[float]) -> dict:
         """Extract the values of the data-array for the considered point.
 
@@ -256,31 +309,37 @@ class InspectorControl(MenuControl):
         Returns:
             The value associated to the feature names
         """
+        from rasterio import windows
+
         # extract the coordinates as a point
         point = sg.Point(*coords)
 
         # extract the pixel size in degrees (equatorial approximation)
         scale = self.m.get_scale() * 0.00001
 
-        # open the image and unproject it
-        da = rioxarray.open_rasterio(raster, masked=True)
-        da = da.chunk({"x": 1000, "y": 1000})
-        if da.rio.crs != CRS.from_string("EPSG:4326"):
-            da = da.rio.reproject("EPSG:4326")
+        # get the unprojected view of the image from the map registry
+        # pixels are only reprojected when they are read
+        info = self.m.raster_registry.info(raster)
+        src = self.m.raster_registry.warped(raster)
 
-        # sample is not available for da so I do as in GEE a mean reducer around 1px
+        # sample is not available for rasterio dataset so I do as in GEE a mean reducer around 1px
         # is it an overkill ? yes
-        if sg.box(*da.rio.bounds()).contains(point):
+        if sg.box(*src.bounds).contains(point):
             bounds = point.buffer(scale).bounds
-            window = rio.windows.from_bounds(*bounds, transform=da.rio.transform())
-            da_filtered = da.rio.isel_window(window)
-            means = da_filtered.mean(axis=(1, 2)).to_numpy()
+            window = windows.from_bounds(*bounds, transform=src.transform)
+            (row_start, row_stop), (col_start, col_stop) = window.toranges()
+            window = windows.Window.from_slices(
+                (max(math.floor(row_start), 0), max(math.ceil(row_stop), 0)),
+                (max(math.floor(col_start), 0), max(math.ceil(col_stop), 0)),
+            )
+            data = src.read(window=window, masked=True)
+            means = [None if b is np.ma.masked else float(b) for b in data.mean(axis=(1, 2))]
             pixel_values = {ms.inspector_control.band.format(i + 1): v for i, v in enumerate(means)}
 
         # if the point is out of the image display None
         else:
             pixel_values = {
-                ms.inspector_control.band.format(i + 1): None for i in range(da.rio.count)
+                ms.inspector_control.band.format(i + 1): None for i in range(info.count)
             }
 
         return pixel_values
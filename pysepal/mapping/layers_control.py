@@ -1,10 +1,10 @@
 """Extend functionalities of the ipyleaflet layer control."""
 
 from types import SimpleNamespace
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
-from ipyleaflet import GeoJSON, Map, TileLayer
-from ipywidgets import link
+from ipyleaflet import GeoJSON, Layer, Map, TileLayer
+from ipywidgets import Widget, link
 
 from pysepal import sepalwidgets as sw
 from pysepal.mapping.menu_control import MenuControl
@@ -25,7 +25,30 @@ class HeaderRow(sw.Html):
         super().__init__(tag="tr", class_="v-no-hover", children=[head])
 
 
-class BaseRow(sw.Html):
+class _LinkedRow(sw.Html):
+
+    links: List[link] = []
+    "the links between the row widgets and the layer traits"
+
+    def unlink(self) -> None:
+        """Remove the links between the row and its layer."""
+        [lnk.unlink() for lnk in self.links]
+        self.links = []
+
+        return
+
+    def close(self) -> None:
+        """Close the row and the widgets of its cells."""
+        for cell in self.children:
+            [w.close() for w in cell.children if isinstance(w, Widget)]
+            cell.close()
+
+        super().close()
+
+        return
+
+
+class BaseRow(_LinkedRow):
 
     w_radio: Optional[sw.SimpleCheckbox] = None
     "the radio to hide/show the layer"
@@ -56,10 +79,10 @@ class BaseRow(sw.Html):
         super().__init__(tag="tr", children=[label_cell, empty_cell, radio_cell])
 
         # add js behavior
-        link((layer, "visible"), (self.w_radio, "active"))
+        self.links = [link((layer, "visible"), (self.w_radio, "active"))]
 
 
-class LayerRow(sw.Html):
+class LayerRow(_LinkedRow):
 
     w_checkbox: Optional[sw.SimpleCheckbox] = None
     "the ckeckbox to hide/show the layer"
@@ -98,8 +121,10 @@ class LayerRow(sw.Html):
 
         # add js behavior
         self.w_checkbox.observe(self._toggle_slider, "v_model")
-        link((layer, "opacity"), (self.w_slider, "v_model"))
-        link((layer, "visible"), (self.w_checkbox, "v_model"))
+        self.links = [
+            link((layer, "opacity"), (self.w_slider, "v_model")),
+            link((layer, "visible"), (self.w_checkbox, "v_model")),
+        ]
 
     def _toggle_slider(self, *args) -> None:
         """Toggle the modification of the slider."""
@@ -108,7 +133,7 @@ class LayerRow(sw.Html):
         return
 
 
-class VectorRow(sw.Html):
+class VectorRow(_LinkedRow):
 
     w_checkbox: Optional[sw.SimpleCheckbox] = None
     "the ckeckbox to hide/show the layer"
@@ -142,7 +167,7 @@ class VectorRow(sw.Html):
         super().__init__(tag="tr", children=[label_cell, empty_cell, checkbox_cell])
 
         # add js behavior
-        link((layer, "visible"), (self.w_checkbox, "v_model"))
+        self.links = [link((layer, "visible"), (self.w_checkbox, "v_model"))]
 
 
 class LayersControl(MenuControl):
@@ -153,6 +178,24 @@ class LayersControl(MenuControl):
     group: Optional[sw.RadioGroup] = None
     "As radio button cannot behave individually we add an extra GroupRadio to wrap the table"
 
+    tbody: Optional[sw.Html] = None
+    "The body of the table containing all the rows"
+
+    rows: Dict[str, Union[BaseRow, LayerRow, VectorRow]] = {}
+    "The rows currently displayed in the table, indexed by the model_id of their layer"
+
+    vector_header: Optional[HeaderRow] = None
+    "The header of the vector rows"
+
+    layer_header: Optional[HeaderRow] = None
+    "The header of the layer rows"
+
+    base_header: Optional[HeaderRow] = None
+    "The header of the basemap rows"
+
+    empty_row: Optional[sw.Html] = None
+    "The empty row closing the table"
+
     def __init__(self, m: Map, **kwargs) -> None:
         """Richer layerControl to add some controls over the lyers displayed on the map.
 
@@ -186,21 +229,59 @@ class LayersControl(MenuControl):
         # set the height according to the content
         self.set_size(min_height=None, max_height=None)
 
+        # create the static elements of the table, only the rows will be updated
+        self.rows = {}
+        self.vector_header = HeaderRow(ms.layer_control.vector.header)
+        self.layer_header = HeaderRow(ms.layer_control.layer.header)
+        self.base_header = HeaderRow(ms.layer_control.basemap.header)
+        empy_cell = sw.Html(tag="td", children=[" "], attributes={"colspan": 3})
+        self.empty_row = sw.Html(tag="tr", class_="v-no-hever", children=[empy_cell])
+        self.tbody = sw.Html(tag="tbody", children=[])
+        table = sw.SimpleTable(children=[self.tbody], dense=True, class_="v-no-border")
+        self.group = sw.RadioGroup(v_model=None, children=[table])
+
+        # set the table as children of the widget
+        self.tile.children = [self.group]
+
         # update the table at instance creation
         self.update_table({})
 
         # add js behavior
         self.m.observe(self.update_table, "layers")
 
+    def _get_row(self, layer: Layer, klass: type) -> Union[BaseRow, LayerRow, VectorRow]:
+        """Get the row of a layer from the existing ones or create it.
+
+        Args:
+            layer: the layer displayed in the row
+            klass: the row class to use for this layer
+
+        Returns:
+            the row associated to the layer
+        """
+        if layer.model_id not in self.rows:
+            self.rows[layer.model_id] = klass(layer)
+
+        return self.rows[layer.model_id]
+
     def update_table(self, change: dict) -> None:
-        """Update the table content."""
+        """Update the table content.
+
+        Only the rows of the added layers are created and the rows of the removed layers are unlinked from them and closed. Existing rows are reordered.
+        """
+        # drop the rows of the layers that are not on the map anymore
+        model_ids = [lyr.model_id for lyr in self.m.layers]
+        for model_id in [k for k in self.rows if k not in model_ids]:
+            row = self.rows.pop(model_id)
+            row.unlink()
+            row.close()
+
         # create the vector line
         vectors = [lyr for lyr in reversed(self.m.layers) if isinstance(lyr, GeoJSON)]
         vector_rows = []
         if len(vectors) > 0:
-            head = [HeaderRow(ms.layer_control.vector.header)]
-            rows = [VectorRow(lyr) for lyr in vectors]
-            vector_rows = head + rows
+            rows = [self._get_row(lyr, VectorRow) for lyr in vectors]
+            vector_rows = [self.vector_header] + rows
 
         # create a table of layerLine
         layers = [
@@ -210,9 +291,8 @@ class LayersControl(MenuControl):
         ]
         layer_rows = []
         if len(layers) > 0:
-            head = [HeaderRow(ms.layer_control.layer.header)]
-            rows = [LayerRow(lyr) for lyr in layers]
-            layer_rows = head + rows
+            rows = [self._get_row(lyr, LayerRow) for lyr in layers]
+            layer_rows = [self.layer_header] + rows
 
         # create another table of basemapLine it should always be a basemap
         # the error raised if you delete the last one is a feature
@@ -220,18 +300,13 @@ class LayersControl(MenuControl):
         base_rows = []
         current = next((lyr for lyr in bases if lyr.visible is True), SimpleNamespace(name=None))
         if len(bases) > 0:
-            head = [HeaderRow(ms.layer_control.basemap.header)]
-            empy_cell = sw.Html(tag="td", children=[" "], attributes={"colspan": 3})
-            empty_row = sw.Html(tag="tr", class_="v-no-hever", children=[empy_cell])
-            rows = [BaseRow(lyr) for lyr in bases] + [empty_row]
-            base_rows = head + rows
-
-        # create a table from these rows and wrap it in the radioGroup
-        tbody = sw.Html(tag="tbody", children=vector_rows + layer_rows + base_rows)
-        table = sw.SimpleTable(children=[tbody], dense=True, class_="v-no-border")
-        self.group = sw.RadioGroup(v_model=current.name, children=[table])
-
-        # set the table as children of the widget
-        self.tile.children = [self.group]
+            rows = [self._get_row(lyr, BaseRow) for lyr in bases]
+            base_rows = [self.base_header] + rows + [self.empty_row]
+
+        # only send the new order of the rows to the frontend
+        children = vector_rows + layer_rows + base_rows
+        if children != self.tbody.children:
+            self.tbody.children = children
+        self.group.v_model = current.name
 
         return
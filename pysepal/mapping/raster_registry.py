@@ -0,0 +1,277 @@
+"""Registry of the local raster files displayed on a ``SepalMap``.
+
+Each file is opened only once and its metadata are kept in memory so that the map, the inspector and the colorbar can reuse them without reading the file again.
+"""
+
+import logging
+import math
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# rasterio is only imported when the first raster is opened
+if TYPE_CHECKING:
+    from rasterio.io import DatasetReader
+    from rasterio.vrt import WarpedVRT
+
+__all__ = ["RasterInfo", "RasterRegistry"]
+
+log = logging.getLogger("sepalui.mapping.raster_registry")
+
+EPSG_4326 = "EPSG:4326"
+"the CRS used by the map to display the data"
+
+STRETCH_SIZE = 1024
+"the maximum size in pixels of the decimated image read to compute the stretch"
+
+
+@dataclass(frozen=True)
+class RasterInfo:
+    """Immutable metadata of a local raster file.
+
+    Attributes:
+        path: the absolute path to the file
+        bounds: the bounds of the image as (minx, miny, maxx, maxy) in EPSG:4326
+        crs: the native CRS of the image as a string
+        count: the number of bands
+        dtype: the data type of the first band
+        nodata: the nodata value of the image if any
+        overviews: the decimation factors of the overviews embedded in the file
+    """
+
+    path: str
+    bounds: Tuple[float, float, float, float]
+    crs: str
+    count: int
+    dtype: str
+    nodata: Optional[float]
+    overviews: Tuple[int, ...]
+
+
+class _RasterEntry:
+
+    info: RasterInfo
+    "the metadata of the raster"
+
+    dataset: "DatasetReader"
+    "the opened rasterio dataset"
+
+    vrt: "Optional[WarpedVRT]" = None
+    "the lazily created view of the dataset in EPSG:4326"
+
+    ref_count: int = 0
+    "the number of layers using the raster"
+
+    def __init__(self, path: str) -> None:
+        """Open the dataset and extract its metadata.
+
+        Args:
+            path: the absolute path to the file
+        """
+        import rasterio as rio
+        from rasterio.warp import transform_bounds
+
+        self.dataset = rio.open(path)
+        src = self.dataset
+        bounds = transform_bounds(src.crs, EPSG_4326, *src.bounds) if src.crs else src.bounds
+        self.info = RasterInfo(
+            path=path,
+            bounds=tuple(bounds),
+            crs=src.crs.to_string() if src.crs else "",
+            count=src.count,
+            dtype=src.dtypes[0],
+            nodata=src.nodata,
+            overviews=tuple(src.overviews(1)),
+        )
+
+    def close(self) -> None:
+        """Close the dataset and its EPSG:4326 view."""
+        not self.vrt or self.vrt.close()
+        self.dataset.close()
+
+        return
+
+
+class RasterRegistry:
+
+    _entries: Dict[str, _RasterEntry] = {}
+    "the opened rasters indexed by their absolute path"
+
+    _stretches: Dict[tuple, Tuple[float, float]] = {}
+    "the computed stretches indexed by (path, modification time, band, percentiles)"
+
+    def __init__(self) -> None:
+        """Keep track of the local rasters opened by a map.
+
+        Rasters are opened once when a layer is added and closed when the last layer using them is removed.
+        """
+        self._entries = {}
+        self._stretches = {}
+
+    @staticmethod
+    def _key(image: Union[str, Path]) -> str:
+        """Normalize the path used as a key of the registry."""
+        return str(Path(image).resolve())
+
+    def _get(self, image: Union[str, Path]) -> _RasterEntry:
+        """Get the entry of an image acquired by a layer."""
+        key = self._key(image)
+        if key not in self._entries:
+            raise ValueError(f"The raster {key} is not registered, acquire it first")
+
+        return self._entries[key]
+
+    @contextmanager
+    def _open(self, image: Union[str, Path]) -> Iterator[_RasterEntry]:
+        """Get the entry of an image, the file is only opened for this context if no layer uses it."""
+        key = self._key(image)
+        if key in self._entries:
+            yield self._entries[key]
+            return
+
+        entry = _RasterEntry(key)
+        try:
+            yield entry
+        finally:
+            entry.close()
+
+    def acquire(self, image: Union[str, Path]) -> RasterInfo:
+        """Register a new layer using the image.
+
+        Args:
+            image: the path to the raster file
+
+        Returns:
+            the metadata of the raster
+        """
+        key = self._key(image)
+        if key not in self._entries:
+            log.debug(f"opening raster {key}")
+            self._entries[key] = _RasterEntry(key)
+
+        entry = self._entries[key]
+        entry.ref_count += 1
+
+        return entry.info
+
+    def release(self, image: Union[str, Path]) -> None:
+        """Unregister a layer using the image and close the file if it's not used anymore.
+
+        Args:
+            image: the path to the raster file
+        """
+        key = self._key(image)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        entry.ref_count -= 1
+        if entry.ref_count <= 0:
+            log.debug(f"closing raster {key}")
+            self._entries.pop(key).close()
+
+        return
+
+    def info(self, image: Union[str, Path]) -> RasterInfo:
+        """Get the metadata of an image.
+
+        If the image is not acquired, the file is only opened to read the metadata.
+
+        Args:
+            image: the path to the raster file
+
+        Returns:
+            the metadata of the raster
+        """
+        with self._open(image) as entry:
+            return entry.info
+
+    def dataset(self, image: Union[str, Path]) -> "DatasetReader":
+        """Get the opened dataset of an acquired image.
+
+        Args:
+            image: the path to the raster file
+
+        Returns:
+            the rasterio dataset in its native CRS
+        """
+        return self._get(image).dataset
+
+    def warped(self, image: Union[str, Path]) -> "Union[DatasetReader, WarpedVRT]":
+        """Get a view of an acquired image in EPSG:4326.
+
+        The view is a virtual dataset, pixels are only reprojected when they are read.
+
+        Args:
+            image: the path to the raster file
+
+        Returns:
+            the dataset itself if it's already in EPSG:4326 else a warped view of it
+        """
+        entry = self._get(image)
+        if entry.dataset.crs == EPSG_4326:
+            return entry.dataset
+
+        if entry.vrt is None:
+            from rasterio.vrt import WarpedVRT
+
+            entry.vrt = WarpedVRT(entry.dataset, crs=EPSG_4326)
+
+        return entry.vrt
+
+    def stretch(
+        self,
+        image: Union[str, Path],
+        band: int = 1,
+        percentiles: Sequence[float] = (2, 98),
+    ) -> Optional[Tuple[float, float]]:
+        """Compute approximate min/max values of a band from its percentiles.
+
+        The band is read at a decimated resolution (at most ``STRETCH_SIZE`` pixels on each side) so that GDAL uses the smallest adequate overview instead of the full resolution data. The result is cached until the file is modified. If the image is not acquired, the file is only opened to compute the stretch.
+
+        Args:
+            image: the path to the raster file
+            band: the index of the band starting at 1
+            percentiles: the lower and upper percentiles to use as min and max
+
+        Returns:
+            the (min, max) values of the band or None if the band only contains nodata
+        """
+        key = self._key(image)
+        cache_key = (key, Path(key).stat().st_mtime, band, tuple(percentiles))
+        if cache_key not in self._stretches:
+            from rasterio.enums import Resampling
+
+            with self._open(image) as entry:
+                src = entry.dataset
+                factor = max(1, math.ceil(max(src.width, src.height) / STRETCH_SIZE))
+                out_shape = (math.ceil(src.height / factor), math.ceil(src.width / factor))
+                data = src.read(
+                    band, out_shape=out_shape, masked=True, resampling=Resampling.nearest
+                )
+            values = data.compressed()
+            values = values[np.isfinite(values)] if values.dtype.kind == "f" else values
+
+            stretch = None
+            if values.size > 0:
+                vmin, vmax = np.percentile(values, percentiles)
+                stretch = (float(vmin), float(vmax))
+
+            log.debug(f"stretch of {key} band {band}: {stretch}")
+            self._stretches[cache_key] = stretch
+
+        return self._stretches[cache_key]
+
+    def close(self) -> None:
+        """Close all the opened rasters."""
+        [entry.close() for entry in self._entries.values()]
+        self._entries = {}
+
+        return
+
+    def __contains__(self, image: Union[str, Path]) -> bool:
+        """Check if an image is currently opened in the registry."""
+        return self._key(image) in self._entries
@@ -26,22 +26,16 @@ import math
 import random
 import string
 from pathlib import Path
-from typing import List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union, cast
 
 import ee
 import ipyleaflet as ipl
 import ipyvuetify as v
 import ipywidgets as widgets
-import matplotlib.pyplot as plt
 import numpy as np
-import rioxarray
 from deprecated.sphinx import deprecated
 from eeclient.client import EESession
 from ipyleaflet import TileLayer  # noqa: F401 - leave it here, it is used in the eval
-from localtileserver import TileClient, get_leaflet_tile_layer
-from matplotlib import colorbar
-from matplotlib import colors as mpc
-from rasterio.crs import CRS
 from typing_extensions import Self
 
 from pysepal import color as scolors
@@ -54,11 +48,17 @@ from pysepal.mapping.layer import EELayer
 from pysepal.mapping.layer_state_control import LayerStateControl
 from pysepal.mapping.layers_control import LayersControl
 from pysepal.mapping.legend_control import LegendControl
+from pysepal.mapping.raster_registry import RasterRegistry
+from pysepal.mapping.tile_client_pool import tile_client_pool
 from pysepal.mapping.zoom_control import ZoomControl
 from pysepal.message import ms
 from pysepal.scripts import decorator as sd
 from pysepal.scripts import utils as su
 
+# matplotlib and localtileserver are only imported when displaying local rasters
+if TYPE_CHECKING:
+    from matplotlib import colors as mpc
+
 __all__ = ["SepalMap"]
 
 import logging
@@ -86,6 +86,9 @@ class SepalMap(ipl.Map):
     state: Optional[sw.StateBar] = None
     "The statebar to inform the user about tile loading"
 
+    raster_registry: Optional[RasterRegistry] = None
+    "The registry of the local rasters displayed on the map"
+
     def __init__(
         self,
         basemaps: List[str] = [],
@@ -161,6 +164,9 @@ class SepalMap(ipl.Map):
                 self.gee_interface = GEEInterface(session=gee_session)
             su.init_ee()
 
+        # keep track of the local rasters opened by the map
+        self.raster_registry = RasterRegistry()
+
         # add the basemaps
         self.clear()
         if theme_toggle:
@@ -306,14 +312,10 @@ class SepalMap(ipl.Map):
             layer: the localTile layer to zoom on. it needs to embed the "raster" member
             zoom_out: Zoom out the bounding zoom
         """
-        da = rioxarray.open_rasterio(layer.raster, masked=True)
+        # the bounds are computed in EPSG:4326 when the raster is registered
+        bounds = self.raster_registry.info(layer.raster).bounds
 
-        # unproject if necessary
-        epsg_4326 = "EPSG:4326"
-        if da.rio.crs != CRS.from_string(epsg_4326):
-            da = da.rio.reproject(epsg_4326)
-
-        return self.zoom_bounds(da.rio.bounds(), zoom_out)
+        return self.zoom_bounds(bounds, zoom_out)
 
     def zoom_bounds(self, bounds: Sequence[float], zoom_out: int = 1) -> Self:
         """Adapt the zoom to the given bounds. and center the image.
@@ -338,10 +340,11 @@ class SepalMap(ipl.Map):
         image: Union[str, Path],
         bands: Optional[Union[list, int]] = None,
         layer_name: str = "Layer_" + su.random_string(),
-        colormap: Union[str, mpc.Colormap] = "inferno",
+        colormap: Union[str, "mpc.Colormap"] = "inferno",
         opacity: float = 1.0,
         fit_bounds: bool = True,
         key: str = "",
+        stretch: Union[bool, Sequence[float]] = False,
     ) -> ipl.TileLayer:
         """Adds a local raster dataset to the map.
 
@@ -355,37 +358,40 @@ class SepalMap(ipl.Map):
             opacity: the opacity of the layer, default 1.0.
             key: the unequivocal key of the layer. by default use a normalized str of the layer name
             fit_bounds: Whether or not we should fit the map to the image bounds. Default to True.
+            stretch: Whether or not to stretch the displayed bands between their 2nd and 98th percentiles. The percentiles can also be set as a (lower, upper) tuple. They are approximated from the overviews of the image. Default to False.
 
         Returns:
             the local tile layer embedding the raster member (to be used with other tools of sepal-ui)
         """
+        import matplotlib.pyplot as plt
+        from localtileserver import get_leaflet_tile_layer
+        from matplotlib import colors as mpc
+
         # force cast to Path and then start the client
         image = Path(image)
 
         if not image.is_file():
             raise Exception(ms.mapping.no_image)
 
-        client = TileClient(image)
+        # the client is shared with all the other layers displaying the same file
+        client = tile_client_pool.acquire(image)
 
         # check inputs
         if layer_name in [layer.name for layer in self.layers]:
             layer_name = layer_name + su.random_string()
 
         # set the colors as independent colors
-        if isinstance(colormap, str):
-            cmap = plt.get_cmap(name=colormap)
+        cmap = plt.get_cmap(name=colormap) if isinstance(colormap, str) else colormap
         color_list = [mpc.rgb2hex(cmap(i)) for i in range(cmap.N)]
 
-        da = rioxarray.open_rasterio(image, masked=True)
-        # print
-        print(da)
-        da = da.chunk({"x": 1000, "y": 1000})
+        # read the metadata once, the file will stay open until the layer is removed
+        info = self.raster_registry.acquire(image)
 
         multi_band = False
-        if len(da.band) > 1 and not isinstance(bands, int):
+        if info.count > 1 and not isinstance(bands, int):
             multi_band = True
             bands = bands if bands else [3, 2, 1]
-        elif len(da.band) == 1:
+        elif info.count == 1:
             bands = 1
 
         if multi_band:
@@ -404,6 +410,23 @@ class SepalMap(ipl.Map):
                 ]
             }
 
+        # compute the display range of each band from the overviews of the image
+        stretch_kwargs = {}
+        stretches = [None] * len(style["bands"])
+        if stretch is not False:
+            percentiles = (2, 98) if stretch is True else tuple(stretch)
+            stretches = [
+                self.raster_registry.stretch(image, b["band"], percentiles) for b in style["bands"]
+            ]
+            if None not in stretches:
+                [b.update(min=s[0], max=s[1]) for b, s in zip(style["bands"], stretches)]
+                stretch_kwargs["vmin"] = (
+                    [s[0] for s in stretches] if multi_band else stretches[0][0]
+                )
+                stretch_kwargs["vmax"] = (
+                    [s[1] for s in stretches] if multi_band else stretches[0][1]
+                )
+
         # create the layer
         layer = get_leaflet_tile_layer(
             client,
@@ -412,12 +435,16 @@ class SepalMap(ipl.Map):
             opacity=opacity,
             max_zoom=20,
             max_native_zoom=20,
+            **stretch_kwargs,
         )
         self.add_layer(layer, key=key)
 
         # add the da to the layer as an extra member for the v_inspector
         layer.raster = str(image)
 
+        # keep the stretch of single band images to build the colorbar
+        layer.stretch = None if multi_band else stretches[0]
+
         # zoom on the layer if requested
         if fit_bounds is True:
             self.center = client.center()
@@ -429,8 +456,8 @@ class SepalMap(ipl.Map):
         self,
         colors: list,
         cmap: str = "viridis",
-        vmin: float = 0.0,
-        vmax: float = 1.0,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
         index: list = [],
         categorical: bool = False,
         step: int = 0,
@@ -444,8 +471,8 @@ class SepalMap(ipl.Map):
         Args:
             colors: The set of colors to be used for interpolation. Colors can be provided in the form: * tuples of RGBA ints between 0 and 255 (e.g: (255, 255, 0) or (255, 255, 0, 255)) * tuples of RGBA floats between 0. and 1. (e.g: (1.,1.,0.) or (1., 1., 0., 1.)) * HTML-like string (e.g: “#ffff00) * a color name or shortcut (e.g: “y” or “yellow”)
             cmap: a matplotlib colormap default to viridis
-            vmin: The minimal value for the colormap. Values lower than vmin will be bound directly to colors[0].. Defaults to 0.
-            vmax: The maximal value for the colormap. Values higher than vmax will be bound directly to colors[-1]. Defaults to 1.0.
+            vmin: The minimal value for the colormap. Values lower than vmin will be bound directly to colors[0].. Defaults to the stretch of the raster layer named layer_name if any, else 0.
+            vmax: The maximal value for the colormap. Values higher than vmax will be bound directly to colors[-1]. Defaults to the stretch of the raster layer named layer_name if any, else 1.0.
             index: The values corresponding to each color. It has to be sorted, and have the same length as colors. If None, a regular grid between vmin and vmax is created. Defaults to None.
             categorical (bool, optional): Whether or not to create a categorical colormap. Defaults to False.
             step: The step to split the LinearColormap into a StepColormap. Defaults to None.
@@ -453,9 +480,19 @@ class SepalMap(ipl.Map):
             layer_name: Layer name of the colorbar to be associated with. Defaults to None.
             kwargs: any other argument of the colorbar object from matplotlib
         """
+        import matplotlib.pyplot as plt
+        from matplotlib import colorbar
+        from matplotlib import colors as mpc
+
         width, height = 6.0, 0.4
         alpha = 1
 
+        # reuse the stretch computed when the raster was added
+        layer = self.find_layer(layer_name, none_ok=True) if layer_name else None
+        default_min, default_max = getattr(layer, "stretch", None) or (0.0, 1.0)
+        vmin = default_min if vmin is None else vmin
+        vmax = default_max if vmax is None else vmax
+
         if colors is not None:
             # transform colors in hex colors
             hexcodes = [su.to_colors(c) for c in colors]
@@ -709,6 +746,12 @@ class SepalMap(ipl.Map):
         if layer is not None:
             super().remove(layer)
 
+            # free the file handles and tile clients of local rasters
+            raster = getattr(layer, "raster", None)
+            if raster:
+                self.raster_registry.release(raster)
+                tile_client_pool.release(raster)
+
         return
 
     def remove_all(self, base: bool = False, keep_names: Optional[list[str]] = None) -> None:
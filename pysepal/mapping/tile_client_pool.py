@@ -0,0 +1,126 @@
+"""Pool of ``localtileserver`` clients shared by all the maps of the kernel.
+
+A single ``TileClient`` is created per raster file and reused by every layer displaying it. Clients that are not used anymore are kept warm in a small LRU so that re-adding a recently removed raster does not reopen it. The pool is thread-safe as Solara serves the sessions of the kernel from several threads.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Union
+
+# localtileserver is only imported when the first client is created
+if TYPE_CHECKING:
+    from localtileserver import TileClient
+
+__all__ = ["TileClientPool", "tile_client_pool"]
+
+log = logging.getLogger("sepalui.mapping.tile_client_pool")
+
+
+class TileClientPool:
+
+    max_idle: int = 8
+    "the maximum number of unused clients kept open"
+
+    _clients: "Dict[str, TileClient]" = {}
+    "the clients currently used by at least one layer, indexed by the absolute path of the file"
+
+    _ref_counts: Dict[str, int] = {}
+    "the number of layers using each client"
+
+    _idle: "OrderedDict[str, TileClient]" = OrderedDict()
+    "the unused clients ordered from the least to the most recently released"
+
+    def __init__(self, max_idle: int = 8) -> None:
+        """Reference-counted pool of tile clients.
+
+        Args:
+            max_idle: the maximum number of unused clients kept open
+        """
+        self.max_idle = max_idle
+        self._clients = {}
+        self._ref_counts = {}
+        self._idle = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(image: Union[str, Path]) -> str:
+        """Normalize the path used as a key of the pool."""
+        return str(Path(image).resolve())
+
+    def acquire(self, image: Union[str, Path]) -> "TileClient":
+        """Get the tile client of an image and register a new user.
+
+        Args:
+            image: the path to the raster file
+
+        Returns:
+            the shared client serving the image tiles
+        """
+        key = self._key(image)
+
+        with self._lock:
+            if key not in self._clients:
+                if key in self._idle:
+                    log.debug(f"reusing idle tile client for {key}")
+                    self._clients[key] = self._idle.pop(key)
+                else:
+                    from localtileserver import TileClient
+
+                    log.debug(f"creating tile client for {key}")
+                    self._clients[key] = TileClient(key)
+                self._ref_counts[key] = 0
+
+            self._ref_counts[key] += 1
+
+            return self._clients[key]
+
+    def release(self, image: Union[str, Path]) -> None:
+        """Unregister a user of the image tile client.
+
+        When the client is not used anymore it is moved to the idle LRU, the least recently used idle client is shut down if the LRU is full.
+
+        Args:
+            image: the path to the raster file
+        """
+        key = self._key(image)
+        evicted = []
+        with self._lock:
+            if key not in self._clients:
+                return
+
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key] > 0:
+                return
+
+            self._ref_counts.pop(key)
+            self._idle[key] = self._clients.pop(key)
+            while len(self._idle) > self.max_idle:
+                evicted.append(self._idle.popitem(last=False))
+
+        # shut down the evicted clients without blocking the other sessions
+        for old_key, client in evicted:
+            log.debug(f"shutting down tile client for {old_key}")
+            client.shutdown()
+
+        return
+
+    def clear(self) -> None:
+        """Shut down all the idle clients."""
+        with self._lock:
+            idle, self._idle = self._idle, OrderedDict()
+
+        [client.shutdown() for client in idle.values()]
+
+        return
+
+    def __contains__(self, image: Union[str, Path]) -> bool:
+        """Check if an image client is currently used by a layer."""
+        key = self._key(image)
+        with self._lock:
+            return key in self._clients
+
+
+tile_client_pool = TileClientPool()
+"the pool shared by all the maps of the kernel"
@@ -11,4 +11,4 @@ from pathlib import Path
 
 from pysepal.translator import Translator
 
-ms = Translator(Path(__file__).parent)
+ms = Translator(Path(__file__).parent, lazy=True)
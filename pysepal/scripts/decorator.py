@@ -6,6 +6,8 @@ used for multiple use-case sucha as (but not limited):
 - Initialize EE
 - debug widgets
 ...
+
+The decorated methods can be profiled with :py:data:`pysepal.scripts.profiler.profiler`.
 """
 
 import warnings
@@ -19,6 +21,7 @@ from deprecated.sphinx import versionadded
 
 from pysepal.message import ms
 from pysepal.scripts.gee import init_ee, need_ee  # noqa: F401 - backward compatibility
+from pysepal.scripts.profiler import profiler
 from pysepal.scripts.warning import SepalWarning
 
 
@@ -51,7 +54,7 @@ def catch_errors(alert: Optional[v.Alert] = None, debug: Optional[bool] = None)
             value = None
             try:
                 # Catch warnings in the process function
-                with warnings.catch_warnings(record=True) as w_list:
+                with warnings.catch_warnings(record=True) as w_list, profiler.profile(func):
                     value = func(self, *args, **kwargs)
 
                 # Check if there are warnings in the function and append them
@@ -127,7 +130,8 @@ def loading_button(
 
             try:
                 # run the function using the catch_error decorator
-                value = catch_errors(alert=alert_)(func)(self, *args, **kwargs)
+                with profiler.profile(func):
+                    value = catch_errors(alert=alert_)(func)(self, *args, **kwargs)
 
             except Exception as e:
                 button_.toggle_loading()
@@ -222,7 +226,8 @@ def switch(
 
             # execute the function and catch errors
             try:
-                func(self, *args, **kwargs)
+                with profiler.profile(func):
+                    func(self, *args, **kwargs)
 
             except Exception as e:
                 if debug:
@@ -0,0 +1,333 @@
+"""Local stand-in for the ``EESession`` used by :py:class:`GEEInterface`.
+
+It answers the requests of the interface without any connection to Earth Engine so that the number of round-trips of an action, the effect of the latency and the concurrency of the interface can be measured and tested offline.
+
+Example:
+    .. code-block:: python
+
+        from pysepal.scripts.fake_session import FakeEESession
+        from pysepal.scripts.gee_interface import GEEInterface
+
+        session = FakeEESession(latency=0.1, max_concurrent=5)
+        gee_interface = GEEInterface(session=session)
+
+        gee_interface.get_info_batch([1, 2, 3])
+        assert session.call_count("get_info") == 3
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import ee
+
+__all__ = ["FakeCall", "FakeEESession"]
+
+
+@dataclass(frozen=True)
+class FakeCall:
+    """A request received by the fake session.
+
+    Attributes:
+        method: the name of the operation e.g. "get_info"
+        kwargs: the arguments of the request
+        start: the time at which the request was received (``time.perf_counter``)
+        end: the time at which the response was sent (``time.perf_counter``)
+    """
+
+    method: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """The time spent by the request in the session, including the wait for a free slot."""
+        return self.end - self.start
+
+
+class FakeEESession:
+
+    latency: Union[float, Callable[[str], float]] = 0.0
+    "the time in seconds spent by each request, or a function of the method name returning it"
+
+    max_concurrent: Optional[int] = None
+    "the maximum number of requests processed at the same time, the others wait for a free slot"
+
+    responses: Dict[str, Any] = {}
+    "the responses of the operations by method name, a value, an exception to raise or a function of the request arguments"
+
+    assets: Dict[str, dict] = {}
+    "the assets stored in the session indexed by id"
+
+    task_list: Dict[str, dict] = {}
+    "the export tasks created in the session indexed by id"
+
+    calls: List[FakeCall] = []
+    "all the requests received by the session, in order of completion"
+
+    in_flight: int = 0
+    "the number of requests currently processed"
+
+    max_in_flight: int = 0
+    "the highest number of requests processed at the same time"
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[str], float]] = 0.0,
+        max_concurrent: Optional[int] = None,
+        responses: Optional[Dict[str, Any]] = None,
+        project: str = "fake-project",
+        task_state: str = "COMPLETED",
+    ) -> None:
+        """A fake ``EESession`` answering the requests of :py:class:`GEEInterface` locally.
+
+        It exposes the same ``operations``, ``export`` and ``tasks`` namespaces as ``eeclient``.
+        Assets are kept in memory: exports and folder creations add them to the store. ``get_info`` returns the requested object itself and ``get_map_id`` a local tile url unless a response is set for them.
+
+        Args:
+            latency: the time in seconds spent by each request, or a function of the method name returning it
+            max_concurrent: the maximum number of requests processed at the same time as the concurrent request quota of Earth Engine. Default to no limit.
+            responses: the responses of the operations by method name, a value, an exception to raise or a function of the request arguments
+            project: the name of the cloud project used to build the assets folder
+            task_state: the state of the export tasks returned by the session
+        """
+        self.latency = latency
+        self.max_concurrent = max_concurrent
+        self.responses = dict(responses or {})
+        self.project = project
+        self.task_state = task_state
+
+        self.assets = {}
+        self.task_list = {}
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        # the calls can be made from any GEEInterface loop
+        self._lock = threading.Lock()
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+        # same namespaces as the eeclient session
+        self.operations = SimpleNamespace(
+            get_info_async=self._get_info,
+            get_map_id_async=self._get_map_id,
+            get_asset_async=self._get_asset,
+            get_assets_async=self._get_assets,
+            create_folder_async=self._create_folder,
+        )
+        self.export = SimpleNamespace(
+            table_to_asset_async=self._export("table_to_asset", "TABLE"),
+            table_to_drive_async=self._export("table_to_drive"),
+            image_to_asset_async=self._export("image_to_asset", "IMAGE"),
+            image_to_drive_async=self._export("image_to_drive"),
+        )
+        self.tasks = SimpleNamespace(
+            get_task_async=self._get_task,
+            get_task_by_name_async=self._get_task_by_name,
+        )
+
+    def call_count(self, method: str = "") -> int:
+        """Count the requests received by the session.
+
+        Args:
+            method: the name of the operation to count. Default to all of them.
+
+        Returns:
+            the number of requests
+        """
+        return sum(1 for c in self.calls if not method or c.method == method)
+
+    def call_counts(self) -> Dict[str, int]:
+        """Count the requests received by the session for each operation.
+
+        Returns:
+            the number of requests by method name
+        """
+        return dict(Counter(c.method for c in self.calls))
+
+    def reset(self) -> None:
+        """Forget the recorded requests, the assets and the tasks are kept."""
+        with self._lock:
+            self.calls = []
+            self.max_in_flight = self.in_flight
+
+    async def get_assets_folder(self) -> str:
+        """Get the root folder of the assets of the project.
+
+        Returns:
+            the path of the folder
+        """
+        return await self._call("get_assets_folder", lambda: f"projects/{self.project}/assets/")
+
+    async def _call(self, method: str, default: Callable[..., Any], **kwargs) -> Any:
+        """Process a request: wait for a free slot, sleep the latency and build the response.
+
+        Args:
+            method: the name of the operation
+            default: the function building the default response from the request arguments
+            kwargs: the arguments of the request
+
+        Returns:
+            the response of the operation
+        """
+        start = time.perf_counter()
+        try:
+            async with self._slot():
+                with self._lock:
+                    self.in_flight += 1
+                    self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    latency = self.latency(method) if callable(self.latency) else self.latency
+                    await asyncio.sleep(latency)
+
+                    response = self.responses.get(method, default)
+                    if isinstance(response, Exception):
+                        raise response
+                    return response(**kwargs) if callable(response) else response
+                finally:
+                    with self._lock:
+                        self.in_flight -= 1
+        finally:
+            with self._lock:
+                self.calls.append(FakeCall(method, kwargs, start, time.perf_counter()))
+
+    def _slot(self) -> contextlib.AbstractAsyncContextManager:
+        """Get the semaphore limiting the concurrent requests in the running loop."""
+        if self.max_concurrent is None:
+            return contextlib.nullcontext()
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+
+        return self._semaphores[loop]
+
+    async def _get_info(
+        self, ee_object: Any = None, tag: Any = None, serialized_object: Any = None
+    ) -> Any:
+        """Return the requested object itself."""
+        return await self._call(
+            "get_info",
+            lambda ee_object, **kwargs: ee_object,
+            ee_object=ee_object,
+            tag=tag,
+            serialized_object=serialized_object,
+        )
+
+    async def _get_map_id(
+        self,
+        ee_image: Any,
+        vis_params: Optional[dict] = None,
+        bands: Optional[str] = None,
+        format: Optional[str] = None,
+    ) -> dict:
+        """Return a map id pointing to a local tile url."""
+
+        def map_id(**kwargs) -> dict:
+            mapid = f"fake-{len(self.calls)}"
+            url = f"http://localhost/{mapid}/{{z}}/{{x}}/{{y}}"
+            return {"mapid": mapid, "token": "", "tile_fetcher": SimpleNamespace(url_format=url)}
+
+        return await self._call(
+            "get_map_id",
+            map_id,
+            ee_image=ee_image,
+            vis_params=vis_params,
+            bands=bands,
+            format=format,
+        )
+
+    async def _get_asset(self, asset_id: str, not_exists_ok: bool = False) -> Optional[dict]:
+        """Return an asset of the store."""
+
+        def get_asset(asset_id: str, not_exists_ok: bool) -> Optional[dict]:
+            if asset_id in self.assets:
+                return self.assets[asset_id]
+            if not_exists_ok:
+                return None
+            raise ee.EEException(f"Asset '{asset_id}' not found.")
+
+        return await self._call(
+            "get_asset", get_asset, asset_id=asset_id, not_exists_ok=not_exists_ok
+        )
+
+    async def _get_assets(self, folder: str = "") -> List[dict]:
+        """Return the assets of the store located in a folder and its sub-folders."""
+
+        def get_assets(folder: str) -> List[dict]:
+            prefix = folder.rstrip("/") + "/" if folder else ""
+            return [a for id_, a in self.assets.items() if id_.startswith(prefix)]
+
+        return await self._call("get_assets", get_assets, folder=folder)
+
+    async def _create_folder(self, folder_path: str) -> dict:
+        """Add a folder to the store."""
+
+        def create_folder(folder_path: str) -> dict:
+            return self._add_asset(folder_path, "FOLDER")
+
+        return await self._call("create_folder", create_folder, folder_path=folder_path)
+
+    def _export(self, method: str, asset_type: str = "") -> Callable:
+        """Build the function exporting an object in the store.
+
+        Args:
+            method: the name of the export operation
+            asset_type: the type of the created asset, nothing is stored for drive exports
+
+        Returns:
+            the coroutine function of the export namespace
+        """
+
+        def export(**kwargs) -> dict:
+            if asset_type:
+                self._add_asset(kwargs["asset_id"], asset_type)
+
+            id_ = f"FAKE_TASK_{len(self.task_list)}"
+            description = kwargs.get("description", "")
+            task = {"id": id_, "name": description, "state": self.task_state, "type": method}
+            self.task_list[id_] = task
+
+            return task
+
+        async def export_async(**kwargs) -> dict:
+            return await self._call(method, export, **kwargs)
+
+        return export_async
+
+    async def _get_task(self, task_id: str) -> Optional[dict]:
+        """Return a task of the session from its id."""
+        return await self._call(
+            "get_task", lambda task_id: self.task_list.get(task_id), task_id=task_id
+        )
+
+    async def _get_task_by_name(self, name: str) -> Optional[dict]:
+        """Return the last task of the session with this description."""
+
+        def get_task_by_name(name: str) -> Optional[dict]:
+            tasks = [t for t in self.task_list.values() if t["name"] == name]
+            return tasks[-1] if tasks else None
+
+        return await self._call("get_task_by_name", get_task_by_name, name=name)
+
+    def _add_asset(self, asset_id: str, asset_type: str) -> dict:
+        """Add an asset to the store.
+
+        Args:
+            asset_id: the full id of the asset
+            asset_type: the type of asset from ["FOLDER", "IMAGE", "TABLE"]
+
+        Returns:
+            the description of the asset
+        """
+        asset = {"type": asset_type, "name": asset_id, "id": asset_id}
+        self.assets[asset_id] = asset
+
+        return asset
@@ -0,0 +1,34 @@
+"""Cached lookups in the GADM attribute table shipped with pygadm.
+
+The item lists of the administrative selectors are computed once per level and parent so that every widget of the kernel reuses them, in the same way as :py:mod:`pysepal.scripts.gaul` for GAUL. ``pygadm`` itself is only imported on first use.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from pysepal.scripts import utils as su
+
+
+@lru_cache(maxsize=512)
+def _items(level: int, parent: str) -> Tuple[Tuple[str, str], ...]:
+    """Compute the (text, value) pairs of a level once, see :py:func:`get_items`."""
+    import pygadm
+
+    items = su.names_to_items(pygadm.Names(admin=parent, content_level=level))
+
+    return tuple((i["text"], i["value"]) for i in items)
+
+
+def get_items(level: int, parent: str = "") -> List[Dict[str, str]]:
+    """Get the administrative areas of a level as items of a select component.
+
+    The lists are computed once per (level, parent) and shared by all the widgets of the kernel. Each call returns new dictionaries so that a widget modifying its items doesn't change the ones of the others.
+
+    Args:
+        level: the administrative level (0, 1 or 2)
+        parent: the GADM code of the parent area used to filter the list. Default to all areas of the level.
+
+    Returns:
+        the items sorted by name as {"text": name, "value": code}
+    """
+    return [{"text": t, "value": v} for t, v in _items(level, str(parent or ""))]
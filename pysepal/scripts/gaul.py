@@ -0,0 +1,137 @@
+"""Cached lookups in the FAO GAUL 2024 attribute table shipped with pygaul.
+
+The table is read once from the local parquet file and indexed by administrative code so that names and ISO codes can be resolved without any request to Earth Engine. ``pygaul`` itself is only imported on first use.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from pysepal.scripts import utils as su
+
+MAPPING: Path = Path(__file__).parents[1] / "data" / "gaul_iso.json"
+"GAUL -> ISO-3 mapping of country code, used for the disputed areas"
+
+LEVELS: Tuple[int, ...] = (0, 1, 2)
+"The administrative levels available in GAUL 2024"
+
+
+@lru_cache(maxsize=1)
+def iso_mapping() -> Dict[str, str]:
+    """Get the GAUL -> ISO-3 mapping of country codes.
+
+    Returns:
+        the ISO-3 code of each GAUL level 0 code
+    """
+    return json.loads(MAPPING.read_text())
+
+
+@lru_cache(maxsize=len(LEVELS))
+def admin_table(level: int) -> pd.DataFrame:
+    """Get the attribute table of all the administrative areas of a level.
+
+    Args:
+        level: the administrative level (0, 1 or 2)
+
+    Returns:
+        one row per area indexed by its GAUL code, including the names and codes of its parents
+    """
+    import pygaul
+
+    code = f"gaul{level}_code"
+    df = pygaul._df()
+    name = df[f"gaul{level}_name"]
+    df = df[name.notna() & (name != "")]
+
+    return df.drop_duplicates(subset=code).set_index(code, drop=False)
+
+
+def get_admin(admin: str, level: Optional[int] = None) -> Tuple[int, pd.Series]:
+    """Find an administrative area from its code.
+
+    If the level is not set, the levels are searched from the country to the smallest subdivision, in the same order as ``pygaul.Items``.
+
+    Args:
+        admin: the GAUL 2024 code of the area
+        level: the administrative level of the area if known
+
+    Returns:
+        the level of the area and its attributes
+    """
+    admin = str(admin)
+    for lvl in LEVELS if level is None else [level]:
+        table = admin_table(lvl)
+        if admin in table.index:
+            return lvl, table.loc[admin]
+
+    raise ValueError(f'The requested "{admin}" is not part of FAO GAUL 2024.')
+
+
+def get_iso(attributes: pd.Series) -> str:
+    """Get the ISO-3 code of the country of an administrative area.
+
+    Args:
+        attributes: the attributes of the area as returned by :py:func:`get_admin`
+
+    Returns:
+        the ISO-3 code, using the mapping for disputed areas and "UNK" if unknown
+    """
+    iso = attributes.get("iso3_code", "")
+
+    # 'x' prefix means disputed/unknown
+    if not isinstance(iso, str) or not iso or iso.startswith("x"):
+        iso = iso_mapping().get(str(attributes.get("gaul0_code", "")), "UNK")
+
+    return iso
+
+
+@lru_cache(maxsize=None)
+def get_admin_name(admin: str, level: Optional[int] = None) -> str:
+    """Build the name of an administrative area.
+
+    The name is the ISO-3 code of the country followed by the normalized names of the subdivisions e.g. "COL_Antioquia_Medellin".
+
+    Args:
+        admin: the GAUL 2024 code of the area
+        level: the administrative level of the area if known
+
+    Returns:
+        the name of the area usable as a file name
+    """
+    level, attributes = get_admin(admin, level)
+
+    names = [get_iso(attributes)]
+    for lvl in range(1, level + 1):
+        name = attributes.get(f"gaul{lvl}_name")
+        if isinstance(name, str) and name:
+            names.append(su.normalize_str(name))
+
+    return "_".join(names)
+
+
+@lru_cache(maxsize=512)
+def _items(level: int, parent: str) -> Tuple[Tuple[str, str], ...]:
+    """Compute the (text, value) pairs of a level once, see :py:func:`get_items`."""
+    import pygaul
+
+    items = su.names_to_items(pygaul.Names(admin=parent, content_level=level))
+
+    return tuple((i["text"], i["value"]) for i in items)
+
+
+def get_items(level: int, parent: str = "") -> List[Dict[str, str]]:
+    """Get the administrative areas of a level as items of a select component.
+
+    The lists are computed once per (level, parent) and shared by all the widgets of the kernel. Each call returns new dictionaries so that a widget modifying its items doesn't change the ones of the others.
+
+    Args:
+        level: the administrative level (0, 1 or 2)
+        parent: the GAUL 2024 code of the parent area used to filter the list. Default to all areas of the level.
+
+    Returns:
+        the items sorted by name as {"text": name, "value": code}
+    """
+    return [{"text": t, "value": v} for t, v in _items(level, str(parent or ""))]
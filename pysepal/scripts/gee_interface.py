@@ -1,7 +1,9 @@
 """GEEInterface class for Earth Engine operations."""
 
 import asyncio
+import functools
 import threading
+import time
 import traceback
 from pathlib import Path
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
@@ -16,21 +18,43 @@ from eeclient.tasks import Task
 
 from pysepal.logger import log
 from pysepal.scripts import gee
+from pysepal.scripts.gee_metrics import GEEMetrics
 from pysepal.scripts.gee_task import GEETask, R, TaskState
 
 
+def _metered(func: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
+    """Record each call of an async request method in the metrics of the interface."""
+    method = func.__name__.removesuffix("_async")
+
+    @functools.wraps(func)
+    async def wrapper(self: "GEEInterface", *args, **kwargs) -> Any:
+        with self.metrics.measure(method) as record:
+            record["result"] = await func(self, *args, **kwargs)
+        return record["result"]
+
+    return wrapper
+
+
 class GEEInterface:
-    def __init__(self, session: Optional[EESession] = None, use_sepal_headers=False):
+    def __init__(
+        self,
+        session: Optional[EESession] = None,
+        use_sepal_headers=False,
+        metrics: Optional[GEEMetrics] = None,
+    ):
         """A unified interface for Earth Engine operations.
 
         If a session is provided at initialization, custom EESession-based calls are used.
         Otherwise, the default Earth Engine API methods are invoked.
+        Every request is recorded in the ``metrics`` member (counts, latencies, traces).
+        Pass the same :py:class:`GEEMetrics` to several interfaces to aggregate their requests.
         """
         if use_sepal_headers:
             sepal_headers = get_sepal_headers_from_auth()
             session = EESession(sepal_headers)
 
         self.session = session
+        self.metrics = metrics or GEEMetrics()
         self._closed = False
 
         self._async_loop = asyncio.new_event_loop()
@@ -107,9 +131,14 @@ class GEEInterface:
         log.debug(f"Running sync coroutine: {coro}")
 
         try:
-            future = asyncio.run_coroutine_threadsafe(coro, self._async_loop)
+            # the coroutine runs in the GEE thread, keep it in the trace of the caller
+            start = time.perf_counter()
+            future = asyncio.run_coroutine_threadsafe(self.metrics.bind(coro), self._async_loop)
             result = future.result(timeout=timeout)
-            log.debug(f"Sync coroutine completed successfully: {operation}")
+            log.debug(
+                f"Sync coroutine completed successfully: {operation} "
+                f"in {time.perf_counter() - start:.3f}s"
+            )
             return result
         except asyncio.TimeoutError as e:
             log.error(f"Timeout ({timeout}s) running coroutine: {operation}")
@@ -124,6 +153,21 @@ class GEEInterface:
             # Re-raise the original exception to preserve the stack trace
             raise
 
+    def run(self, coro: Coroutine[Any, Any, R], timeout: Optional[float] = 305.0) -> R:
+        """Run a coroutine in the loop of the interface and wait for its result.
+
+        Use it to call from a synchronous context a function that chains several async requests of the interface.
+
+        Args:
+            coro: the coroutine to run
+            timeout: the maximum time to wait for the result in seconds
+
+        Returns:
+            the result of the coroutine
+        """
+        return self._run_async_blocking(coro, timeout)
+
+    @_metered
     async def get_info_async(
         self, ee_object: ee.ComputedObject = None, tag: Any = None, serialized_object=None
     ) -> Dict:
@@ -149,6 +193,7 @@ class GEEInterface:
         """Synchronously get info for multiple Earth Engine objects in batch."""
         return self._run_async_blocking(self.get_info_batch_async(ee_objects), timeout)
 
+    @_metered
     async def get_map_id_async(
         self,
         ee_image: ee.Image,
@@ -167,6 +212,7 @@ class GEEInterface:
             log.error(f"Failed to get map ID for EE image: {type(e).__name__}: {e}")
             raise
 
+    @_metered
     async def get_asset_async(self, asset_id: str, not_exists_ok: bool = False) -> Dict:
         """Asynchronously get an asset by its ID."""
         try:
@@ -187,6 +233,7 @@ class GEEInterface:
                 return None
             raise
 
+    @_metered
     async def get_assets_async(self, folder: str = "") -> List[Dict]:
         """Asynchronously get assets in a specified folder."""
         if self.session:
@@ -195,11 +242,18 @@ class GEEInterface:
         return await asyncio.to_thread(gee.get_assets, folder)
 
     async def get_folder_async(self) -> str:
-        """Asynchronously get the assets folder path."""
+        """Asynchronously get the assets folder path.
+
+        The session already knows its project so only the lookup of the default project is recorded in the metrics.
+        """
         if self.session:
             return await self.session.get_assets_folder()
-        return f"projects/{gee.get_ee_project()}/assets/"
 
+        with self.metrics.measure("get_folder") as record:
+            record["result"] = f"projects/{gee.get_ee_project()}/assets/"
+        return record["result"]
+
+    @_metered
     async def export_table_to_asset_async(
         self,
         collection: ee.FeatureCollection,
@@ -231,6 +285,7 @@ class GEEInterface:
             task.start()
             return task
 
+    @_metered
     async def export_table_to_drive_async(
         self,
         collection,
@@ -268,6 +323,7 @@ class GEEInterface:
             task.start()
             return task
 
+    @_metered
     async def is_running_async(self, name: str) -> bool:
         """Asynchronously check if a task is running by its name."""
         if self.session:
@@ -275,12 +331,14 @@ class GEEInterface:
             return bool(task and task["state"] in ("RUNNING", "READY"))
         return await asyncio.to_thread(gee.is_running, name)
 
+    @_metered
     async def get_task_async(self, task_id: str) -> Optional[Task]:
         """Asynchronously get a task by its ID."""
         if self.session:
             return await self.session.tasks.get_task_async(task_id)
         return await asyncio.to_thread(gee.get_task, task_id)
 
+    @_metered
     async def create_folder_async(self, folder_path: str) -> Dict:
         """Asynchronously create a folder in Earth Engine assets."""
         if self.session:
@@ -290,6 +348,7 @@ class GEEInterface:
             folder_path = str(Path(asset_path) / folder_path)
             return await asyncio.to_thread(ee.data.createAsset, {"type": "FOLDER"}, folder_path)
 
+    @_metered
     async def export_image_to_asset_async(
         self,
         image: ee.Image,
@@ -354,6 +413,7 @@ class GEEInterface:
             task.start()
             return task
 
+    @_metered
     async def export_image_to_drive_async(
         self,
         image: ee.Image,
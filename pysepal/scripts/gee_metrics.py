@@ -0,0 +1,336 @@
+"""Round-trip and latency instrumentation of the requests sent by :py:class:`GEEInterface`.
+
+Every request is counted per method with its latency, its outcome and optionally the size of its response. The requests made while a trace is open are also gathered in this trace so that the cost of a user action (e.g. "inspector click") can be read as the list of requests it triggered.
+
+Example:
+    .. code-block:: python
+
+        gee_interface = GEEInterface()
+
+        with gee_interface.metrics.trace("inspector click") as trace:
+            gee_interface.get_info(ee.Number(1))
+
+        trace.calls  # [TraceCall(method="get_info", ...)]
+        gee_interface.metrics.snapshot()["methods"]["get_info"]["count"]  # 1
+        print(gee_interface.metrics.to_prometheus())
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Coroutine, Deque, Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["BUCKETS", "GEEMetrics", "Trace", "TraceCall", "open_trace"]
+
+BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+"The upper bounds in seconds of the latency histogram buckets"
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("gee_trace", default=None)
+"The trace opened in the current context if any"
+
+
+@dataclass(frozen=True)
+class TraceCall:
+    """A request recorded in a trace.
+
+    Attributes:
+        method: the name of the GEEInterface method without the "_async" suffix
+        start: the time at which the request started (``time.perf_counter``)
+        duration: the latency of the request in seconds
+        error: the name of the exception raised by the request if any
+        payload: the size of the response in bytes if measured
+    """
+
+    method: str
+    start: float
+    duration: float
+    error: Optional[str] = None
+    payload: Optional[int] = None
+
+
+@dataclass
+class Trace:
+    """The requests sent during a user action.
+
+    Attributes:
+        name: the name of the action e.g. "inspector click"
+        start: the time at which the trace was opened (``time.perf_counter``)
+        end: the time at which the trace was closed, None while it's open
+        calls: the requests recorded in the trace
+        parent: the trace that was open when this one was opened, it records the same requests
+    """
+
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    calls: List[TraceCall] = field(default_factory=list)
+    parent: Optional["Trace"] = field(default=None, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """The duration of the action in seconds."""
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def round_trips(self) -> int:
+        """The number of requests sent during the action."""
+        return len(self.calls)
+
+
+@contextmanager
+def open_trace(name: str) -> Iterator[Trace]:
+    """Gather the requests sent in this context by any :py:class:`GEEInterface`.
+
+    Contrary to :py:meth:`GEEMetrics.trace`, the trace is not stored once closed. Traces can be nested, the requests are recorded in all the open ones.
+
+    Args:
+        name: the name of the traced action
+
+    Yields:
+        the trace, its calls are available during and after the context
+    """
+    trace = Trace(name, parent=_current_trace.get())
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.end = time.perf_counter()
+
+
+class _MethodMetrics:
+    """The aggregated metrics of a single method."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.payload_bytes = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def add(self, duration: float, error: bool, payload: Optional[int]) -> None:
+        self.count += 1
+        self.errors += error
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.payload_bytes += payload or 0
+        self.buckets[bisect_left(BUCKETS, duration)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.count if self.count else 0.0,
+            "max_time": self.max_time,
+            "payload_bytes": self.payload_bytes,
+            "buckets": dict(zip([*BUCKETS, float("inf")], self.buckets)),
+        }
+
+
+class GEEMetrics:
+
+    measure_payload: bool = False
+    "whether to measure the size of the responses (serialized as json)"
+
+    max_traces: int = 100
+    "the number of closed traces kept in memory"
+
+    in_flight: int = 0
+    "the number of requests currently running"
+
+    max_in_flight: int = 0
+    "the highest number of requests running at the same time"
+
+    traces: Deque[Trace]
+    "the last closed traces, from the oldest to the most recent"
+
+    def __init__(self, measure_payload: bool = False, max_traces: int = 100) -> None:
+        """Counters, latency histograms and traces of the Earth Engine requests.
+
+        A single object can be shared by several :py:class:`GEEInterface` to aggregate their requests.
+
+        Args:
+            measure_payload: whether to measure the size of the responses. It requires to serialize them in json so it's disabled by default.
+            max_traces: the number of closed traces kept in memory
+        """
+        self.measure_payload = measure_payload
+        self.max_traces = max_traces
+        self.traces = deque(maxlen=max_traces)
+
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodMetrics] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @contextmanager
+    def measure(self, method: str) -> Iterator[dict]:
+        """Record a request in the metrics and in the current trace.
+
+        Set the "result" key of the yielded dict to measure the size of the response.
+
+        Args:
+            method: the name of the request
+
+        Yields:
+            a dict to store the result of the request
+        """
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        record: Dict[str, Any] = {}
+        error = None
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            payload = self._payload(record["result"]) if "result" in record else None
+
+            with self._lock:
+                self.in_flight -= 1
+                self._methods.setdefault(method, _MethodMetrics()).add(
+                    duration, error is not None, payload
+                )
+
+            call = TraceCall(method, start, duration, error, payload)
+            trace = _current_trace.get()
+            while trace is not None:
+                trace.calls.append(call)
+                trace = trace.parent
+
+    @contextmanager
+    def trace(self, name: str) -> Iterator[Trace]:
+        """Gather all the requests sent in this context, from this thread or the GEE loop.
+
+        Args:
+            name: the name of the traced action
+
+        Yields:
+            the trace, its calls are available during and after the context
+        """
+        with open_trace(name) as trace:
+            try:
+                yield trace
+            finally:
+                with self._lock:
+                    self.traces.append(trace)
+
+    def bind(self, coro: Coroutine) -> Coroutine:
+        """Propagate the current trace to a coroutine that will run in another thread.
+
+        Args:
+            coro: the coroutine to run in the GEE loop
+
+        Returns:
+            the coroutine wrapped to run in the current trace, or the coroutine itself if no trace is open
+        """
+        trace = _current_trace.get()
+        if trace is None:
+            return coro
+
+        async def traced() -> Any:
+            token = _current_trace.set(trace)
+            try:
+                return await coro
+            finally:
+                _current_trace.reset(token)
+
+        return traced()
+
+    def snapshot(self) -> dict:
+        """Get a copy of all the metrics.
+
+        Returns:
+            the metrics of each method under "methods" and the in-flight gauges
+        """
+        with self._lock:
+            return {
+                "methods": {m: v.to_dict() for m, v in sorted(self._methods.items())},
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+
+    def reset(self) -> None:
+        """Clear the metrics and the traces, the running requests are kept in the gauge."""
+        with self._lock:
+            self._methods = {}
+            self.max_in_flight = self.in_flight
+            self.traces.clear()
+
+    def to_prometheus(self, prefix: str = "pysepal_gee") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: the prefix of the metric names
+
+        Returns:
+            the metrics as text, to be served on a /metrics endpoint or written to a file
+        """
+        snapshot = self.snapshot()
+        methods = snapshot["methods"]
+        lines = []
+
+        def header(name: str, type_: str, help_: str) -> None:
+            lines.extend([f"# HELP {prefix}_{name} {help_}", f"# TYPE {prefix}_{name} {type_}"])
+
+        header("requests_total", "counter", "Number of requests sent to Earth Engine.")
+        lines += [
+            f'{prefix}_requests_total{{method="{m}"}} {v["count"]}' for m, v in methods.items()
+        ]
+
+        header("request_errors_total", "counter", "Number of failed requests.")
+        lines += [
+            f'{prefix}_request_errors_total{{method="{m}"}} {v["errors"]}'
+            for m, v in methods.items()
+        ]
+
+        header("request_duration_seconds", "histogram", "Latency of the requests.")
+        duration = f"{prefix}_request_duration_seconds"
+        for m, v in methods.items():
+            cumulative = 0
+            for bound, count in v["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{duration}_bucket{{method="{m}",le="{le}"}} {cumulative}')
+            lines.append(f'{duration}_sum{{method="{m}"}} {v["total_time"]}')
+            lines.append(f'{duration}_count{{method="{m}"}} {v["count"]}')
+
+        if self.measure_payload:
+            header("response_bytes_total", "counter", "Size of the responses in bytes.")
+            lines += [
+                f'{prefix}_response_bytes_total{{method="{m}"}} {v["payload_bytes"]}'
+                for m, v in methods.items()
+            ]
+
+        header("requests_in_flight", "gauge", "Number of requests currently running.")
+        lines.append(f"{prefix}_requests_in_flight {snapshot['in_flight']}")
+
+        return "\n".join(lines) + "\n"
+
+    def _payload(self, result: Any) -> Optional[int]:
+        """Measure the size of a response if requested.
+
+        Args:
+            result: the response of the request
+
+        Returns:
+            the size of the json serialized response in bytes or None if not measured
+        """
+        if not self.measure_payload:
+            return None
+
+        try:
+            return len(json.dumps(result, default=str).encode())
+        except (TypeError, ValueError):
+            return None
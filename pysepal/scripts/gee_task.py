@@ -60,6 +60,7 @@ class GEETask(HasTraits, Generic[R]):
         self.key = key or function.__name__
         self._future: Optional[asyncio.Future] = None
         self._finally_callback = on_finally
+        self._run_id = 0
 
     @observe("state")
     def _on_state_change(self, change):
@@ -80,8 +81,11 @@ class GEETask(HasTraits, Generic[R]):
         self.progress = 0.0
         self.message = f"Starting task '{self.key}'"
 
-        # Schedule execution
-        future = asyncio.run_coroutine_threadsafe(self._run(*args, **kwargs), self.loop)
+        # Schedule execution, a previous run still ending won't touch this one
+        self._run_id += 1
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(self._run_id, *args, **kwargs), self.loop
+        )
         self._future = future
         return future
 
@@ -89,8 +93,11 @@ class GEETask(HasTraits, Generic[R]):
         """Log information about current thread context for debugging."""
         log.debug(f"[{operation}] GEE thread: {current_thread.name} (ID: {current_thread.ident})")
 
-    async def _run(self, *args, **kwargs) -> None:
-        """Run the user-provided coroutine, handling state transitions and exceptions."""
+    async def _run(self, run_id: int, *args, **kwargs) -> None:
+        """Run the user-provided coroutine, handling state transitions and exceptions.
+
+        Once the task has been restarted, the previous run ends without updating the state, the future or calling the final callback.
+        """
         try:
             self.state = TaskState.WAITING
             self.message = f"{self.key}: waiting to start"
@@ -111,35 +118,40 @@ class GEETask(HasTraits, Generic[R]):
             result = await self.function(*args, **kwargs)
 
             # Store result and update state
-            self.result = result
-            self.state = TaskState.FINISHED
-            self.message = f"{self.key}: completed successfully"
+            if run_id == self._run_id:
+                self.result = result
+                self.state = TaskState.FINISHED
+                self.message = f"{self.key}: completed successfully"
 
             return result
 
         except asyncio.CancelledError:
-            self.message = f"{self.key}: cancelled"
-            self.state = TaskState.CANCELLED
+            if run_id == self._run_id:
+                self.message = f"{self.key}: cancelled"
+                self.state = TaskState.CANCELLED
 
         except Exception as e:
             log.error(f"Error in task {self.key}: {e}")
             tb = traceback.format_exc()
             log.debug(tb)
 
-            self.error = e
-            self.message = f"{self.key}: error {e}"
-            self.state = TaskState.ERROR
+            if run_id == self._run_id:
+                self.error = e
+                self.message = f"{self.key}: error {e}"
+                self.state = TaskState.ERROR
 
         finally:
-            # Clean up future pointer
-            self._future = None
-            # Always call the final callback
-            if callable(self._finally_callback):
-                try:
-                    self._finally_callback()
-                except Exception as e:
-                    log.error(f"Final callback for task {self.key} raised: {e}")
-                    log.debug(traceback.format_exc())
+            # a newer run owns the future and the final callback
+            if run_id == self._run_id:
+                # Clean up future pointer
+                self._future = None
+                # Always call the final callback
+                if callable(self._finally_callback):
+                    try:
+                        self._finally_callback()
+                    except Exception as e:
+                        log.error(f"Final callback for task {self.key} raised: {e}")
+                        log.debug(traceback.format_exc())
 
     def cancel(self) -> None:
         """Cancel the running task."""
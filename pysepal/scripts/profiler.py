@@ -0,0 +1,253 @@
+"""Opt-in profiling of the widget callbacks wrapped by the sepal-ui decorators.
+
+When the profiler is enabled, every call of a method decorated with :py:func:`loading_button <pysepal.scripts.decorator.loading_button>`, :py:func:`catch_errors <pysepal.scripts.decorator.catch_errors>` or :py:func:`switch <pysepal.scripts.decorator.switch>` is measured: wall time, CPU time of the calling thread, number of requests sent to Earth Engine through a :py:class:`GEEInterface <pysepal.scripts.gee_interface.GEEInterface>` and number of synced widget traits changed. The measures are aggregated per function.
+
+The profiler is disabled by default and costs a single attribute check per call. It can be enabled from the code or by setting the ``PYSEPAL_PROFILE`` environment variable to ``1``, ``true`` or ``yes`` before starting the application.
+
+Example:
+    .. code-block:: python
+
+        from pysepal.scripts.profiler import profiler
+
+        profiler.enable()
+
+        # use the application
+
+        print(profiler.report())
+        profiler.dump("profile.json")
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, Optional, Union
+
+from pysepal.scripts.gee_metrics import open_trace
+
+__all__ = ["Profiler", "profiler"]
+
+_current_call: ContextVar[Optional["_Call"]] = ContextVar("profiled_call", default=None)
+"The profiled call running in the current context if any"
+
+
+class _Call:
+    """A running profiled call."""
+
+    def __init__(self, name: str, parent: Optional["_Call"]) -> None:
+        self.name = name
+        self.parent = parent
+        self.trait_syncs = 0
+
+
+class _FunctionStats:
+    """The aggregated measures of a single function."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.wall_time = 0.0
+        self.max_wall_time = 0.0
+        self.cpu_time = 0.0
+        self.ee_calls = 0
+        self.trait_syncs = 0
+
+    def add(self, wall: float, cpu: float, error: bool, ee_calls: int, trait_syncs: int) -> None:
+        self.calls += 1
+        self.errors += error
+        self.wall_time += wall
+        self.max_wall_time = max(self.max_wall_time, wall)
+        self.cpu_time += cpu
+        self.ee_calls += ee_calls
+        self.trait_syncs += trait_syncs
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wall_time": self.wall_time,
+            "mean_wall_time": self.wall_time / self.calls if self.calls else 0.0,
+            "max_wall_time": self.max_wall_time,
+            "cpu_time": self.cpu_time,
+            "ee_calls": self.ee_calls,
+            "trait_syncs": self.trait_syncs,
+        }
+
+
+class Profiler:
+
+    enabled: bool = False
+    "whether the decorated callbacks are currently measured"
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Aggregate the cost of the decorated callbacks per function.
+
+        The measures of a call include the ones of the profiled calls it triggers, so the time spent in a nested callback is counted in both.
+        Only the requests sent through a :py:class:`GEEInterface <pysepal.scripts.gee_interface.GEEInterface>` are counted as Earth Engine calls, direct calls to the ``ee`` API (e.g. ``getInfo``) are not.
+        The trait syncs are the changes of the ``sync=True`` traits of the widgets made from the calling thread, each one is a message sent to the frontend unless it's grouped in a ``hold_sync`` context.
+
+        Args:
+            enabled: whether to start measuring the callbacks right away
+        """
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _FunctionStats] = {}
+        self._notify_change: Optional[Callable] = None
+
+        if enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        """Start measuring the decorated callbacks."""
+        if self.enabled:
+            return
+
+        # count the synced trait changes of all the widgets
+        from ipywidgets import Widget
+
+        notify_change = Widget.notify_change
+
+        def profiled_notify_change(widget: Widget, change: dict) -> None:
+            if change["name"] in widget.keys:
+                call = _current_call.get()
+                while call is not None:
+                    call.trait_syncs += 1
+                    call = call.parent
+            notify_change(widget, change)
+
+        Widget.notify_change = profiled_notify_change
+        self._notify_change = notify_change
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop measuring the decorated callbacks, the measures are kept."""
+        if not self.enabled:
+            return
+
+        from ipywidgets import Widget
+
+        Widget.notify_change = self._notify_change
+        self._notify_change = None
+        self.enabled = False
+
+    def profile(self, func: Union[Callable, str]) -> ContextManager:
+        """Measure the code run in this context if the profiler is enabled.
+
+        Args:
+            func: the profiled function or the name under which the measures are aggregated
+
+        Returns:
+            the measuring context manager, a no-op one if the profiler is disabled
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+
+        name = func if isinstance(func, str) else f"{func.__module__}.{func.__qualname__}"
+
+        # decorators stacked on the same function are measured once
+        current = _current_call.get()
+        if current is not None and current.name == name:
+            return contextlib.nullcontext()
+
+        return self._measure(name)
+
+    @contextlib.contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        """Measure a call and add it to the stats of the function.
+
+        Args:
+            name: the name of the function
+        """
+        call = _Call(name, _current_call.get())
+        token = _current_call.set(call)
+        error = False
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            with open_trace(name) as trace:
+                yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            _current_call.reset(token)
+            with self._lock:
+                self._stats.setdefault(name, _FunctionStats()).add(
+                    wall, cpu, error, trace.round_trips, call.trait_syncs
+                )
+
+    def stats(self) -> Dict[str, dict]:
+        """Get a copy of the measures.
+
+        Returns:
+            the measures of each function sorted by decreasing total wall time
+        """
+        with self._lock:
+            stats = {n: s.to_dict() for n, s in self._stats.items()}
+
+        return dict(sorted(stats.items(), key=lambda i: i[1]["wall_time"], reverse=True))
+
+    def reset(self) -> None:
+        """Clear the measures."""
+        with self._lock:
+            self._stats = {}
+
+    def report(self) -> str:
+        """Format the measures as a text table.
+
+        Returns:
+            one line per function sorted by decreasing total wall time
+        """
+        columns = ["calls", "errors", "wall (s)", "mean (s)", "max (s)", "cpu (s)", "ee", "syncs"]
+        rows = [
+            [
+                name,
+                f"{s['calls']}",
+                f"{s['errors']}",
+                f"{s['wall_time']:.3f}",
+                f"{s['mean_wall_time']:.3f}",
+                f"{s['max_wall_time']:.3f}",
+                f"{s['cpu_time']:.3f}",
+                f"{s['ee_calls']}",
+                f"{s['trait_syncs']}",
+            ]
+            for name, s in self.stats().items()
+        ]
+
+        width = max([len("function"), *(len(r[0]) for r in rows)])
+        lines = ["function".ljust(width) + "".join(c.rjust(10) for c in columns)]
+        lines += [r[0].ljust(width) + "".join(c.rjust(10) for c in r[1:]) for r in rows]
+
+        return "\n".join(lines)
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """Write the measures to a json file.
+
+        Args:
+            path: the path to the destination file
+
+        Returns:
+            the path to the written file
+        """
+        path = Path(path)
+        path.write_text(json.dumps(self.stats(), indent=2))
+
+        return path
+
+
+def _env_enabled(name: str) -> bool:
+    """Check if a boolean environment variable is explicitly set to a true value.
+
+    Args:
+        name: the name of the environment variable
+
+    Returns:
+        True if the variable is set to "1", "true" or "yes" (case insensitive)
+    """
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes"}
+
+
+profiler = Profiler(enabled=_env_enabled("PYSEPAL_PROFILE"))
+"The profiler used by the sepal-ui decorators"
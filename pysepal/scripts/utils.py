@@ -1,22 +1,24 @@
 """All the helper function of sepal-ui."""
 
 import configparser
+import csv
 import math
 import random
 import re
 import string
 import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence, Tuple, Union
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
 import ee
 import ipyvuetify as v
+import pandas as pd
 import requests
 import tomli
 from anyascii import anyascii
 from deprecated.sphinx import deprecated, versionadded
-from matplotlib import colors as c
 
 import pysepal
 from pysepal.conf import config, config_file
@@ -28,6 +30,18 @@ from pysepal.scripts.warning import SepalWarning
 # Types
 Pathlike = Union[str, Path]
 
+CSV_SAMPLE_SIZE = 64 * 1024
+"The number of bytes read at the head of a csv file to guess its delimiter"
+
+CSV_CHUNK_THRESHOLD = 100 * 1024 * 1024
+"The size in bytes above which csv files are read by chunks"
+
+CSV_CHUNKSIZE = 1_000_000
+"The number of rows of each chunk when reading big csv files"
+
+LOCALES: Path = Path(__file__).parents[1] / "data" / "locale.parquet"
+"The path to the list of countries used by the locale selectors"
+
 
 def hide_component(widget: v.VuetifyWidget) -> v.VuetifyWidget:
     """Hide a vuetify based component.
@@ -128,7 +142,7 @@ def get_file_size(filename: Pathlike) -> str:
 def normalize_str(msg: str, folder: bool = True) -> str:
     """Normalize an str to make it compatible with file naming (no spaces, special chars ...etc).
 
-    Params:
+    Args:
         msg: the string to sanitise
         folder: if the name will be used for folder naming or for display. if display, <'> and < > characters will be kept
 
@@ -140,6 +154,42 @@ def normalize_str(msg: str, folder: bool = True) -> str:
     return re.sub(regex, "_", anyascii(msg))
 
 
+def normalize_series(msgs: pd.Series, folder: bool = True) -> pd.Series:
+    """Normalize all the str of a pandas Series at once, see :py:func:`normalize_str`.
+
+    Args:
+        msgs: the strings to sanitise
+        folder: if the names will be used for folder naming or for display. if display, <'> and < > characters will be kept
+
+    Returns:
+        the modified strings
+    """
+    regex = r"[^a-zA-Z\d\-_]" if folder else r"[^a-zA-Z\d\-_ ']"
+
+    # the transliteration is only needed for the non-ascii strings
+    msgs = msgs.astype(str)
+    ascii_ = msgs.map(str.isascii)
+    msgs = msgs.where(ascii_, msgs[~ascii_].map(anyascii))
+
+    return msgs.str.replace(regex, "_", regex=True)
+
+
+def names_to_items(df: pd.DataFrame) -> List[dict]:
+    """Convert a table of administrative names into items of a select component.
+
+    Args:
+        df: the table with the names in the first column and the codes in the second one
+
+    Returns:
+        the items sorted by name as {"text": name, "value": code}
+    """
+    df = df.sort_values(by=[df.columns[0]])
+    texts = normalize_series(df.iloc[:, 0], folder=False)
+    values = df.iloc[:, 1].astype(str)
+
+    return [{"text": t, "value": v} for t, v in zip(texts, values)]
+
+
 def to_colors(in_color: Union[str, Sequence], out_type: str = "hex") -> Union[str, tuple]:
     """Transform any color type into a color in the specified output format.
 
@@ -152,6 +202,8 @@ def to_colors(in_color: Union[str, Sequence], out_type: str = "hex") -> Union[st
     Returns:
         The color in the specified format. default to black.
     """
+    from matplotlib import colors as c
+
     # list of the color function used for the translation
     c_func = {"hex": c.to_hex}
     transform = c_func[out_type]
@@ -318,6 +370,69 @@ def geojson_to_ee(
     return
 
 
+def sniff_csv_delimiter(pathname: Pathlike) -> str:
+    """Guess the delimiter of a csv file from a small sample of its head.
+
+    Args:
+        pathname: the path to the csv file
+
+    Returns:
+        the delimiter of the file, "," if it cannot be guessed
+    """
+    with Path(pathname).open(newline="", errors="replace") as f:
+        sample = f.read(CSV_SAMPLE_SIZE)
+
+    # drop the last line that may be truncated
+    lines = sample.splitlines()
+    sample = "\n".join(lines[:-1] if len(lines) > 1 else lines)
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+
+def read_csv_header(pathname: Pathlike) -> List[str]:
+    """Read the column names of a csv file without reading its rows.
+
+    Args:
+        pathname: the path to the csv file
+
+    Returns:
+        the list of the column names
+    """
+    sep = sniff_csv_delimiter(pathname)
+
+    return pd.read_csv(pathname, sep=sep, nrows=0).columns.tolist()
+
+
+def read_csv_chunks(
+    pathname: Pathlike, usecols: Optional[Sequence[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """Read a csv file using the fastest available parser.
+
+    The delimiter is guessed from the head of the file. Small files are read at once with the pyarrow engine (falling back to the C engine), files bigger than ``CSV_CHUNK_THRESHOLD`` are read by chunks of ``CSV_CHUNKSIZE`` rows with the C engine to keep the memory footprint low.
+
+    Args:
+        pathname: the path to the csv file
+        usecols: the columns to read. default to all of them
+
+    Returns:
+        an iterator over the dataframe chunks
+    """
+    sep = sniff_csv_delimiter(pathname)
+    kwargs = {"sep": sep, "usecols": list(usecols) if usecols else None}
+
+    if Path(pathname).stat().st_size > CSV_CHUNK_THRESHOLD:
+        yield from pd.read_csv(pathname, chunksize=CSV_CHUNKSIZE, **kwargs)
+        return
+
+    try:
+        yield pd.read_csv(pathname, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        yield pd.read_csv(pathname, **kwargs)
+
+
 def check_input(input_: Any, msg: str = ms.utils.check_input.error) -> bool:
     r"""Check if the inpupt value is initialized.
 
@@ -462,3 +577,15 @@ need_ee = deprecated(version='3.0', reason="use pysepal.scripts.decorator.need_e
 loading_button = deprecated(version='3.0', reason="use pysepal.scripts.decorator.need_ee instead")(sd.loading_button)
 switch = deprecated(version='3.0', reason="use pysepal.scripts.decorator.switch instead")(sd.switch)
 # fmt: on
+
+
+@lru_cache(maxsize=1)
+def get_countries() -> pd.DataFrame:
+    """Read the list of countries used by the locale selectors.
+
+    The file is only read on first call and then shared by all the selectors.
+
+    Returns:
+        the country list as a df. columns [code, name, flag]
+    """
+    return pd.read_parquet(LOCALES)
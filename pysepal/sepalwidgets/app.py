@@ -58,9 +58,6 @@ __all__ = [
 
 
 class LocaleSelect(v.Menu, SepalWidget):
-    COUNTRIES: pd.DataFrame = pd.read_parquet(Path(__file__).parents[1] / "data" / "locale.parquet")
-    "the country list as a df. columns [code, name, flag]"
-
     FLAG: str = "https://flagcdn.com/{}.svg"
     "the url of the svg flag images"
 
@@ -127,6 +124,11 @@ class LocaleSelect(v.Menu, SepalWidget):
         jsdlink((self.language_list.children[0], "v_model"), (self, "value"))
         self.language_list.children[0].observe(self._on_locale_select, "v_model")
 
+    @property
+    def COUNTRIES(self) -> pd.DataFrame:
+        """The country list as a df. columns [code, name, flag]."""
+        return su.get_countries()
+
     def _get_country_items(self, locales: list) -> List[str]:
         """Get the list of countries as a list of listItem.
 
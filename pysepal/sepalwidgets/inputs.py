@@ -14,8 +14,9 @@ Example:
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import ee
 import geopandas as gpd
@@ -590,19 +591,20 @@ class LoadTableField(v.Col, SepalWidget):
         if path is None:
             return self
 
-        df = pd.read_csv(path, sep=None, engine="python")
+        # only read the header of the file
+        columns = su.read_csv_header(path)
 
-        if len(df.columns) < 3:
+        if len(columns) < 3:
             self._set_v_model("pathname", None)
             self.fileInput.selected_file.error_messages = ms.widgets.load_table.too_small
             return self
 
         # set the items
-        self.IdSelect.items = df.columns.tolist()
+        self.IdSelect.items = columns
 
         # pre load values that sounds like what we are looking for
         # it will only keep the first occurrence of each one
-        for name in reversed(df.columns.tolist()):
+        for name in reversed(columns):
             lname = name.lower()
             if "id" in lname:
                 self.IdSelect.v_model = name
@@ -1051,12 +1053,72 @@ class NumberField(v.TextField, SepalWidget):
         return
 
 
+@lru_cache(maxsize=32)
+def _vector_columns(pathname: str, mtime: float) -> Tuple[str, ...]:
+    """Read the column names of a vector file from its layer metadata.
+
+    Args:
+        pathname: the path to the vector file
+        mtime: the modification time of the file, to read it again once modified
+
+    Returns:
+        the names of the attribute columns
+    """
+    import pyogrio
+
+    return tuple(str(c) for c in pyogrio.read_info(pathname)["fields"])
+
+
+@lru_cache(maxsize=128)
+def _vector_values(pathname: str, mtime: float, column: str) -> Tuple[Any, ...]:
+    """Read the distinct values of a single column of a vector file, without the geometries.
+
+    Args:
+        pathname: the path to the vector file
+        mtime: the modification time of the file, to read it again once modified
+        column: the column to read
+
+    Returns:
+        the distinct values of the column
+    """
+    import pyogrio
+
+    df = pyogrio.read_dataframe(pathname, columns=[column], read_geometry=False)
+
+    return tuple(df[column].unique().tolist())
+
+
+_ASSET_CACHE_SIZE = 128
+"The number of asset columns and asset values lists kept in memory by each cache"
+
+_ASSET_COLUMNS_CACHE: Dict[str, List[str]] = {}
+"The column names of the assets indexed by asset id"
+
+_ASSET_VALUES_CACHE: Dict[Tuple[str, str, int], Optional[List[Any]]] = {}
+"The distinct values of the asset columns indexed by (asset id, column, max_values), None if there are more than max_values"
+
+
+def _cache_asset(cache: dict, key: Any, value: Any) -> None:
+    """Store an asset discovery, dropping the oldest ones above ``_ASSET_CACHE_SIZE``.
+
+    Args:
+        cache: one of the asset caches
+        key: the key of the discovery
+        value: the discovered columns or values
+    """
+    cache[key] = value
+    while len(cache) > _ASSET_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+
+    return
+
+
 class VectorField(v.Col, SepalWidget):
     original_gdf: Optional[gpd.GeoDataFrame] = None
     "The originally selected dataframe"
 
     df: Optional[pd.DataFrame] = None
-    "the original dataframe without the geometry (for column naming)"
+    "an empty dataframe with the columns of the selected file (for column naming)"
 
     gdf: Optional[gpd.GeoDataFrame] = None
     "The selected dataframe"
@@ -1088,12 +1150,16 @@ class VectorField(v.Col, SepalWidget):
     feature_collection: Optional[ee.FeatureCollection] = None
     "ee.FeatureCollection: the selected featureCollection"
 
+    max_values: int = 1000
+    "the maximum number of distinct values listed for an asset column"
+
     def __init__(
         self,
         label: str = ms.widgets.vector.label,
         gee: bool = False,
         gee_session: Optional[EESession] = None,
         gee_interface: Optional[GEEInterface] = None,
+        max_values: int = 1000,
         **kwargs,
     ) -> None:
         """A custom input widget to load vector data.
@@ -1107,6 +1173,7 @@ class VectorField(v.Col, SepalWidget):
             folder: When gee=True, extra args will be used for AssetSelect
             gee_session: the Earth Engine session to use (deprecated in favor of gee_interface)
             gee_interface: a shared GEEInterface instance. If provided, takes precedence over gee_session
+            max_values: the maximum number of distinct values listed for an asset column. Above it the user is asked to select another column.
             kwargs: any parameter from a v.Col. if set, 'children' will be overwritten.
 
         Raises:
@@ -1115,6 +1182,8 @@ class VectorField(v.Col, SepalWidget):
         .. versionadded:: 3.0.0
             Added gee_interface parameter for sharing GEEInterface instances across components.
         """
+        self.max_values = max_values
+
         # Validate input parameters
         if gee_session and gee_interface:
             raise ValueError(
@@ -1162,6 +1231,22 @@ class VectorField(v.Col, SepalWidget):
 
         super().__init__(**kwargs)
 
+        # the asset discoveries are run in the background and cancelled on re-selection
+        self._tasks: Dict[str, GEETask] = {}
+        if gee:
+            self._tasks["columns"] = self.gee_interface.create_task(
+                func=self._get_columns_async,
+                key="get_columns",
+                on_error=self._on_task_error,
+                on_finally=lambda: self._on_task_finally("columns", self.w_column),
+            )
+            self._tasks["values"] = self.gee_interface.create_task(
+                func=self._get_values_async,
+                key="get_values",
+                on_error=self._on_task_error,
+                on_finally=lambda: self._on_task_finally("values", self.w_value),
+            )
+
         # events
         self.w_file.observe(self._update_file, "v_model")
         self.w_column.observe(self._update_column, "v_model")
@@ -1173,12 +1258,16 @@ class VectorField(v.Col, SepalWidget):
 
         return self
 
-    @sd.switch("loading", on_widgets=["w_column", "w_value"])
     def _update_file(self, change: dict) -> Self:
         """Update the file name, the v_model and reset the other widgets."""
+        # stop the discoveries of the previous file
+        [task.cancel() for task in self._tasks.values()]
+
         # reset the widgets
         self.w_column.items, self.w_value.items = [], []
         self.w_column.v_model = self.w_value.v_model = None
+        self.w_column.loading = self.w_value.loading = False
+        self.w_value.error_messages = []
         self.df = None
         self.feature_collection = None
 
@@ -1190,23 +1279,43 @@ class VectorField(v.Col, SepalWidget):
             return self
 
         if isinstance(self.w_file, FileInput):
-            # read the file
-            self.df = gpd.read_file(change["new"], ignore_geometry=True)
-            columns = self.df.columns.to_list()
+            self._read_file_columns(change["new"])
 
         elif isinstance(self.w_file, AssetSelect):
             self.feature_collection = ee.FeatureCollection(change["new"])
-            columns = self.gee_interface.get_info(self.feature_collection.first())["properties"]
-            columns = [str(col) for col in columns if col not in ["system:index", "Shape_Area"]]
+            self.w_column.loading = True
+            self._tasks["columns"].start(asset_id=change["new"])
 
-        # update the columns
-        self.w_column.items = self.column_base_items + sorted(set(columns))
+        return self
 
+    @sd.switch("loading", on_widgets=["w_column", "w_value"])
+    def _read_file_columns(self, pathname: str) -> None:
+        """Read the columns from the layer metadata without reading any feature."""
+        columns = list(_vector_columns(pathname, Path(pathname).stat().st_mtime))
+        self.df = pd.DataFrame(columns=columns)
+        self._set_columns(columns)
+
+        return
+
+    async def _get_columns_async(self, asset_id: str) -> None:
+        """Read the columns of an asset from its first feature, without downloading its geometry."""
+        if asset_id not in _ASSET_COLUMNS_CACHE:
+            feature = ee.FeatureCollection(asset_id).first()
+            columns = await self.gee_interface.get_info_async(feature.propertyNames())
+            columns = [str(c) for c in columns if c not in ["system:index", "Shape_Area"]]
+            _cache_asset(_ASSET_COLUMNS_CACHE, asset_id, columns)
+
+        self._set_columns(_ASSET_COLUMNS_CACHE[asset_id])
+
+        return
+
+    def _set_columns(self, columns: List[str]) -> None:
+        """Update the column items and select all features."""
+        self.w_column.items = self.column_base_items + sorted(set(columns))
         self.w_column.v_model = "ALL"
 
-        return self
+        return
 
-    @sd.switch("loading", on_widgets=["w_value"])
     def _update_column(self, change: dict) -> Self:
         """Update the column name and empty the value list."""
         # set the value
@@ -1216,9 +1325,14 @@ class VectorField(v.Col, SepalWidget):
         if not change["new"]:
             return self
 
+        # stop the discovery of the previous column
+        "values" in self._tasks and self._tasks["values"].cancel()
+
         # reset value widget
         self.w_value.items = []
         self.w_value.v_model = ""
+        self.w_value.loading = False
+        self.w_value.error_messages = []
 
         # hide value if "ALL" or none
         if change["new"] in ["ALL", ""]:
@@ -1227,18 +1341,61 @@ class VectorField(v.Col, SepalWidget):
 
         # read the colmun
         if isinstance(self.w_file, FileInput):
-            values = self.df[change["new"]].to_list()
+            self._read_file_values(change["new"])
 
         elif isinstance(self.w_file, AssetSelect):
-            values = self.gee_interface.get_info(
-                self.feature_collection.distinct(change["new"]).aggregate_array(change["new"])
-            )
+            self.w_value.loading = True
+            su.show_component(self.w_value)
+            self._tasks["values"].start(asset_id=self.v_model["pathname"], column=change["new"])
+
+        return self
+
+    @sd.switch("loading", on_widgets=["w_value"])
+    def _read_file_values(self, column: str) -> None:
+        """Read the distinct values of a column of the selected file."""
+        pathname = self.v_model["pathname"]
+        mtime = Path(pathname).stat().st_mtime
+        self._set_values(_vector_values(pathname, mtime, column))
 
-        self.w_value.items = sorted(set(values))
+        return
+
+    async def _get_values_async(self, asset_id: str, column: str) -> None:
+        """Read at most ``max_values`` distinct values of a column of an asset."""
+        key = (asset_id, column, self.max_values)
+        if key not in _ASSET_VALUES_CACHE:
+            # ask for one more value to know if the limit is exceeded
+            distinct = ee.FeatureCollection(asset_id).distinct(column).limit(self.max_values + 1)
+            values = await self.gee_interface.get_info_async(distinct.aggregate_array(column))
+            values = None if len(values) > self.max_values else values
+            _cache_asset(_ASSET_VALUES_CACHE, key, values)
+
+        self._set_values(_ASSET_VALUES_CACHE[key])
+
+        return
+
+    def _set_values(self, values: Optional[Sequence[Any]]) -> None:
+        """Update the value items, None meaning that there are too many values to list them."""
+        if values is None:
+            self.w_value.error_messages = [ms.widgets.vector.too_many.format(self.max_values)]
+        else:
+            self.w_value.items = sorted(set(values))
 
         su.show_component(self.w_value)
 
-        return self
+        return
+
+    def _on_task_finally(self, name: str, widget: v.Select) -> None:
+        """Stop the loading state of a widget unless its task was cancelled by a new one."""
+        if self._tasks[name].state != TaskState.CANCELLED:
+            widget.loading = False
+
+        return
+
+    def _on_task_error(self, error: Exception) -> None:
+        """Display the error of a discovery task in the value widget."""
+        self.w_value.error_messages = [str(error)]
+
+        return
 
     def _update_value(self, change: dict) -> Self:
         """Update the value name and reduce the gdf."""
@@ -317,7 +317,6 @@ class LocaleSelect(v.VuetifyTemplate):
         str(Path(__file__).parents[1] / "sepalwidgets/vue/LocaleSelect.vue")
     ).tag(sync=True)
 
-    COUNTRIES: pd.DataFrame = pd.read_parquet(Path(__file__).parents[1] / "data" / "locale.parquet")
     available_locales = List([{"code": "en", "name": "English", "flag": "gb"}]).tag(sync=True)
     selected_locale = Unicode("en").tag(sync=True)
     value = Unicode().tag(sync=True)
@@ -335,6 +334,11 @@ class LocaleSelect(v.VuetifyTemplate):
 
         self.observe(self._on_locale_select, "selected_locale")
 
+    @property
+    def COUNTRIES(self) -> pd.DataFrame:
+        """The country list as a df. columns [code, name, flag]."""
+        return su.get_countries()
+
     def _on_locale_select(self, change: dict) -> None:
         """adapt the application to the newly selected language.
 
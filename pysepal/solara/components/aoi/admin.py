@@ -4,23 +4,22 @@ Functions for selecting and processing administrative boundaries using
 FAO GAUL 2024 data (both WFS for non-GEE and sat-io asset for GEE).
 """
 
-import json
+import warnings
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import geopandas as gpd
 import httpx
-import pandas as pd
 import pygaul
 
 from pysepal.message import ms
+from pysepal.scripts import gaul
 from pysepal.scripts import utils as su
-from pysepal.scripts.gee_interface import GEEInterface
 from pysepal.solara.components.aoi.aoi_result import AoiResult
 from pysepal.solara.components.aoi.constants import FAO_GAUL_LAYERS, FAO_WFS_BASE_URL
 
 # Path to GAUL -> ISO-3 mapping file
-GAUL_ISO_MAPPING: Path = Path(__file__).parents[3] / "data" / "gaul_iso.json"
+GAUL_ISO_MAPPING: Path = gaul.MAPPING
 
 _WFS_GEOMETRY_CACHE: Dict[str, gpd.GeoDataFrame] = {}
 _WFS_BOUNDS_CACHE: Dict[str, tuple] = {}
@@ -44,20 +43,6 @@ def _build_wfs_params(
     return params
 
 
-def _fetch_admin_names_from_pygaul(level: int, parent_code: Optional[str] = None) -> pd.DataFrame:
-    """Fetch administrative names from pygaul's local parquet file.
-
-    Args:
-        level: Administrative level (0, 1, or 2)
-        parent_code: Parent admin code for filtering (e.g., "62" for Colombia)
-
-    Returns:
-        DataFrame with columns [gaul{level}_name, gaul{level}_code]
-    """
-    df = pygaul.Names(admin=parent_code if parent_code else None, content_level=level)
-    return df.sort_values(by=[df.columns[0]]) if not df.empty else df
-
-
 async def _fetch_wfs_geometry_async(level: int, admin_code: str) -> gpd.GeoDataFrame:
     """Fetch administrative geometry from FAO WFS asynchronously.
 
@@ -151,7 +136,7 @@ def fetch_admin_items(
     Retrieves a list of administrative regions at the specified level,
     optionally filtered by a parent region code.
 
-    Uses pygaul's local GAUL 2024 parquet file for instant lookups (~1ms).
+    Uses pygaul's local GAUL 2024 parquet file, the lists are computed once per (level, parent).
 
     Args:
         level: Administrative level (0, 1, or 2)
@@ -171,17 +156,7 @@ def fetch_admin_items(
         regions = fetch_admin_items(level=1, parent_code="62")
         ```
     """
-    df = _fetch_admin_names_from_pygaul(level, parent_code or None)
-
-    name_col = df.columns[0]  # gaul{level}_name
-    code_col = df.columns[1]  # gaul{level}_code
-
-    item_list = []
-    for _, r in df.iterrows():
-        text = su.normalize_str(r[name_col], folder=False)
-        item_list.append({"text": text, "value": str(r[code_col])})
-
-    return item_list
+    return gaul.get_items(level, parent_code)
 
 
 async def process_admin(
@@ -203,7 +178,7 @@ async def process_admin(
         admin_code: The administrative code to fetch (GAUL 2024 code)
         gee: If True, use Earth Engine with sat-io's GAUL 2024 asset.
              If False, use FAO GAUL 2024 WFS service.
-        gee_interface: Optional GEEInterface for Earth Engine operations
+        gee_interface: Deprecated and ignored, the name is resolved locally without any EE request.
 
     Returns:
         AoiResult with gdf=None (geometry fetched lazily via get_gdf_async())
@@ -225,6 +200,12 @@ async def process_admin(
         result = await process_admin("ADMIN0", "62", gee=True)
         ```
     """
+    if gee_interface is not None:
+        warnings.warn(
+            '"gee_interface" is deprecated and ignored, the admin name is resolved locally',
+            DeprecationWarning,
+        )
+
     if not admin_code:
         raise ValueError(ms.aoi_sel.exception.no_admlyr)
 
@@ -237,32 +218,11 @@ async def process_admin(
         # Initialize Earth Engine
         su.init_ee()
 
-        # Use provided interface or create a new one
-        interface = gee_interface or GEEInterface()
-
         # Use pygaul.Items to get the feature collection (handles all the EE logic)
         feature_collection = pygaul.Items(admin=admin_code)
 
-        # Get properties for naming (async call)
-        feature = feature_collection.first()
-        properties = await interface.get_info_async(feature.toDictionary(feature.propertyNames()))
-
-        # Build name from ISO code and admin names
-        # GAUL 2024 uses: iso3_code, gaul0_name, gaul1_name, gaul2_name
-        iso = properties.get("iso3_code", "")
-        if not iso or iso.startswith("x"):  # 'x' prefix means disputed/unknown
-            iso_mapping = json.loads(GAUL_ISO_MAPPING.read_text())
-            gaul0_code = str(properties.get("gaul0_code", ""))
-            iso = iso_mapping.get(gaul0_code, "UNK")
-
-        # Collect admin names from all levels up to current
-        names = [iso]
-        for lvl in range(1, level + 1):
-            name_col = f"gaul{lvl}_name"
-            if name_col in properties and properties.get(name_col):
-                names.append(su.normalize_str(properties[name_col]))
-
-        name = "_".join(names)
+        # the name is resolved from the local GAUL table, no need to query EE
+        name = gaul.get_admin_name(admin_code, level)
 
         return AoiResult(
             method=method,
@@ -275,33 +235,8 @@ async def process_admin(
 
     else:
 
-        # Get admin info from pygaul's full parquet (includes iso3_code)
-        full_df = pygaul._df()
-        code_col = f"gaul{level}_code"
-        admin_rows = full_df[full_df[code_col] == str(admin_code)]
-
-        if admin_rows.empty:
-            raise ValueError(f"Admin code {admin_code} not found in GAUL 2024")
-
-        # Get first row for name building
-        row = admin_rows.iloc[0]
-
-        # Build name from ISO code and admin names
-        iso = row.get("iso3_code", "")
-        if not iso or (isinstance(iso, str) and iso.startswith("x")):
-            # Fall back to mapping file
-            iso_mapping = json.loads(GAUL_ISO_MAPPING.read_text())
-            gaul0_code = str(row.get("gaul0_code", ""))
-            iso = iso_mapping.get(gaul0_code, "UNK")
-
-        # Collect admin names from all levels up to current
-        names = [iso]
-        for lvl in range(1, level + 1):
-            name_col = f"gaul{lvl}_name"
-            if name_col in full_df.columns and row.get(name_col):
-                names.append(su.normalize_str(row[name_col]))
-
-        name = "_".join(names)
+        # Get admin info from pygaul's local parquet (includes iso3_code)
+        name = gaul.get_admin_name(admin_code, level)
 
         return AoiResult(
             method=method,
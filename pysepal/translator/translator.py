@@ -1,16 +1,26 @@
 """The translator object allow developer to support translation for their application."""
 
+import hashlib
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Set, Tuple, Union
 
-import pandas as pd
 from box import Box
 from deprecated.sphinx import deprecated, versionadded
 
+import pysepal
 from pysepal.conf import config_file
 
+CACHE_DIR: Path = Path.home() / ".cache" / "sepal-ui" / "translator"
+"The folder where the compiled translation bundles are stored"
+
+BUNDLE_VERSION: int = 1
+"The version of the bundle format, to increment every time the compilation changes"
+
 
 class Translator(Box):
 
@@ -23,11 +33,22 @@ class Translator(Box):
         "available_locales",
         "merge_dict",
         "delete_empty",
+        "_bundle_file",
+        "_prune_bundles",
+        "_compile",
+        "_pending",
+        "_load_namespace",
+        "_load_all",
+        "_flat_keys",
     ] + dir(Box)
     "keys that cannot be used as var names as they are protected for methods"
 
     def __init__(
-        self, json_folder: Union[str, Path], target: str = "", default: str = "en"
+        self,
+        json_folder: Union[str, Path],
+        target: str = "",
+        default: str = "en",
+        lazy: bool = False,
     ) -> None:
         """Python ``Box`` of ``Box`` representing all the nested translation key, value pairs.
 
@@ -47,34 +68,43 @@ class Translator(Box):
             json_folder: The folder where the dictionaries are stored
             target: The language code (IETF BCP 47) of the target lang (it should be the same as the target dictionary). Default to either the language specified in the parameter file or the default one.
             default: The language code (IETF BCP 47) of the source lang. default to "en" (it should be the same as the source dictionary)
+            lazy: Whether to box the top-level namespaces on first access instead of during the initialization. Default to False.
         """
-        # the name of the 5 variables that cannot be used as init keys
-        FORBIDDEN_KEYS = ["_folder", "_default", "_target", "_targeted", "_match"]
-
         # init the box with the folder
         folder = Path(json_folder)
 
-        # reading the default dict
-        default_dict = self.merge_dict(folder / default)
-
-        # create a dictionary in the target language
+        # find the language closest to the target
         targeted, target = self.find_target(folder, target)
         target = target or default
-        target_dict = self.merge_dict(folder / target)
 
         # evaluate the matching of requested and obtained values
         match = targeted == target
 
-        # create the composite dictionary
-        ms_dict = self._update(default_dict, target_dict)
-
-        # check if forbidden keys are being used
-        # this will raise an error if any
-        [self.search_key(ms_dict, k) for k in FORBIDDEN_KEYS + self._protected_keys]
-
-        # # unpack the json as a simple namespace
-        ms_json = json.dumps(ms_dict)
-        ms_boxes = json.loads(ms_json, object_hook=lambda d: Box(**d, frozen_box=True))
+        # read the precompiled bundle if the sources didn't change since last time
+        # else merge and validate them again and save the result for the next time
+        bundle = self._bundle_file(folder, default, target)
+        try:
+            ms_json = bundle.read_text()
+        except OSError:
+            ms_json = self._compile(folder, default, target)
+            try:
+                bundle.parent.mkdir(parents=True, exist_ok=True)
+                tmp = bundle.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(ms_json)
+                tmp.replace(bundle)
+                self._prune_bundles(bundle)
+            except OSError:
+                pass  # the cache folder is not writable, compile every time
+
+        # unpack the json as a simple namespace
+        # in lazy mode the namespaces are kept as dict until they are first accessed
+        if lazy:
+            ms_dict = json.loads(ms_json)
+            pending = {k: v for k, v in ms_dict.items() if isinstance(v, dict)}
+            ms_boxes = {k: v for k, v in ms_dict.items() if k not in pending}
+        else:
+            pending = {}
+            ms_boxes = json.loads(ms_json, object_hook=lambda d: Box(**d, frozen_box=True))
 
         private_keys = {
             "_folder": str(folder),
@@ -89,6 +119,129 @@ class Translator(Box):
         # it the meantime it's easy to call the translator using a frozen_box argument
         super(Box, self).__init__(**private_keys, **ms_boxes)
 
+        # stored as an attribute to stay out of the dictionary keys
+        object.__setattr__(self, "_pending", pending)
+
+    def __getitem__(self, item, _ignore_default=False):
+        """Box the lazy namespaces on first access, see :py:meth:`Box.__getitem__`."""
+        if isinstance(item, str) and item in self.__dict__.get("_pending", {}):
+            self._load_namespace(item)
+        return super().__getitem__(item, _ignore_default)
+
+    def __contains__(self, item) -> bool:
+        """Check the lazy namespaces as well, see :py:meth:`Box.__contains__`."""
+        return item in self.__dict__.get("_pending", {}) or super().__contains__(item)
+
+    def __len__(self) -> int:
+        """Count the lazy namespaces as well."""
+        return super().__len__() + len(self.__dict__.get("_pending", {}))
+
+    def __iter__(self):
+        """Box all the lazy namespaces before iterating over them."""
+        self._load_all()
+        return super().__iter__()
+
+    def keys(self, *args, **kwargs):
+        """Box all the lazy namespaces before listing them, see :py:meth:`Box.keys`."""
+        self._load_all()
+        return super().keys(*args, **kwargs)
+
+    def items(self, *args, **kwargs):
+        """Box all the lazy namespaces before listing them, see :py:meth:`Box.items`."""
+        self._load_all()
+        return super().items(*args, **kwargs)
+
+    def values(self):
+        """Box all the lazy namespaces before listing them."""
+        self._load_all()
+        return super().values()
+
+    def to_dict(self) -> dict:
+        """Box all the lazy namespaces before converting them, see :py:meth:`Box.to_dict`."""
+        self._load_all()
+        return super().to_dict()
+
+    def _load_namespace(self, key: str) -> None:
+        """Convert a lazy namespace into a frozen Box and store it in the translator.
+
+        Args:
+            key: the name of the top-level namespace
+        """
+        # set the value before removing it from the pending ones so that concurrent
+        # accesses always find it in one of them
+        value = self._pending.get(key)
+        if value is not None:
+            super(Box, self).__setitem__(key, Box(value, frozen_box=True))
+            self._pending.pop(key, None)
+
+    def _load_all(self) -> None:
+        """Box all the remaining lazy namespaces."""
+        for key in list(self.__dict__.get("_pending", {})):
+            self._load_namespace(key)
+
+    @staticmethod
+    def _bundle_file(folder: Path, default: str, target: str) -> Path:
+        """Get the path to the compiled bundle of the translation sources.
+
+        The name of the file starts with a hash of the folder and the languages, followed by a hash of the package version and of the modification times and sizes of the source files so any change in the sources or any upgrade of pysepal leads to a new bundle.
+
+        Args:
+            folder: the folder where the dictionaries are stored
+            default: the language code of the source lang
+            target: the language code of the target lang
+
+        Returns:
+            the path to the bundle in the cache folder
+        """
+        sources = f"{BUNDLE_VERSION}|{folder.resolve()}|{default}|{target}"
+        prefix = f"{default}_{target}_{hashlib.sha256(sources.encode()).hexdigest()[:8]}"
+
+        # the package version only changes the second hash so the bundles of a previous install are pruned
+        hash_ = hashlib.sha256(f"{sources}|{pysepal.__version__}".encode())
+        files = sorted({*(folder / default).glob("*.json"), *(folder / target).glob("*.json")})
+        for f in files:
+            stat = f.stat()
+            hash_.update(f"|{f.name}|{f.parent.name}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+
+        return CACHE_DIR / f"{prefix}_{hash_.hexdigest()[:16]}.json"
+
+    @staticmethod
+    def _prune_bundles(bundle: Path) -> None:
+        """Remove the bundles compiled from previous versions of the same sources.
+
+        Args:
+            bundle: the path to the up-to-date bundle
+        """
+        prefix = bundle.stem.rsplit("_", 1)[0]
+        [f.unlink(missing_ok=True) for f in bundle.parent.glob(f"{prefix}_*.json") if f != bundle]
+
+    def _compile(self, folder: Path, default: str, target: str) -> str:
+        """Merge the default and target dictionaries and check that they can be used.
+
+        Args:
+            folder: the folder where the dictionaries are stored
+            default: the language code of the source lang
+            target: the language code of the target lang
+
+        Returns:
+            the merged dictionary as a json string
+        """
+        # the name of the 5 variables that cannot be used as init keys
+        FORBIDDEN_KEYS = ["_folder", "_default", "_target", "_targeted", "_match"]
+
+        # reading the default dict and the dictionary in the target language
+        default_dict = self.merge_dict(folder / default)
+        target_dict = self.merge_dict(folder / target)
+
+        # create the composite dictionary
+        ms_dict = self._update(default_dict, target_dict)
+
+        # check if forbidden keys are being used
+        # this will raise an error if any
+        [self.search_key(ms_dict, k) for k in FORBIDDEN_KEYS + self._protected_keys]
+
+        return json.dumps(ms_dict)
+
     @versionadded(version="2.7.0")
     @staticmethod
     def find_target(folder: Path, target: str = "") -> Tuple[str, str]:
@@ -286,34 +439,51 @@ class Translator(Box):
         folder = Path(folder)
 
         # get all the python files recursively
-        py_files = []
-        all_files = [f for f in folder.glob("**/*") if f.suffix in [".py", ".ipynb"]]
-        for f in all_files:
-            generated_files = [".ipynb_checkpoints", "__pycache__"]
-            if all([err not in str(f) for err in generated_files]):
-                py_files.append(f)
+        generated_files = [".ipynb_checkpoints", "__pycache__"]
+        py_files = [
+            f
+            for f in folder.glob("**/*")
+            if f.suffix in [".py", ".ipynb"] and all(e not in str(f) for e in generated_files)
+        ]
 
-        # get the flat version of all keys
-        keys = list(set(pd.json_normalize(self).columns) ^ set(FORBIDDEN_KEYS))
+        # read each file only once and extract all the references to the translator
+        # e.g. "ms.a.b.c" in the code is returned as ".a.b.c"
+        pattern = re.compile(rf"\b{re.escape(name)}((?:\.\w+)+)")
 
-        # init the unused keys list
-        unused_keys = []
+        def references(f: Path) -> Set[str]:
+            return set(pattern.findall(f.read_text(errors="ignore")))
 
-        for k in keys:
+        with ThreadPoolExecutor() as executor:
+            refs = set().union(*executor.map(references, py_files))
 
-            # by default we consider that the is never used
-            is_present = False
+        # a reference uses the key it points to and all its parents namespaces
+        used_keys = set()
+        for ref in refs:
+            parts = ref[1:].split(".")
+            used_keys.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        # get the flat version of all keys
+        keys = self._flat_keys(self) - set(FORBIDDEN_KEYS)
 
-            # read each python file and search for the pattern of the key
-            # if it's find change status of the counter and exit the search
-            for f in py_files:
-                tmp = f.read_text()
-                if f"{name}.{k}" in tmp:
-                    is_present = True
-                    break
+        return sorted(keys - used_keys)
 
-            # if nothing is find, the value is still False and the key can be
-            # added to the list
-            is_present or unused_keys.append(k)
+    @classmethod
+    def _flat_keys(cls, d: dict, prefix: str = "") -> Set[str]:
+        """Get the dotted names of all the leaf keys of a nested dictionary.
+
+        Args:
+            d: the dictionary to flatten
+            prefix: the dotted name of the dictionary itself
+
+        Returns:
+            the dotted keys e.g. {"a.b.c", "a.d"}
+        """
+        keys = set()
+        for k, v in d.items():
+            key = f"{prefix}{k}"
+            if isinstance(v, dict):
+                keys |= cls._flat_keys(v, f"{key}.")
+            else:
+                keys.add(key)
 
-        return unused_keys
+        return keys
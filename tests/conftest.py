@@ -1,7 +1,10 @@
 """The configuration of the pytest run."""
 
+import atexit
 import json
 import os
+import shutil
+import tempfile
 import uuid
 from itertools import product
 from pathlib import Path
@@ -15,10 +18,18 @@ import pandas as pd
 import pytest
 from shapely import geometry as sg
 
-import pysepal.sepalwidgets as sw
-from pysepal.scripts import gee
-from pysepal.scripts import utils as su
-from pysepal.scripts.gee_interface import GEEInterface
+from pysepal.translator import translator as translator_module
+
+# the messages of the lib are compiled as soon as pysepal.message is imported
+# so the cache is redirected before importing any widget
+_cache_dir = Path(tempfile.mkdtemp(prefix="pysepal-cache-"))
+atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+translator_module.CACHE_DIR = _cache_dir
+
+import pysepal.sepalwidgets as sw  # noqa: E402
+from pysepal.scripts import gee  # noqa: E402
+from pysepal.scripts import utils as su  # noqa: E402
+from pysepal.scripts.gee_interface import GEEInterface  # noqa: E402
 
 try:
     su.init_ee()
@@ -52,6 +63,26 @@ def alert(_alert: sw.Alert) -> sw.Alert:
     return _alert.reset()
 
 
+# -- keep the compiled translation bundles out of the user cache ---------------
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write the compiled bundles in a temporary folder instead of the user cache.
+
+    Args:
+        tmp_path: the temporary folder of the test
+        monkeypatch: the pytest monkeypatch fixture
+
+    Returns:
+        the folder where the bundles are written
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(translator_module, "CACHE_DIR", cache_dir)
+
+    return cache_dir
+
+
 # -- SEPAL related parameters --------------------------------------------------
 
 
@@ -1,13 +1,21 @@
 """Test AoiModel custom model."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List
 
 import ee
+import geopandas as gpd
+import pandas as pd
 import pytest
+import shapely
 from traitlets import Dict, Unicode
 
 from pysepal import aoi
+from pysepal import mapping as sm
+from pysepal.message import ms
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
 
 
 def test_init_no_ee(fake_vector: Path) -> None:
@@ -275,12 +283,13 @@ def test_from_admin(gee_dir: Path) -> None:
 
 
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
-def test_from_point(fake_points: Path, gee_dir: Path) -> None:
+def test_from_point(fake_points: Path, gee_dir: Path, tmp_path: Path) -> None:
     """Get an AoiModel from point file.
 
     Args:
         gee_dir: the path to the session gee_dir folder (including hash)
         fake_points: the path to the point file
+        tmp_path: a temporary directory
     """
     aoi_model = aoi.AoiModel(folder=gee_dir, gee=False)
 
@@ -301,6 +310,13 @@ def test_from_point(fake_points: Path, gee_dir: Path) -> None:
     # file csv fake name is named: fake_point
     assert aoi_model.name == "fake_point"
 
+    # the points without coordinates are dropped
+    empty_file = tmp_path / "empty_point.csv"
+    empty_file.write_text("id,lat,lon\n1,,\n")
+    points.update(pathname=empty_file)
+    with pytest.raises(Exception, match=ms.aoi_sel.exception.no_points):
+        aoi_model._from_points(points)
+
     return
 
 
@@ -336,6 +352,94 @@ def test_from_vector(gee_dir: Path, fake_vector: dict) -> None:
     return
 
 
+def test_from_vector_filtered(fake_vector: Path) -> None:
+    """Check that the filters are pushed down to the vector reader.
+
+    Args:
+        fake_vector: the path to a vector file
+    """
+    aoi_model = aoi.AoiModel(gee=False)
+
+    # the where clause is escaped
+    assert aoi_model._where_clause("GID_0", "VAT") == "\"GID_0\" = 'VAT'"
+    assert aoi_model._where_clause("name", "l'aquila") == "\"name\" = 'l''aquila'"
+    assert aoi_model._where_clause("code", 12) == '"code" = 12'
+
+    # filter and project the columns
+    vector = {"pathname": fake_vector, "column": "GID_0", "value": "VAT", "columns": ["GID_0"]}
+    aoi_model._from_vector(vector)
+    assert aoi_model.name == "gadm41_VAT_0_GID_0_VAT"
+    assert aoi_model.gdf.columns.to_list() == ["GID_0", "geometry"]
+    assert len(aoi_model.gdf) == 1
+
+    # no feature matching the value or the bbox
+    vector = {"pathname": fake_vector, "column": "GID_0", "value": "FRA"}
+    assert len(aoi_model._from_vector(vector).gdf) == 0
+    vector = {"pathname": fake_vector, "column": "ALL", "value": None, "bbox": [0, 0, 1, 1]}
+    assert len(aoi_model._from_vector(vector).gdf) == 0
+
+    return
+
+
+def test_batch(tmp_path: Path) -> None:
+    """Split a vector file into one aoi per feature.
+
+    Args:
+        tmp_path: the test temporary directory
+    """
+    # create a file with 3 squares
+    boxes = [shapely.box(i, 0, i + 1, 1) for i in range(3)]
+    gdf = gpd.GeoDataFrame({"code": ["a", "b", "c"]}, geometry=boxes, crs="EPSG:4326")
+    vector = tmp_path / "squares.gpkg"
+    gdf.to_file(vector)
+
+    aoi_model = aoi.AoiModel(gee=False)
+
+    with pytest.raises(ValueError):
+        aoi_model.batch()
+
+    # the aois are yielded lazily
+    aois = aoi_model.batch(vector, column="code")
+    first = next(aois)
+    assert first.name == "squares_code_a"
+    assert first.method == "SHAPE"
+    assert len(first.gdf) == 1
+    assert first.total_bounds() == [0, 0, 1, 1]
+
+    names = [a.name for a in aois]
+    assert names == ["squares_code_b", "squares_code_c"]
+
+    # the index is used if no column is set
+    assert [a.name for a in aoi_model.batch(vector)][-1] == "squares_2"
+
+    # the precomputed bounds are cleared with the outputs
+    first.clear_output()
+    assert first._bounds is None
+
+    return
+
+
+def test_batch_names(tmp_path: Path) -> None:
+    """Give unique names to the aois of a batch.
+
+    Args:
+        tmp_path: the test temporary directory
+    """
+    boxes = [shapely.box(i, 0, i + 1, 1) for i in range(3)]
+    gdf = gpd.GeoDataFrame({"code": ["a", "a", "b"]}, geometry=boxes, crs="EPSG:4326")
+    vector = tmp_path / "squares.gpkg"
+    gdf.to_file(vector)
+
+    aoi_model = aoi.AoiModel(gee=False)
+    names = [a.name for a in aoi_model.batch(vector, column="code")]
+    assert names == ["squares_code_a_1", "squares_code_a_2", "squares_code_b"]
+
+    # the GAUL codes returned by EE can be floats
+    assert aoi_model._gaul_code(1001.0) == aoi_model._gaul_code("1001") == "1001"
+
+    return
+
+
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
 def test_from_vector_gee(gee_dir: Path, fake_vector: dict) -> None:
     """Get an AoiModel from a vector and using GEE.
@@ -364,6 +468,164 @@ def test_from_vector_gee(gee_dir: Path, fake_vector: dict) -> None:
     assert aoi_model.gdf is not None
 
 
+def test_simplify(fake_vector: Path) -> None:
+    """Check the simplification of the geometries sent to GEE.
+
+    Args:
+        fake_vector: the path to a vector file
+    """
+    aoi_model = aoi.AoiModel(vector=fake_vector, gee=False, scale=100)
+    simplified = aoi_model._simplify(aoi_model.gdf)
+
+    # the shape is lighter but still valid and covering the same area
+    src_vertices = shapely.get_num_coordinates(aoi_model.gdf.geometry.values).sum()
+    dst_vertices = shapely.get_num_coordinates(simplified.geometry.values).sum()
+    assert dst_vertices < src_vertices
+    assert simplified.is_valid.all()
+    assert simplified.columns.to_list() == aoi_model.gdf.columns.to_list()
+
+    # the simplification is disabled by default
+    assert aoi.AoiModel(gee=False).scale is None
+    aoi_model.scale = None
+    assert aoi_model._simplify(aoi_model.gdf) is aoi_model.gdf
+
+    return
+
+
+def test_geometry_hash(fake_vector: Path) -> None:
+    """Check that the geometry hash only depends on the shape.
+
+    Args:
+        fake_vector: the path to a vector file
+    """
+    aoi_model = aoi.AoiModel(vector=fake_vector, gee=False)
+    aoi_hash = aoi_model.geometry_hash()
+
+    # the name and the feature order don't change the hash
+    other_model = aoi.AoiModel(vector=fake_vector, gee=False)
+    other_model.name = "other_name"
+    other_model.gdf = other_model.gdf.iloc[::-1]
+    assert other_model.geometry_hash() == aoi_hash
+
+    # a different shape or scale changes the hash
+    other_model.gdf = other_model.gdf.set_geometry(other_model.gdf.buffer(0.001))
+    assert other_model.geometry_hash() != aoi_hash
+    aoi_model.scale = 10
+    assert aoi_model.geometry_hash() != aoi_hash
+
+    # the hash tells if an existing asset can be reused
+    assert aoi_model._is_reusable({"properties": {"aoi_hash": aoi_hash}}, aoi_hash) is True
+    assert aoi_model._is_reusable({"properties": {"aoi_hash": "other"}}, aoi_hash) is False
+    assert aoi_model._is_reusable({"properties": {}}, aoi_hash) is False
+    assert aoi_model._is_reusable(None, aoi_hash) is False
+
+    return
+
+
+def test_export_to_asset(fake_vector: Path) -> None:
+    """Check that the exported assets are found from the geometry hash.
+
+    Args:
+        fake_vector: the path to a vector file
+    """
+    session = FakeEESession(project="toto")
+    folder = "projects/toto/assets/aoi"
+
+    # bind a local model to a fake session, the fake export doesn't read the collection
+    aoi_model = aoi.AoiModel(vector=fake_vector, gee=False)
+    aoi_model.gee_interface = GEEInterface(session=session)
+    aoi_model.folder = folder
+    aoi_model.feature_collection = SimpleNamespace(set=lambda *args: "fc")
+    aoi_hash = aoi_model.geometry_hash()
+
+    # the first export creates an asset named after the hash
+    asset_id = f"{folder}/aoi_{aoi_model.name}_{aoi_hash[: aoi.AoiModel.HASH_LENGTH]}"
+    aoi_model.export_to_asset()
+    assert aoi_model.dst_asset_id == asset_id
+    assert len(session.task_list) == 1
+
+    # the same geometry under another name reuses it
+    aoi_model.name = "other_name"
+    aoi_model.export_to_asset()
+    assert aoi_model.dst_asset_id == asset_id
+    assert len(session.task_list) == 1
+
+    # an asset without hash is not reused
+    session.assets.clear()
+    session._add_asset(f"{folder}/aoi_other_name", "TABLE")
+    aoi_model.export_to_asset()
+    assert aoi_model.dst_asset_id != f"{folder}/aoi_other_name"
+    assert len(session.task_list) == 2
+
+    # it is if it stores the same hash
+    session.assets.clear()
+    session._add_asset(f"{folder}/aoi_other_name", "TABLE")["properties"] = {"aoi_hash": aoi_hash}
+    aoi_model.export_to_asset()
+    assert aoi_model.dst_asset_id == f"{folder}/aoi_other_name"
+    assert len(session.task_list) == 2
+
+    return
+
+
+def test_get_ipygeojson(fake_vector: Path) -> None:
+    """Build the ipyleaflet layer of a local aoi.
+
+    Args:
+        fake_vector: the path to a vector file
+    """
+    aoi_model = aoi.AoiModel(vector=fake_vector, gee=False)
+    layer = aoi_model.get_ipygeojson()
+
+    # the name is added to every feature
+    assert layer.name == "aoi"
+    assert len(layer.data["features"]) == len(aoi_model.gdf)
+    assert all(f["properties"]["name"] == aoi_model.name for f in layer.data["features"])
+
+    # the default style is a copy that can be safely modified
+    layer.style["color"] = "red"
+    assert aoi_model.get_ipygeojson().style["color"] != "red"
+
+    # coordinates can be rounded
+    layer = aoi_model.get_ipygeojson(precision=2)
+    geom = shapely.geometry.shape(layer.data["features"][0]["geometry"])
+    coords = shapely.get_coordinates(geom)
+    assert (coords == coords.round(2)).all()
+
+    # the dates are serialized without modifying the source dataframe
+    gdf = aoi_model.gdf.assign(date=pd.Timestamp("2024-01-01"))
+    data = sm.gdf_to_geojson(gdf)
+    assert data["features"][0]["properties"]["date"] == "2024-01-01T00:00:00"
+    assert gdf["date"].dtype.kind == "M"
+
+    return
+
+
+@pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
+def test_get_gdf(test_model: aoi.AoiModel) -> None:
+    """Download the aoi at display resolution.
+
+    Args:
+        test_model: a aoi_model set on vatican city
+    """
+    # simplified geometries are cached without loading the full resolution
+    gdf = test_model.get_gdf(zoom=5)
+    assert test_model._gdf is None
+    assert test_model.get_gdf(zoom=5) is gdf
+    assert test_model.get_ipygeojson(zoom=5).data["features"][0]["properties"]["ISO"] == "VAT"
+
+    # the full resolution is only downloaded when requested
+    full = test_model.get_gdf()
+    assert test_model._gdf is full
+    n_vertices = shapely.get_num_coordinates(full.geometry.values).sum()
+    assert shapely.get_num_coordinates(gdf.geometry.values).sum() <= n_vertices
+
+    # the cache is cleared with the outputs
+    test_model.clear_output()
+    assert test_model._display_gdfs == {}
+
+    return
+
+
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
 def test_from_geo_json(gee_dir, square: dict) -> None:
     """Get an AoiModel from a geojson (equivalent to draw).
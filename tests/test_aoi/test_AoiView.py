@@ -1,5 +1,7 @@
 """Test the AoiView widget."""
 
+import threading
+import time
 from pathlib import Path
 
 import ee
@@ -8,6 +10,7 @@ import pytest
 from pysepal import aoi
 from pysepal.mapping import SepalMap
 from pysepal.message import ms
+from pysepal.scripts.gee_task import GEETask
 
 
 def test_init() -> None:
@@ -152,6 +155,73 @@ def test_update_gee_aoi(aoi_gee_view: aoi.AoiView) -> None:
     assert len(aoi_gee_view.map_.layers) == 3
 
 
+@pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
+def test_update_gee_aoi_async(aoi_gee_view: aoi.AoiView) -> None:
+    """Update a view on vatican with GEE in the background.
+
+    Args:
+        aoi_gee_view: an object with gee binding
+    """
+    # select Vatican
+    item = next(i for i in aoi_gee_view.w_admin_0.items if i["text"] == "Holy See")
+    aoi_gee_view.w_method.v_model = "ADMIN0"
+    aoi_gee_view.w_admin_0.v_model = item["value"]
+
+    # click twice, the first update is cancelled and the second one releases the button
+    aoi_gee_view._on_click(None, None, None)
+    first_task = aoi_gee_view._task
+    aoi_gee_view._on_click(None, None, None)
+    assert aoi_gee_view._task is not first_task
+    wait_task(aoi_gee_view._task)
+
+    # perform checks
+    assert first_task.is_cancelled
+    assert aoi_gee_view._task.is_finished
+    assert aoi_gee_view.btn.loading is False
+    assert aoi_gee_view.updated == 1
+    assert aoi_gee_view.model.name == "VAT"
+    assert len(aoi_gee_view.map_.layers) == 3
+
+    # changing the method cancels a running update
+    aoi_gee_view._on_click(None, None, None)
+    assert aoi_gee_view.btn.loading is True
+    aoi_gee_view.w_method.v_model = "ADMIN1"
+    assert aoi_gee_view.btn.loading is False
+
+    return
+
+
+def test_set_object(aoi_local_view: aoi.AoiView, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that the model updates of the background tasks never overlap.
+
+    Args:
+        aoi_local_view: an object without gee binding
+        monkeypatch: the pytest monkeypatch fixture
+    """
+    running, overlaps = [], []
+
+    def set_object() -> None:
+        overlaps.append(len(running))
+        running.append(1)
+        time.sleep(0.05)
+        running.pop()
+
+    monkeypatch.setattr(aoi_local_view.model, "set_object", set_object)
+
+    # a cancelled update keeps running in its thread while the next one starts
+    geo_json = {"type": "FeatureCollection", "features": []}
+    threads = [
+        threading.Thread(target=aoi_local_view._set_object, args=(geo_json,)) for _ in range(3)
+    ]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+
+    assert overlaps == [0, 0, 0]
+    assert aoi_local_view.model.geo_json == geo_json
+
+    return
+
+
 def test_update_local_aoi(aoi_local_view: aoi.AoiView) -> None:
     """Update an aoi on vatican city without gee.
 
@@ -199,6 +269,20 @@ def test_reset(aoi_local_view: aoi.AoiView) -> None:
     return
 
 
+def wait_task(task: GEETask, timeout: float = 120) -> None:
+    """Wait for a background task to be over.
+
+    Args:
+        task: the running task
+        timeout: the maximum waiting time in seconds
+    """
+    start = time.time()
+    while task.is_running and time.time() - start < timeout:
+        time.sleep(0.1)
+
+    return
+
+
 @pytest.fixture(scope="function")
 def aoi_gee_view(gee_dir: Path) -> aoi.AoiView:
     """Create an AoiView based on GEE with a silent sepalMap.
@@ -0,0 +1,63 @@
+"""Test that the heavy dependencies are only imported when they are used."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+HEAVY_MODULES = ["matplotlib", "localtileserver", "rasterio", "pygadm", "pygaul", "pyogrio"]
+"The libraries that should not be imported before the corresponding features are used"
+
+
+def loaded_modules(statement: str) -> dict:
+    """Run an import statement in a fresh interpreter.
+
+    Args:
+        statement: the python import statement to run
+
+    Returns:
+        whether each heavy module and the styles are loaded
+    """
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"names = {HEAVY_MODULES + ['pysepal.frontend.styles']}\n"
+        "print(json.dumps({n: n in sys.modules for n in names}))"
+    )
+
+    # use a temporary home so that the messages are not compiled in the user cache
+    with tempfile.TemporaryDirectory() as home:
+        env = {**os.environ, "HOME": home}
+        cmd = [sys.executable, "-c", code]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env)
+
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_pysepal() -> None:
+    """Check that the root package doesn't load the styles."""
+    loaded = loaded_modules("import pysepal")
+    assert not any(loaded.values())
+
+    # the colors are still available and load the styles on first access
+    loaded = loaded_modules("from pysepal import color")
+    assert loaded["pysepal.frontend.styles"] is True
+
+    return
+
+
+@pytest.mark.parametrize("package", ["mapping", "aoi", "sepalwidgets"])
+def test_import_packages(package: str) -> None:
+    """Check that the sub-packages don't import the heavy libraries.
+
+    Args:
+        package: the name of the sub-package
+    """
+    loaded = loaded_modules(f"from pysepal import {package}")
+    heavy = [m for m in HEAVY_MODULES if loaded[m]]
+    assert heavy == []
+
+    return
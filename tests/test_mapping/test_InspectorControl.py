@@ -6,6 +6,7 @@ from pathlib import Path
 import ee
 import geopandas as gpd
 import pytest
+from ipyleaflet import GeoJSON
 
 from pysepal import mapping as sm
 
@@ -121,6 +122,44 @@ def test_from_geojson(adm0_vatican: dict) -> None:
     return
 
 
+def test_from_geojson_cache(adm0_vatican: dict) -> None:
+    """Check that the GeoDataFrame of a GeoJSON layer is cached until its data changes.
+
+    Args:
+        adm0_vatican: the geo_interface of the vatican
+    """
+    # create a map with a value inspector and a vector layer
+    m = sm.SepalMap()
+    inspector_control = sm.InspectorControl(m)
+    layer = GeoJSON(data=adm0_vatican, name="vatican")
+    m.add_layer(layer)
+
+    # the dataframe is built on first click and reused afterward
+    data = inspector_control._from_geojson(layer, [12.457, 41.902])
+    assert data == {"GID_0": "VAT", "COUNTRY": "VaticanCity"}
+    gdf = inspector_control._get_geojson_gdf(layer)
+    inspector_control._from_geojson(layer, [0, 0])
+    assert inspector_control._get_geojson_gdf(layer) is gdf
+
+    # changing the data invalidates the cache
+    layer.data = {"type": "FeatureCollection", "features": adm0_vatican["features"]}
+    assert layer.model_id not in inspector_control._geojson_cache
+    data = inspector_control._from_geojson(layer, [12.457, 41.902])
+    assert data == {"GID_0": "VAT", "COUNTRY": "VaticanCity"}
+
+    # removing the layer prune the cache on next click
+    m.remove_layer(layer)
+    inspector_control.menu.v_model = True
+    inspector_control.read_data(type="click", coordinates=[0, 0])
+    assert inspector_control._geojson_cache == {}
+
+    # the removed layer is not observed anymore
+    observers = layer._trait_notifiers.get("data", {}).get("change", [])
+    assert inspector_control._clear_geojson_cache not in observers
+
+    return
+
+
 def test_from_raster(rgb: Path) -> None:
     """Check the result of clicking on a raster.
 
@@ -2,6 +2,7 @@
 
 import ee
 import pytest
+from ipyleaflet import GeoJSON
 
 from pysepal import aoi
 from pysepal import mapping as sm
@@ -190,3 +191,36 @@ def test_vectors() -> None:
     assert vector_row.w_checkbox.v_model is True
 
     return
+
+
+def test_incremental_update() -> None:
+    """Check that existing rows are reused and removed rows are unlinked and closed."""
+    m = sm.SepalMap()
+    layer_control = next(c for c in m.controls if isinstance(c, sm.LayersControl))
+    base_row = layer_control.tile.get_children(klass=sm.BaseRow)[0]
+
+    # add 2 vector layers, the basemap row is kept
+    m.add_layer(GeoJSON(data={"type": "FeatureCollection", "features": []}, name="first"))
+    first_row = layer_control.tile.get_children(klass=sm.VectorRow)[0]
+    m.add_layer(GeoJSON(data={"type": "FeatureCollection", "features": []}, name="second"))
+    vector_rows = layer_control.tile.get_children(klass=sm.VectorRow)
+    assert len(vector_rows) == 2
+    assert vector_rows[1] is first_row
+    assert layer_control.tile.get_children(klass=sm.BaseRow)[0] is base_row
+
+    # reorder the layers
+    first, second = m.find_layer("first"), m.find_layer("second")
+    m.layers = (*(lyr for lyr in m.layers if lyr not in [first, second]), second, first)
+    vector_rows = layer_control.tile.get_children(klass=sm.VectorRow)
+    assert vector_rows[0] is first_row
+
+    # remove a layer and check that the row is not linked anymore
+    m.remove_layer("first")
+    assert len(layer_control.tile.get_children(klass=sm.VectorRow)) == 1
+    assert first_row.links == []
+    first.visible = False
+    assert first_row.w_checkbox.v_model is True
+    assert first_row.comm is None
+    assert first_row.w_checkbox.comm is None
+
+    return
@@ -0,0 +1,104 @@
+"""Test the RasterRegistry object."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from pysepal import mapping as sm
+
+
+def test_info(byte: Path) -> None:
+    """Check the metadata extracted from a raster.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    registry = sm.RasterRegistry()
+    info = registry.info(byte)
+
+    assert info.count == 1
+    assert info.dtype == "uint8"
+    assert info.crs == "EPSG:26711"
+    center = [(info.bounds[1] + info.bounds[3]) / 2, (info.bounds[0] + info.bounds[2]) / 2]
+    expected = [33.89703655465772, -117.63458938969723]
+    assert all([math.isclose(s, t, rel_tol=0.01) for s, t in zip(center, expected)])
+
+    # the file is not kept open if no layer uses it
+    assert byte not in registry
+
+    return
+
+
+def test_acquire_release(byte: Path) -> None:
+    """Check that the file is opened once and closed with the last layer.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    registry = sm.RasterRegistry()
+
+    info = registry.acquire(byte)
+    assert registry.acquire(str(byte)) is info
+    assert byte in registry
+
+    registry.release(byte)
+    assert byte in registry
+
+    registry.release(byte)
+    assert byte not in registry
+
+    # releasing an unknown file is a no-op
+    registry.release(byte)
+
+    return
+
+
+def test_warped(rgb: Path) -> None:
+    """Check the EPSG:4326 view of a projected raster.
+
+    Args:
+        rgb: the path to a rgb image (3 bands)
+    """
+    registry = sm.RasterRegistry()
+
+    # the image needs to be acquired by a layer first
+    with pytest.raises(ValueError):
+        registry.warped(rgb)
+
+    registry.acquire(rgb)
+    src = registry.warped(rgb)
+
+    assert src.crs.to_epsg() == 4326
+    assert registry.warped(rgb) is src
+
+    registry.close()
+    assert rgb not in registry
+
+    return
+
+
+def test_stretch(byte: Path) -> None:
+    """Check the approximated percentiles of a band.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    registry = sm.RasterRegistry()
+
+    vmin, vmax = registry.stretch(byte)
+    assert 0 <= vmin < vmax <= 255
+    assert byte not in registry
+
+    # full range percentiles are the min and max of the band
+    registry.acquire(byte)
+    full = registry.stretch(byte, percentiles=(0, 100))
+    data = registry.dataset(byte).read(1, masked=True)
+    assert full == (float(data.min()), float(data.max()))
+
+    # results are cached per file
+    assert registry.stretch(byte) is registry.stretch(byte)
+
+    registry.close()
+
+    return
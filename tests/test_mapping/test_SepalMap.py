@@ -15,6 +15,8 @@ from pysepal import mapping as sm
 from pysepal.frontend import styles as ss
 from pysepal.frontend.styles import get_theme
 from pysepal.mapping.legend_control import LegendControl
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
 
 # create a seed so that we can check values
 random.seed(42)
@@ -155,6 +157,33 @@ def test_add_raster(rgb: Path, byte: Path) -> None:
     assert layer.name == "byte"
     assert layer.key == "byte"
 
+    # the files stay open in the registry until the layers are removed
+    assert rgb in m.raster_registry
+    m.remove_layer("rgb")
+    assert rgb not in m.raster_registry
+    assert byte in m.raster_registry
+
+    return
+
+
+def test_add_raster_stretch(byte: Path) -> None:
+    """Add a stretched raster file and its colorbar to the map.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    m = sm.SepalMap()
+
+    layer = m.add_raster(byte, layer_name="byte", stretch=True)
+    assert layer.stretch == m.raster_registry.stretch(byte)
+
+    layer = m.add_raster(byte, layer_name="byte_full", stretch=(0, 100))
+    assert layer.stretch == m.raster_registry.stretch(byte, percentiles=(0, 100))
+
+    # the colorbar use the stretch of the layer
+    m.add_colorbar(colors=["#fc8d59", "#ffffbf", "#91bfdb"], layer_name="byte")
+    assert len(m.controls) == 5
+
     return
 
 
@@ -543,6 +572,20 @@ def test_add_legend(ee_map_with_layers: sm.SepalMap) -> None:
     return
 
 
+@pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
+def test_add_ee_layer_round_trips() -> None:
+    """Check the number of requests sent to EE to display an image."""
+    # an image without visualization properties
+    session = FakeEESession(responses={"get_info": 0})
+    m = sm.SepalMap(gee_interface=GEEInterface(session=session))
+    m.add_ee_layer(ee.Image(1), {"min": 0, "max": 1}, "ones")
+
+    assert session.call_count() <= 2
+    assert m.find_layer("ones").url.startswith("http://localhost/")
+
+    return
+
+
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
 def test_add_ee_layer_autocenter_sync() -> None:
     """Test that autocenter calls zoom_bounds with expected bbox in sync add_ee_layer."""
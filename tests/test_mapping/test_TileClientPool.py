@@ -0,0 +1,77 @@
+"""Test the TileClientPool object."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pysepal import mapping as sm
+
+
+def test_acquire_release(byte: Path, rgb: Path) -> None:
+    """Check that clients are shared and kept warm once released.
+
+    Args:
+        byte: the path to a byte image (1 band)
+        rgb: the path to a rgb image (3 bands)
+    """
+    pool = sm.TileClientPool(max_idle=1)
+
+    # the same client is shared between users
+    client = pool.acquire(byte)
+    assert pool.acquire(str(byte)) is client
+    pool.release(byte)
+    assert byte in pool
+
+    # released clients are reused
+    pool.release(byte)
+    assert byte not in pool
+    assert pool.acquire(byte) is client
+    pool.release(byte)
+
+    # the least recently used idle client is evicted
+    pool.acquire(rgb)
+    pool.release(rgb)
+    assert pool.acquire(byte) is not client
+
+    pool.release(byte)
+    pool.clear()
+
+    return
+
+
+def test_threads(byte: Path) -> None:
+    """Check that sessions served from several threads share a single client.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    pool = sm.TileClientPool()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(pool.acquire, [byte] * 16))
+    assert all(c is clients[0] for c in clients)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(pool.release, [byte] * 16))
+    assert byte not in pool
+
+    pool.clear()
+
+    return
+
+
+def test_shared_between_maps(byte: Path) -> None:
+    """Check that maps use the kernel pool.
+
+    Args:
+        byte: the path to a byte image (1 band)
+    """
+    m1, m2 = sm.SepalMap(), sm.SepalMap()
+    m1.add_raster(byte, layer_name="byte")
+    m2.add_raster(byte, layer_name="byte")
+
+    m1.remove_layer("byte")
+    assert byte in sm.tile_client_pool
+    m2.remove_layer("byte")
+    assert byte not in sm.tile_client_pool
+
+    return
@@ -0,0 +1,99 @@
+"""Test the offline stand-in of the Earth Engine session."""
+
+import time
+
+import ee
+import pytest
+
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
+
+
+def test_get_info() -> None:
+    """Answer and record the requests of the interface."""
+    session = FakeEESession()
+    gee_interface = GEEInterface(session=session)
+
+    # objects are returned as is by default
+    assert gee_interface.get_info(42) == 42
+    assert gee_interface.get_info_batch([1, 2, 3]) == [1, 2, 3]
+    assert session.call_count("get_info") == 4
+    assert session.call_counts() == {"get_info": 4}
+
+    # the map ids point to local tiles
+    map_id = gee_interface.get_map_id("image", {"min": 0})
+    assert map_id["tile_fetcher"].url_format.startswith("http://localhost/")
+    assert session.calls[-1].kwargs["vis_params"] == {"min": 0}
+
+    session.reset()
+    assert session.call_count() == 0
+
+    return
+
+
+def test_responses() -> None:
+    """Set the responses of the operations."""
+    session = FakeEESession(responses={"get_info": lambda ee_object, **kwargs: ee_object * 2})
+    gee_interface = GEEInterface(session=session)
+    assert gee_interface.get_info(21) == 42
+
+    # errors can be injected
+    session.responses["get_info"] = ee.EEException("Too many concurrent aggregations.")
+    with pytest.raises(ee.EEException):
+        gee_interface.get_info(21)
+
+    # failed requests are recorded as well
+    assert session.call_count("get_info") == 2
+
+    return
+
+
+def test_latency() -> None:
+    """Limit the number of concurrent requests."""
+    session = FakeEESession(latency=0.05, max_concurrent=2)
+    gee_interface = GEEInterface(session=session)
+
+    start = time.perf_counter()
+    assert gee_interface.get_info_batch(list(range(6))) == list(range(6))
+    duration = time.perf_counter() - start
+
+    # 6 requests processed 2 by 2
+    assert session.max_in_flight == 2
+    assert session.in_flight == 0
+    assert duration >= 3 * 0.05
+    assert all(c.duration >= 0.05 for c in session.calls)
+
+    # the latency can depend on the method
+    session = FakeEESession(latency=lambda method: 0.05 if method == "get_map_id" else 0)
+    gee_interface = GEEInterface(session=session)
+    gee_interface.get_info(1)
+    gee_interface.get_map_id("image")
+    assert session.calls[0].duration < session.calls[1].duration
+
+    return
+
+
+def test_assets() -> None:
+    """Store the assets and the tasks in memory."""
+    session = FakeEESession(project="toto", task_state="RUNNING")
+    gee_interface = GEEInterface(session=session)
+
+    folder = gee_interface.get_folder()
+    assert folder == "projects/toto/assets/"
+    assert gee_interface.run(gee_interface.get_folder_async()) == folder
+
+    # exports create the assets and the tasks
+    asset_id = folder + "aoi/vatican"
+    gee_interface.create_folder(folder + "aoi")
+    task = gee_interface.export_table_to_asset("fc", asset_id, description="vatican")
+    assert gee_interface.get_asset(asset_id)["type"] == "TABLE"
+    assert gee_interface.get_task(task["id"]) == task
+    assert gee_interface.is_running("vatican") is True
+    assert [a["id"] for a in gee_interface.get_assets(folder + "aoi")] == [asset_id]
+
+    # missing assets
+    assert gee_interface.get_asset(folder + "toto", not_exists_ok=True) is None
+    with pytest.raises(ee.EEException):
+        gee_interface.get_asset(folder + "toto")
+
+    return
@@ -0,0 +1,22 @@
+"""Test the cached lookups in the GADM attribute table."""
+
+from pysepal.scripts import gadm
+
+
+def test_get_items() -> None:
+    """Get the cached item lists of the admin selectors."""
+    items = gadm.get_items(0)
+    assert "VAT" in [i["value"] for i in items]
+
+    # the lists are cached but each caller gets its own list
+    assert gadm.get_items(0) == items
+    assert gadm.get_items(0) is not items
+    items[0]["text"] = "toto"
+    assert gadm.get_items(0)[0]["text"] != "toto"
+
+    # sub areas are filtered by parent
+    items = gadm.get_items(1, "ITA")
+    assert len(items) > 0
+    assert all(i["value"].startswith("ITA") for i in items)
+
+    return
@@ -0,0 +1,69 @@
+"""Test the cached lookups in the GAUL attribute table."""
+
+import pandas as pd
+import pytest
+
+from pysepal.scripts import gaul
+
+
+def test_get_admin() -> None:
+    """Find administrative areas from their codes."""
+    # GAUL 2024 code for Holy See
+    level, attributes = gaul.get_admin("307")
+    assert level == 0
+    assert attributes.gaul0_code == "307"
+
+    # sub areas are found at their level
+    code = gaul.admin_table(1).index[0]
+    level, attributes = gaul.get_admin(code, 1)
+    assert level == 1
+    assert attributes.gaul1_code == code
+
+    with pytest.raises(ValueError):
+        gaul.get_admin("toto")
+
+    # the areas without name are not indexed
+    assert gaul.admin_table(2).gaul2_name.notna().all()
+
+    return
+
+
+def test_get_admin_name() -> None:
+    """Build the names of administrative areas without calling EE."""
+    assert gaul.get_admin_name("307") == "VAT"
+
+    # the subdivision names are appended to the ISO code
+    code = gaul.admin_table(2).index[0]
+    name = gaul.get_admin_name(code, 2)
+    _, attributes = gaul.get_admin(code, 2)
+    assert name.startswith(gaul.get_iso(attributes))
+    assert len(name.split("_")) >= 3
+
+    # missing ISO codes fall back to the mapping
+    attributes = pd.Series({"iso3_code": float("nan"), "gaul0_code": "307"})
+    assert gaul.get_iso(attributes) == gaul.iso_mapping().get("307", "UNK")
+
+    # the mapping is read only once
+    assert gaul.iso_mapping() is gaul.iso_mapping()
+
+    return
+
+
+def test_get_items() -> None:
+    """Get the cached item lists of the admin selectors."""
+    items = gaul.get_items(0)
+    assert "307" in [i["value"] for i in items]
+
+    # the lists are cached but each caller gets its own list
+    assert gaul.get_items(0) == items
+    assert gaul.get_items(0) is not items
+    items[0]["text"] = "toto"
+    assert gaul.get_items(0)[0]["text"] != "toto"
+
+    # sub areas are filtered by parent
+    parent_code = gaul.admin_table(1).iloc[0].gaul0_code
+    items = gaul.get_items(1, parent_code)
+    codes = gaul.admin_table(1).query("gaul0_code == @parent_code").index
+    assert sorted(i["value"] for i in items) == sorted(codes)
+
+    return
@@ -1,12 +1,16 @@
 """Test the GEEInterface class."""
 
+import asyncio
+import time
 from pathlib import Path
 from typing import Optional
 
 import ee
 import pytest
 
+from pysepal.scripts.fake_session import FakeEESession
 from pysepal.scripts.gee_interface import GEEInterface
+from pysepal.scripts.gee_task import TaskState
 
 
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
@@ -427,3 +431,40 @@ def test_get_map_id_with_sepal(
     assert "tile_fetcher" in map_id or "mapid" in map_id
 
     return
+
+
+def test_task_restart() -> None:
+    """Restart a running task, the cancelled run must not alter the new one."""
+    gee_interface = GEEInterface(session=FakeEESession())
+    ends = []
+
+    async def wait(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    task = gee_interface.create_task(wait, on_finally=lambda: ends.append(task.state))
+
+    # cancel and restart right away
+    task.start(10)
+    task.cancel()
+    future = task.start(0.1)
+
+    # the new run is still running and can be cancelled
+    time.sleep(0.05)
+    assert task.is_running
+    assert task._future is future
+
+    future.result(timeout=5)
+    assert task.is_finished
+    assert task.result == 0.1
+    assert ends == [TaskState.FINISHED]
+
+    # the last run can still be cancelled
+    task.start(10)
+    time.sleep(0.05)
+    task.cancel()
+    time.sleep(0.05)
+    assert task.is_cancelled
+    assert ends == [TaskState.FINISHED, TaskState.CANCELLED]
+
+    return
@@ -0,0 +1,96 @@
+"""Test the instrumentation of the GEEInterface requests."""
+
+import ee
+import pytest
+
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
+from pysepal.scripts.gee_metrics import GEEMetrics
+
+
+def test_measure() -> None:
+    """Count the requests, their errors and their latency per method."""
+    session = FakeEESession(latency=0.01)
+    gee_interface = GEEInterface(session=session)
+
+    gee_interface.get_info(1)
+    gee_interface.get_info_batch([1, 2])
+    gee_interface.get_map_id("image")
+
+    session.responses["get_asset"] = ee.EEException("Asset not found.")
+    with pytest.raises(ee.EEException):
+        gee_interface.get_asset("toto")
+
+    methods = gee_interface.metrics.snapshot()["methods"]
+    assert methods["get_info"]["count"] == 3
+    assert methods["get_info"]["errors"] == 0
+    assert methods["get_info"]["mean_time"] >= 0.01
+    assert methods["get_map_id"]["count"] == 1
+    assert methods["get_asset"]["errors"] == 1
+    assert sum(methods["get_info"]["buckets"].values()) == 3
+
+    # the batch runs its requests concurrently
+    assert gee_interface.metrics.max_in_flight == 2
+    assert gee_interface.metrics.in_flight == 0
+
+    # nothing is measured by default
+    assert methods["get_info"]["payload_bytes"] == 0
+
+    # the folder of a session is known without any request
+    gee_interface.get_folder()
+    assert "get_folder" not in gee_interface.metrics.snapshot()["methods"]
+
+    gee_interface.metrics.reset()
+    assert gee_interface.metrics.snapshot()["methods"] == {}
+
+    return
+
+
+def test_trace() -> None:
+    """Gather the requests of an action sent from the sync methods."""
+    gee_interface = GEEInterface(session=FakeEESession())
+    metrics = gee_interface.metrics
+
+    with metrics.trace("inspector click") as trace:
+        gee_interface.get_info(1)
+        gee_interface.get_map_id("image")
+
+    # requests sent outside of the trace are not gathered
+    gee_interface.get_info(1)
+
+    assert trace.round_trips == 2
+    assert [c.method for c in trace.calls] == ["get_info", "get_map_id"]
+    assert trace.end is not None
+    assert list(metrics.traces) == [trace]
+
+    return
+
+
+def test_shared_metrics() -> None:
+    """Aggregate the requests of several interfaces and measure the responses."""
+    metrics = GEEMetrics(measure_payload=True)
+    interfaces = [GEEInterface(session=FakeEESession(), metrics=metrics) for _ in range(2)]
+
+    for gee_interface in interfaces:
+        gee_interface.get_info({"toto": "tutu"})
+
+    methods = metrics.snapshot()["methods"]
+    assert methods["get_info"]["count"] == 2
+    assert methods["get_info"]["payload_bytes"] == 2 * len('{"toto": "tutu"}')
+
+    return
+
+
+def test_to_prometheus() -> None:
+    """Export the metrics in the Prometheus text format."""
+    gee_interface = GEEInterface(session=FakeEESession())
+    gee_interface.get_info(1)
+
+    text = gee_interface.metrics.to_prometheus()
+    assert "# TYPE pysepal_gee_requests_total counter" in text
+    assert 'pysepal_gee_requests_total{method="get_info"} 1' in text
+    assert 'pysepal_gee_request_duration_seconds_bucket{method="get_info",le="+Inf"} 1' in text
+    assert "pysepal_gee_requests_in_flight 0" in text
+    assert "response_bytes_total" not in text
+
+    return
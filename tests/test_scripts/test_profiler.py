@@ -0,0 +1,107 @@
+"""Test the profiling of the decorated callbacks."""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from pysepal import sepalwidgets as sw
+from pysepal.scripts import decorator as sd
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
+from pysepal.scripts.profiler import Profiler, _env_enabled, profiler
+
+
+def test_profile(obj: object) -> None:
+    """Measure the decorated callbacks per function."""
+    obj.run()
+    obj.run()
+    with pytest.raises(ZeroDivisionError):
+        obj.fail()
+
+    stats = profiler.stats()
+    run = stats[name(obj.run)]
+    assert run["calls"] == 2
+    assert run["errors"] == 0
+    assert run["ee_calls"] == 4
+    assert run["trait_syncs"] >= 2
+    assert run["wall_time"] >= run["max_wall_time"] > 0
+    assert stats[name(obj.fail)]["errors"] == 1
+
+    # the nested catch_errors of loading_button is not measured twice
+    assert len(stats) == 2
+
+    # the report has a line per function
+    assert len(profiler.report().splitlines()) == 3
+
+    return
+
+
+def test_dump(obj: object, tmp_path: Path) -> None:
+    """Write the measures to a file."""
+    obj.run()
+
+    file = profiler.dump(tmp_path / "profile.json")
+    assert json.loads(file.read_text())[name(obj.run)]["calls"] == 1
+
+    profiler.reset()
+    assert profiler.stats() == {}
+
+    return
+
+
+def test_disabled() -> None:
+    """Measure nothing when the profiler is disabled."""
+    p = Profiler()
+    assert p.enabled is False
+
+    with p.profile("toto"):
+        pass
+
+    assert p.stats() == {}
+
+    return
+
+
+@pytest.mark.parametrize(
+    "value, enabled",
+    [("1", True), ("true", True), ("Yes", True), ("0", False), ("false", False), ("", False)],
+)
+def test_env_enabled(value: str, enabled: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only enable the profiler for explicit true values of the environment variable."""
+    monkeypatch.setenv("PYSEPAL_PROFILE", value)
+    assert _env_enabled("PYSEPAL_PROFILE") is enabled
+
+    return
+
+
+def name(method: Callable) -> str:
+    """Get the name under which a method is profiled."""
+    return f"{method.__module__}.{method.__qualname__}"
+
+
+@pytest.fixture
+def obj() -> object:
+    """Enable the profiler and create an object with decorated callbacks."""
+
+    class Obj:
+        def __init__(self) -> None:
+            self.alert = sw.Alert()
+            self.btn = sw.Btn()
+            self.field = sw.TextField()
+            self.gee_interface = GEEInterface(session=FakeEESession())
+
+        @sd.loading_button()
+        def run(self, *args) -> None:
+            self.gee_interface.get_info_batch([1, 2])
+            self.field.v_model = str(self.field.v_model) + "a"
+
+        @sd.switch("disabled", on_widgets=["field"])
+        def fail(self, *args) -> None:
+            return 1 / 0
+
+    profiler.enable()
+    yield Obj()
+    profiler.disable()
+    profiler.reset()
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import ee
 import geopandas as gpd
 import ipyvuetify as v
+import pandas as pd
 import pytest
 from shapely import geometry as sg
 
@@ -184,6 +185,24 @@ def test_to_colors() -> None:
     return
 
 
+def test_normalize_series() -> None:
+    """Check the vectorized normalization is equivalent to the str one."""
+    names = ["Côte d'Ivoire", "São Tomé", "plain name", "Ελλάδα"]
+    series = pd.Series(names, index=[3, 1, 2, 0])
+
+    for folder in [True, False]:
+        res = su.normalize_series(series, folder=folder)
+        assert res.tolist() == [su.normalize_str(n, folder=folder) for n in names]
+
+    # names are converted to sorted items
+    df = pd.DataFrame({"name": names, "code": [3, 1, 2, 0]})
+    items = su.names_to_items(df)
+    assert items[0] == {"text": "Cote d'Ivoire", "value": "3"}
+    assert [i["value"] for i in items] == ["3", "1", "2", "0"]
+
+    return
+
+
 def test_next_string() -> None:
     """Check string can be automatically indexed when equals."""
     # Arrange
@@ -301,6 +320,45 @@ def test_geojson_to_ee() -> None:
     return
 
 
+def test_read_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check the fast csv reading helpers.
+
+    Args:
+        tmp_path: a temporary directory
+        monkeypatch: the pytest patching fixture
+    """
+    # a semicolon separated file
+    csv_file = tmp_path / "points.csv"
+    csv_file.write_text("id;lat;lng;extra\n1;1.0;2.0;a\n2;3.0;4.0;b\n3;5.0;6.0;c\n")
+
+    assert su.sniff_csv_delimiter(csv_file) == ";"
+    assert su.read_csv_header(csv_file) == ["id", "lat", "lng", "extra"]
+
+    # small files are read at once
+    chunks = list(su.read_csv_chunks(csv_file, usecols=["id", "lat", "lng"]))
+    assert len(chunks) == 1
+    assert sorted(chunks[0].columns.tolist()) == ["id", "lat", "lng"]
+    assert chunks[0].lat.tolist() == [1.0, 3.0, 5.0]
+
+    # big files are read by chunks
+    monkeypatch.setattr(su, "CSV_CHUNK_THRESHOLD", 0)
+    monkeypatch.setattr(su, "CSV_CHUNKSIZE", 2)
+    chunks = list(su.read_csv_chunks(csv_file, usecols=["id"]))
+    assert [len(c) for c in chunks] == [2, 1]
+
+    # the spaces in the values are never used as delimiter
+    spaced = tmp_path / "spaced.csv"
+    spaced.write_text("id, name\n1, New York\n2, San Jose\n")
+    assert su.sniff_csv_delimiter(spaced) == ","
+
+    # fallback to a comma when the delimiter cannot be guessed
+    single = tmp_path / "single.csv"
+    single.write_text("id\n1\n")
+    assert su.sniff_csv_delimiter(single) == ","
+
+    return
+
+
 def test_check_input() -> None:
     """Test if an input is set or not."""
     with pytest.raises(ValueError, match="The value has not been initialized"):
@@ -1,11 +1,19 @@
 """Test VectorField widget."""
 
+import time
 from pathlib import Path
 
 import ee
 import pytest
 
 from pysepal import sepalwidgets as sw
+from pysepal.scripts.fake_session import FakeEESession
+from pysepal.scripts.gee_interface import GEEInterface
+from pysepal.sepalwidgets.inputs import (
+    _ASSET_COLUMNS_CACHE,
+    _ASSET_VALUES_CACHE,
+    _vector_values,
+)
 
 
 def test_init() -> None:
@@ -52,6 +60,7 @@ def test_update_file_gee(gee_dir: Path, data_regression, fake_asset: Path) -> No
     vector_field_gee = sw.VectorField(gee=True, folder=gee_dir)
 
     vector_field_gee._update_file({"new": str(fake_asset)})
+    wait_task(vector_field_gee, "columns")
 
     assert vector_field_gee.v_model["pathname"] == str(fake_asset)
     assert vector_field_gee.v_model["column"] == "ALL"
@@ -125,6 +134,67 @@ def test_update_column(fake_vector: Path) -> None:
     return
 
 
+def test_update_column_cache(fake_vector: Path) -> None:
+    """Check that the file is probed without reading all the features.
+
+    Args:
+        fake_vector: the path to a fake vector file
+    """
+    vector_field = sw.VectorField()
+    vector_field._update_file({"new": str(fake_vector)})
+
+    # only the schema is read
+    assert vector_field.df.empty
+    assert "GID_0" in vector_field.df.columns
+
+    # the values are read once per column
+    vector_field.w_column.v_model = "GID_0"
+    info = _vector_values.cache_info()
+    vector_field.w_column.v_model = "ALL"
+    vector_field.w_column.v_model = "GID_0"
+    assert _vector_values.cache_info().misses == info.misses
+    assert _vector_values.cache_info().hits == info.hits + 1
+    assert vector_field.w_value.items == ["VAT"]
+
+    return
+
+
+@pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
+def test_update_file_gee_cache(fake_asset: Path) -> None:
+    """Check that the columns and values of an asset are requested once.
+
+    Args:
+        fake_asset: the path to a fake vector asset
+    """
+    asset_id = str(fake_asset)
+    _ASSET_COLUMNS_CACHE.pop(asset_id, None)
+    _ASSET_VALUES_CACHE.pop((asset_id, "data", 1000), None)
+
+    session = FakeEESession(responses={"get_info": ["data", "system:index"]})
+    gee_interface = GEEInterface(session=session)
+    vector_field_gee = sw.VectorField(gee=True, gee_interface=gee_interface)
+
+    # select the same asset twice
+    for _ in range(2):
+        vector_field_gee._update_file({"new": asset_id})
+        wait_task(vector_field_gee, "columns")
+        assert "data" in vector_field_gee.w_column.items
+
+    assert session.call_count("get_info") == 1
+
+    # select the same column twice
+    session.responses["get_info"] = [0, 1]
+    for _ in range(2):
+        vector_field_gee.w_column.v_model = "data"
+        wait_task(vector_field_gee, "values")
+        assert vector_field_gee.w_value.items == [0, 1]
+        vector_field_gee.w_column.v_model = "ALL"
+
+    assert session.call_count("get_info") == 2
+
+    return
+
+
 @pytest.mark.skipif(not ee.data.is_initialized(), reason="GEE is not set")
 def test_update_column_gee(gee_dir: Path, fake_asset: Path) -> None:
     """Update a single column in a vector field in GEE context.
@@ -136,13 +206,23 @@ def test_update_column_gee(gee_dir: Path, fake_asset: Path) -> None:
     # change the value of the file
     vector_field_gee = sw.VectorField(gee=True, folder=gee_dir)
     vector_field_gee._update_file({"new": str(fake_asset)})
+    wait_task(vector_field_gee, "columns")
 
     # read a column
     vector_field_gee.w_column.v_model = "data"
+    wait_task(vector_field_gee, "values")
     assert vector_field_gee.v_model["column"] == "data"
     assert "d-none" not in vector_field_gee.w_value.class_
     assert vector_field_gee.w_value.items == [0, 1, 2, 3]
 
+    # too many values are not listed
+    vector_field_gee.max_values = 2
+    vector_field_gee.w_column.v_model = "ALL"
+    vector_field_gee.w_column.v_model = "data"
+    wait_task(vector_field_gee, "values")
+    assert vector_field_gee.w_value.items == []
+    assert len(vector_field_gee.w_value.error_messages) == 1
+
     return
 
 
@@ -176,11 +256,28 @@ def test_update_value_gee(gee_dir: Path, fake_asset: Path) -> None:
     # change the value of the file
     vector_field_gee = sw.VectorField(gee=True, folder=gee_dir)
     vector_field_gee._update_file({"new": str(fake_asset)})
+    wait_task(vector_field_gee, "columns")
 
     # read a column
     vector_field_gee.w_column.v_model = "data"
+    wait_task(vector_field_gee, "values")
     vector_field_gee.w_value.v_model = 1
 
     assert vector_field_gee.v_model["value"] == 1
 
     return
+
+
+def wait_task(vector_field: sw.VectorField, name: str, timeout: float = 60) -> None:
+    """Wait for a background task of the vector field to be over.
+
+    Args:
+        vector_field: the widget running the task
+        name: the name of the task
+        timeout: the maximum waiting time in seconds
+    """
+    start = time.time()
+    while vector_field._tasks[name].is_running and time.time() - start < timeout:
+        time.sleep(0.1)
+
+    return
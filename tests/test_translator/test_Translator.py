@@ -1,14 +1,17 @@
 """Test the Translator object."""
 
 import json
+import shutil
 from configparser import ConfigParser
 from pathlib import Path
 
 import pytest
 
+import pysepal
 from pysepal.conf import config_file
 from pysepal.message import ms
 from pysepal.translator import Translator
+from pysepal.translator import translator as translator_module
 
 
 def test_init(translation_folder: Path, tmp_config_file: Path) -> None:
@@ -50,6 +53,90 @@ def test_init(translation_folder: Path, tmp_config_file: Path) -> None:
     return
 
 
+def test_bundle(translation_folder: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that the compiled bundles are reused until the sources change.
+
+    Args:
+        translation_folder: the folder where the language keys are stored
+        tmp_path: a temporary folder for this test
+        monkeypatch: the pytest monkeypatch fixture
+    """
+    cache_dir = translator_module.CACHE_DIR
+    folder = tmp_path / "message"
+    shutil.copytree(translation_folder, folder)
+
+    # the first init compiles the bundle
+    translator = Translator(folder, "fr")
+    assert translator.test_key == "Clef de test"
+    assert len(list(cache_dir.glob("en_fr_*.json"))) == 1
+
+    # the second one reads it without merging the sources again
+    def fail(*args):
+        raise AssertionError("the sources should not be merged")
+
+    with monkeypatch.context() as m:
+        m.setattr(Translator, "merge_dict", staticmethod(fail))
+        translator = Translator(folder, "fr")
+        assert translator.test_key == "Clef de test"
+
+    # any change in the sources leads to a new bundle that replaces the stale one
+    (folder / "fr" / "locale.json").write_text(json.dumps({"test_key": "Nouvelle clef"}))
+    translator = Translator(folder, "fr")
+    assert translator.test_key == "Nouvelle clef"
+    assert len(list(cache_dir.glob("en_fr_*.json"))) == 1
+
+    # so does an upgrade of the package
+    bundle = Translator._bundle_file(folder, "en", "fr")
+    monkeypatch.setattr(pysepal, "__version__", "0.0.0")
+    assert Translator._bundle_file(folder, "en", "fr") != bundle
+    Translator(folder, "fr")
+    assert not bundle.exists()
+    assert len(list(cache_dir.glob("en_fr_*.json"))) == 1
+
+    # the bundles of other folders are kept
+    Translator(translation_folder, "fr")
+    assert len(list(cache_dir.glob("en_fr_*.json"))) == 2
+
+    return
+
+
+def test_lazy(translation_folder: Path) -> None:
+    """Check that the lazy translator boxes the namespaces on first access.
+
+    Args:
+        translation_folder: the folder where the language keys are stored
+    """
+    translator = Translator(translation_folder, "fr", lazy=True)
+    assert translator.test_key == "Clef de test"
+    assert translator._target == "fr"
+
+    # the namespaces are only boxed when they are used
+    translator = Translator(Path(ms._folder), "fr", lazy=True)
+    assert "widgets" in translator
+    assert "widgets" not in dict.keys(translator)
+    eager = Translator(Path(ms._folder), "fr")
+    assert translator.widgets.vector.too_many == eager.widgets.vector.too_many
+    assert "widgets" in dict.keys(translator)
+    assert "aoi_sel" not in dict.keys(translator)
+
+    # the fallback to the default language is kept
+    translator = Translator(Path(ms._folder), "it", lazy=True)
+    assert translator.aoi_sel.points == "Point file"
+
+    # listing the keys boxes everything
+    assert len(translator.keys()) == len(Translator(Path(ms._folder), "it"))
+    assert "aoi_sel" in dict.keys(translator)
+
+    # the lazy namespaces are part of every view of the translator
+    size = len(Translator(Path(ms._folder), "it", lazy=True))
+    assert len(list(Translator(Path(ms._folder), "it", lazy=True))) == size
+    assert len(dict(Translator(Path(ms._folder), "it", lazy=True))) == size
+    assert len(Translator(Path(ms._folder), "it", lazy=True).to_dict()) == size
+    assert len(json.loads(json.dumps(Translator(Path(ms._folder), "it", lazy=True)))) == size
+
+    return
+
+
 def test_search_key() -> None:
     """Check that a key can be searched in the bbuild messages."""
     # assert that having a wrong key  at root level
@@ -159,6 +246,30 @@ def test_key_use() -> None:
     return
 
 
+def test_key_use_references(translation_folder: Path, tmp_path: Path) -> None:
+    """Check that the references are found in python files and notebooks.
+
+    Args:
+        translation_folder: the folder where the language keys are stored
+        tmp_path: a temporary folder for this test
+    """
+    translator = Translator(translation_folder, "en")
+    (tmp_path / "app.py").write_text("print(cm.a_key)\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "app.py").write_text("print(cm.test_key)\n")
+
+    assert translator.key_use(tmp_path, "cm") == ["test_key"]
+
+    cell = {"cells": [{"source": ["cm.test_key.upper()"]}]}
+    (tmp_path / "ui.ipynb").write_text(json.dumps(cell))
+    assert translator.key_use(tmp_path, "cm") == []
+
+    # other translators are ignored
+    assert translator.key_use(tmp_path, "ms") == ["a_key", "test_key"]
+
+    return
+
+
 @pytest.fixture(scope="module")
 def translation_folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Generate a fully qualified translation folder with limited keys in en, fr and es."""